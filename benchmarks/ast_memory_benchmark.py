@@ -0,0 +1,55 @@
+# Memoria del AST de ASTNode frente al ASTArena compacto, medida con tracemalloc,
+# y tiempo de análisis semántico y generación de VCI sobre cada representación.
+# Uso: python -m benchmarks.ast_memory_benchmark
+import time
+import tracemalloc
+
+from core.lexer.lexer import Lexer
+from core.parser.parser import Parser
+from core.semantic.semantic_analyzer import SemanticAnalyzer
+from core.codegen.vci_generator import VCIGenerator
+from models.ast_arena import ASTArena
+from benchmarks.sources import generate_sized
+
+
+def measure(build):
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def backend(ast, arena):
+    analyzer, generator = SemanticAnalyzer(), VCIGenerator()
+    start = time.perf_counter()
+    if arena:
+        analyzer.analyze_arena(ast)
+        generator.generate_arena(ast)
+    else:
+        analyzer.analyze(ast)
+        generator.generate(ast)
+    return time.perf_counter() - start, generator.instructions
+
+
+def main():
+    for megabytes in (1, 4):
+        source = generate_sized(megabytes * 1_000_000)
+        lexer = Lexer()
+        lexer.analyze(source)
+        tokens = lexer.tokens
+
+        root, tree_bytes = measure(lambda: Parser(tokens).parse())
+        arena, arena_bytes = measure(lambda: ASTArena.from_node(root))
+        print(f"{megabytes} MB fuente ({len(source):,} bytes), {len(arena):,} nodos en el arena")
+        print(f"  ASTNode   {tree_bytes / 1e6:8.1f} MB")
+        print(f"  ASTArena  {arena_bytes / 1e6:8.1f} MB  ({tree_bytes / arena_bytes:.1f}x menos)")
+
+        tree_time, tree_code = backend(root, False)
+        arena_time, arena_code = backend(arena, True)
+        print(f"  semántico + VCI: ASTNode {tree_time:.2f}s, ASTArena {arena_time:.2f}s,"
+              f" mismo VCI: {'sí' if tree_code == arena_code else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
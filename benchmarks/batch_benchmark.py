@@ -0,0 +1,54 @@
+# input/factorial.txt sobre miles de filas de entrada (un n distinto por fila): un
+# VCIExecutor por fila, con la entrada redirigida, frente a BatchExecutor con todas las
+# filas a la vez. Comprueba que cada fila termina con las mismas variables y salida.
+# Uso: python -m benchmarks.batch_benchmark
+import contextlib
+import io
+import random
+import sys
+import time
+
+from core import pipeline
+from core.codegen.vci_batch import BatchExecutor
+from core.codegen.vci_executor import VCIExecutor
+
+
+def run_rows(program, rows):
+    results = []
+    stdin = sys.stdin
+    try:
+        for row in rows:
+            sys.stdin = io.StringIO("".join(f"{value}\n" for value in row))
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                executor = VCIExecutor(program)
+                executor.execute()
+            lines = output.getvalue().replace("Ingrese valor para n&: ", "").splitlines()
+            results.append((executor.variables, lines))
+    finally:
+        sys.stdin = stdin
+    return results
+
+
+def main():
+    program = pipeline.compile_file("input/factorial.txt", optimize=True).link()
+    random.seed(0)
+    for count in (1000, 10000):
+        rows = [[random.randint(0, 30)] for _ in range(count)]
+
+        start = time.perf_counter()
+        expected = run_rows(program, rows)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = BatchExecutor(program).run(rows)
+        vectorized = time.perf_counter() - start
+
+        same = all(batch.variables[i] == variables and batch.outputs[i] == lines
+                   for i, (variables, lines) in enumerate(expected))
+        print(f"{count:>6} filas  un VCIExecutor por fila {serial:7.3f}s  BatchExecutor {vectorized:7.3f}s"
+              f"  ({serial / vectorized:5.1f}x)  mismos resultados: {'sí' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Costo de los puntos de control periódicos (core/codegen/vci_checkpoint.py) en
+# VCIExecutor y VCIMachine: tiempo sin controlador, con controlador sin puntos de
+# control y guardando cada N instrucciones; tamaño y tiempo de guardar y cargar uno,
+# y una ejecución interrumpida que continúa con resume() hasta el mismo resultado.
+# Uso: python -m benchmarks.checkpoint_benchmark
+import os
+import tempfile
+import time
+
+from core import pipeline
+from core.codegen.vci_checkpoint import Checkpointer, load_checkpoint
+from core.codegen.vci_control import ExecutionController
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_io import ListOutput
+from core.codegen.vci_vm import VCIMachine
+from benchmarks.loop_optimizer_benchmark import generate_factorials
+
+ENGINES = {"VCIExecutor": VCIExecutor, "VCIMachine": VCIMachine}
+INTERVALS = [None, 100000, 10000, 1000]
+
+
+def run(engine, program, controller):
+    executor = engine(program, writer=ListOutput(), controller=controller)
+    start = time.perf_counter()
+    executor.execute()
+    return executor, time.perf_counter() - start
+
+
+def main():
+    program = pipeline.compile(generate_factorials(400)).link()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "vci.vcik")
+        for engine_name, engine in ENGINES.items():
+            full, baseline = run(engine, program, None)
+            print(f"{engine_name:<12} sin controlador           {baseline:7.3f}s")
+            for every in INTERVALS:
+                checkpointer = Checkpointer(path, every_steps=every) if every else None
+                executor, elapsed = run(engine, program, ExecutionController(checkpoint=checkpointer))
+                label = f"cada {every} instr." if every else "sin puntos de control"
+                saved = checkpointer.saved if checkpointer else 0
+                print(f"{engine_name:<12} {label:<24} {elapsed:7.3f}s  {elapsed / baseline:5.2f}x  "
+                      f"{saved:>5} guardados")
+
+        # Un punto de control al detenerse a mitad del programa
+        controller = ExecutionController(max_steps=400000, checkpoint=Checkpointer(path))
+        stopped, _ = run(VCIExecutor, program, controller)
+        start = time.perf_counter()
+        checkpoint = load_checkpoint(path, program)
+        loaded = time.perf_counter() - start
+        print(f"punto de control: {os.path.getsize(path)} bytes, {len(checkpoint.variables)} variables, "
+              f"carga {loaded * 1000:.2f} ms")
+
+        resumed = VCIMachine(program, writer=ListOutput())
+        resumed.resume(path)
+        same = resumed.variables == full.variables
+        same_output = stopped.writer.lines + resumed.writer.lines == full.writer.lines
+        print(f"detenido en {checkpoint.steps} instrucciones y continuado con VCIMachine: "
+              f"mismas variables: {'sí' if same else 'NO'}, misma salida: {'sí' if same_output else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
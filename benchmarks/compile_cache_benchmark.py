@@ -0,0 +1,34 @@
+# Compilación completa frente a un acierto de CompileCache para programas de
+# distintos tamaños; la caché se crea en un directorio temporal.
+# Uso: python -m benchmarks.compile_cache_benchmark
+import tempfile
+import time
+
+from core import pipeline
+from core.compile_cache import CompileCache
+from benchmarks.sources import generate_sized
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = CompileCache(directory)
+        for kilobytes in (10, 100, 1000):
+            source = generate_sized(kilobytes * 1000)
+
+            start = time.perf_counter()
+            compiled = pipeline.compile(source)
+            full = time.perf_counter() - start
+
+            cache.compile(source)
+            start = time.perf_counter()
+            cached = cache.compile(source)
+            hit = time.perf_counter() - start
+
+            same = cached.instructions == compiled.instructions and list(cached.tokens) == list(compiled.tokens)
+            print(f"{kilobytes:>5} KB  completa {full:7.3f}s  caché {hit:7.3f}s  ({full / hit:5.1f}x)"
+                  f"  mismo resultado: {'sí' if same else 'NO'}")
+        print(cache.stats)
+
+
+if __name__ == "__main__":
+    main()
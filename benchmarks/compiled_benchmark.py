@@ -0,0 +1,50 @@
+# Programas al estilo de input/factorial.txt con n grande ejecutados por VCIExecutor,
+# VCIMachine y CompiledExecutor (VCI traducido a Python). Se mide la traducción (solo
+# la primera vez; después la función sale de la caché por hash del programa) y la
+# ejecución, comprobando que terminan con las mismas variables y la misma salida.
+# Uso: python -m benchmarks.compiled_benchmark
+import contextlib
+import io
+import time
+
+from core import pipeline
+from core.codegen import vci_compiler
+from core.codegen.vci_compiler import CompiledExecutor
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_vm import VCIMachine
+from benchmarks.loop_optimizer_benchmark import generate_factorials
+
+ENGINES = {"VCIExecutor": VCIExecutor, "VCIMachine": VCIMachine, "CompiledExecutor": CompiledExecutor}
+
+
+def run(engine, program):
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        engine.execute()
+    return time.perf_counter() - start, output.getvalue(), engine.variables
+
+
+def main():
+    for n in (200, 400, 800):
+        program = pipeline.compile(generate_factorials(n), optimize=True).link()
+        vci_compiler._cache.clear()
+        start = time.perf_counter()
+        CompiledExecutor(program)
+        translation = time.perf_counter() - start
+        start = time.perf_counter()
+        CompiledExecutor(program)
+        cached = time.perf_counter() - start
+        print(f"n={n:<4} traducción {translation * 1000:7.2f} ms, desde la caché {cached * 1000:6.3f} ms")
+
+        expected = baseline = None
+        for name, engine in ENGINES.items():
+            elapsed, output, variables = run(engine(program), program)
+            expected = expected or (output, variables)
+            baseline = baseline or elapsed
+            same = (output, variables) == expected
+            print(f"       {name:<17} {elapsed:7.3f}s ({baseline / elapsed:5.1f}x)  mismo resultado: {'sí' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Costo de ExecutionController en VCIExecutor y VCIMachine: instrucciones por segundo
+# sin controlador y con controlador según cada cuántas instrucciones se consulta, y
+# tiempo en detener un ciclo infinito por presupuesto, por tiempo y cancelándolo
+# desde otro hilo.
+# Uso: python -m benchmarks.controller_benchmark
+import threading
+import time
+
+from core import pipeline
+from core.codegen.vci_control import ExecutionController
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_io import ListOutput
+from core.codegen.vci_vm import VCIMachine
+from benchmarks.trace_benchmark import generate_loop
+
+ENGINES = {"VCIExecutor": VCIExecutor, "VCIMachine": VCIMachine}
+CHECKS = [None, 10000, 1000, 100, 1]
+INFINITE = """programa infinito@;
+variables
+    entero i&;
+inicio
+    i& = 0;
+    mientras (1 < 2) hacer
+    inicio
+        i& = i& + 1;
+    fin
+fin
+"""
+
+
+def run(engine, program, controller):
+    executor = engine(program, writer=ListOutput(), controller=controller)
+    start = time.perf_counter()
+    executor.execute()
+    return executor, time.perf_counter() - start
+
+
+def main():
+    program = pipeline.compile(generate_loop(200000)).link()
+    for engine_name, engine in ENGINES.items():
+        baseline, steps = None, None
+        for check_every in CHECKS:
+            controller = ExecutionController(check_every=check_every) if check_every else None
+            executor, elapsed = run(engine, program, controller)
+            if controller is not None:
+                steps = controller.steps
+            baseline = baseline or elapsed
+            label = f"cada {check_every}" if check_every else "sin controlador"
+            print(f"{engine_name:<12} {label:<16} {elapsed:7.3f}s  {elapsed / baseline:5.2f}x")
+        print(f"{'':<12} instrucciones contadas: {steps}")
+
+    infinite = pipeline.compile(INFINITE).link()
+    for engine_name, engine in ENGINES.items():
+        executor, elapsed = run(engine, infinite, ExecutionController(max_steps=1000003))
+        print(f"{engine_name:<12} presupuesto 1000003: {executor.state().steps} instrucciones en {elapsed:.3f}s")
+        executor, elapsed = run(engine, infinite, ExecutionController(timeout=0.5))
+        print(f"{engine_name:<12} timeout 0.5s: detenido a los {elapsed:.3f}s tras {executor.state().steps} instrucciones")
+
+        controller = ExecutionController()
+        executor = engine(infinite, writer=ListOutput(), controller=controller)
+        thread = threading.Thread(target=executor.execute)
+        thread.start()
+        time.sleep(0.2)
+        cancelled = time.perf_counter()
+        controller.cancel()
+        thread.join()
+        print(f"{engine_name:<12} cancel(): detenido en {(time.perf_counter() - cancelled) * 1000:.2f} ms "
+              f"({executor.state().reason})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# Estrés de expresiones: anidamiento de 10^5 paréntesis y expresiones de 10^6 términos
+# a través de todo el pipeline (léxico, sintáctico, semántico y VCI).
+# Uso: python -m benchmarks.expression_stress_benchmark
+import sys
+import time
+
+from core import pipeline
+
+
+def program(expression):
+    return f"programa estres@;\nvariables\n    entero a&;\ninicio\n    a& = {expression};\n    escribir(a&);\nfin\n"
+
+
+def nested(depth):
+    return "(" * depth + "1" + " + 1)" * depth
+
+
+def long_sum(terms):
+    return " + ".join(["a&", "2 * 3"] * (terms // 2))
+
+
+def run_case(name, source, parser):
+    start = time.perf_counter()
+    result = pipeline.compile(source, parser)
+    elapsed = time.perf_counter() - start
+    status = "ok" if result.succeeded else f"errores: {result.syntax_errors[:1] or result.semantic_errors[:1]}"
+    print(f"{name:<28} {parser:<9} {len(result.tokens):>9} tokens {len(result.instructions):>9} instrucciones "
+          f"{elapsed:7.2f}s  {status}")
+
+
+def main():
+    print(f"límite de recursión de Python: {sys.getrecursionlimit()}")
+    for parser in ("recursive", "table"):
+        run_case("10^5 paréntesis anidados", program(nested(100_000)), parser)
+        run_case("10^6 términos", program(long_sum(1_000_000)), parser)
+
+
+if __name__ == "__main__":
+    main()
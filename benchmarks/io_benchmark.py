@@ -0,0 +1,97 @@
+# Proveedores de E/S de VCIExecutor en un programa que lee y escribe muchos valores:
+# input()/print() con stdin y stdout redirigidos frente a StreamInput/QueueInput y
+# BufferedOutput; después, muchos programas atendidos a la vez con AsyncChannel.
+# Uso: python -m benchmarks.io_benchmark
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import time
+
+from core import pipeline
+from core.codegen.vci_io import AsyncChannel, BufferedOutput, ListOutput, QueueInput, StreamInput
+from core.codegen.vci_vm import VCIMachine
+
+PROGRAM = """programa eco@;
+variables
+    entero n&, i&, x&, suma&;
+inicio
+    leer(n&);
+    i& = 0;
+    suma& = 0;
+    mientras (i& < n&) hacer
+    inicio
+        leer(x&);
+        suma& = suma& + x&;
+        escribir(suma&);
+        i& = i& + 1;
+    fin
+fin
+"""
+
+
+def values(count):
+    return [count] + list(range(count))
+
+
+def timed(run):
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def console(program, data):
+    stdin = sys.stdin
+    sys.stdin = io.StringIO("".join(f"{value}\n" for value in data))
+    try:
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            VCIMachine(program).execute()
+    finally:
+        sys.stdin = stdin
+
+
+def buffered(program, data, reader):
+    with open(os.devnull, "w") as null:
+        VCIMachine(program, reader=reader(data), writer=BufferedOutput(null)).execute()
+
+
+async def serve(program, count, steps):
+    async def one(k):
+        channel = AsyncChannel()
+        task = asyncio.create_task(channel.run(VCIMachine(program, reader=channel, writer=channel)))
+        await channel.send(steps)
+        lines = []
+        for value in range(steps):
+            await channel.send(value + k)
+            lines.append(await channel.receive())
+        while (line := await channel.receive()) is not None:
+            lines.append(line)
+        await task
+        return lines
+
+    return await asyncio.gather(*(one(k) for k in range(count)))
+
+
+def main():
+    program = pipeline.compile(PROGRAM).link()
+    for count in (10000, 100000):
+        data = values(count)
+        base = timed(lambda: console(program, data))
+        stream = timed(lambda: buffered(program, data, lambda d: StreamInput(io.StringIO("".join(f"{v}\n" for v in d)))))
+        queue = timed(lambda: buffered(program, data, QueueInput))
+        print(f"{count:>7} valores  input()/print() {base:6.3f}s  StreamInput+BufferedOutput {stream:6.3f}s"
+              f" ({base / stream:4.1f}x)  QueueInput+BufferedOutput {queue:6.3f}s ({base / queue:4.1f}x)")
+
+    output = ListOutput()
+    VCIMachine(program, reader=QueueInput([3, 0, 1, 2]), writer=output).execute()
+    expected = output.lines
+    start = time.perf_counter()
+    results = asyncio.run(serve(program, 100, 3))
+    elapsed = time.perf_counter() - start
+    same = results[0] == expected
+    print(f"AsyncChannel: 100 programas a la vez, 3 lecturas cada uno, {elapsed:6.3f}s  salida correcta: {'sí' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
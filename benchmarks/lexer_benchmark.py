@@ -0,0 +1,47 @@
+# Compara el escáner de expresión maestra contra el ciclo original por línea.
+# Uso: python -m benchmarks.lexer_benchmark
+import time
+
+from core.lexer.lexer import Lexer
+from benchmarks.sources import generate_sized, generate_long_lines
+
+
+def measure(function, text):
+    start = time.perf_counter()
+    function(text)
+    return time.perf_counter() - start
+
+
+def run_case(name, text):
+    lexer = Lexer()
+    legacy_time = measure(lexer.analyze_legacy, text)
+    legacy_result = (list(lexer.tokens), list(lexer.errors))
+    scanner_time = measure(lexer.analyze, text)
+    scanner_result = (list(lexer.tokens), list(lexer.errors))
+
+    same = "sí" if legacy_result == scanner_result else "NO"
+    size_mb = len(text.encode("utf-8")) / 1_000_000
+    print(f"{name:<28} {size_mb:7.2f} MB {len(scanner_result[0]):>10} tokens "
+          f"legacy {legacy_time:8.3f}s  scanner {scanner_time:8.3f}s  "
+          f"x{legacy_time / scanner_time:6.1f}  iguales: {same}")
+
+
+def with_open_comments(text, every=5):
+    # Cada `every` líneas, un comentario /* sin cerrar (el texto no tiene "*/"): se
+    # reporta y termina con su línea
+    lines = text.splitlines()
+    for index in range(0, len(lines), every):
+        lines[index] += " /* sin cerrar"
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    for megabytes in (1, 2, 4):
+        run_case(f"programa {megabytes} MB", generate_sized(megabytes * 1_000_000))
+    for line_length in (2_000, 8_000, 32_000):
+        run_case(f"líneas de {line_length} chars", generate_long_lines(60, line_length))
+    run_case("comentarios sin cerrar", with_open_comments(generate_long_lines(2_000, 500)))
+
+
+if __name__ == "__main__":
+    main()
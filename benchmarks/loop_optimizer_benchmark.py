@@ -0,0 +1,62 @@
+# Ciclos anidados al estilo de input/factorial.txt (factoriales de 1..n con
+# subexpresiones repetidas e invariantes) ejecutados sin optimizar, con las pasadas
+# locales y con CSE + LICM; cuenta instrucciones ejecutadas y tiempo del VCIExecutor.
+# Uso: python -m benchmarks.loop_optimizer_benchmark
+import contextlib
+import io
+import time
+
+from core import pipeline
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_trace import CounterTrace
+
+LOCAL_PASSES = ["constant_folding", "copy_propagation", "dead_temps", "jump_threading", "unused_labels"]
+
+
+def generate_factorials(n):
+    return f"""programa factoriales@;
+variables
+    entero n&, i&, j&, f&, total&, escala&;
+inicio
+    n& = {n};
+    escala& = 3;
+    total& = 0;
+    i& = 1;
+    mientras (i& <= n&) hacer
+    inicio
+        f& = 1;
+        j& = 1;
+        mientras (j& <= i&) hacer
+        inicio
+            f& = f& * j& + n& * escala& - n& * escala&;
+            j& = j& + 1;
+        fin
+        total& = total& + f& * (escala& + 1) - f& * (escala& + 1) + f&;
+        i& = i& + 1;
+    fin
+    escribir(total&);
+fin
+"""
+
+
+def main():
+    for n in (20, 60):
+        source = generate_factorials(n)
+        baseline = expected = None
+        for name, optimize in (("sin optimizar", False), ("locales", LOCAL_PASSES), ("+ CSE y LICM", True)):
+            result = pipeline.compile(source, optimize=optimize)
+            executor = VCIExecutor(result.instructions, CounterTrace())
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                executor.execute()
+            elapsed = time.perf_counter() - start
+            steps = executor.trace.steps
+            baseline = baseline or steps
+            expected = expected or executor.variables["total&"]
+            same = executor.variables["total&"] == expected
+            print(f"n={n:<3} {name:<14} {len(result.instructions):>3} instrucciones, {steps:>7} ejecutadas "
+                  f"({steps / baseline:6.1%}) {elapsed:6.3f}s  mismo total: {'sí' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# Escalamiento del análisis léxico en paralelo con 1, 2, 4 y 8 procesos.
+# Uso: python -m benchmarks.parallel_lexer_benchmark [megabytes]
+import os
+import sys
+import time
+
+from core.lexer.lexer import Lexer
+from benchmarks.sources import generate_sized
+
+
+def main():
+    megabytes = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    text = generate_sized(megabytes * 1_000_000)
+    print(f"fuente de {len(text) / 1_000_000:.1f} MB, {os.cpu_count()} CPU disponibles")
+
+    lexer = Lexer()
+    baseline = None
+    reference = None
+    for workers in (1, 2, 4, 8):
+        start = time.perf_counter()
+        lexer.analyze_parallel(text, workers=workers, threshold=0)
+        elapsed = time.perf_counter() - start
+        columns = (lexer.tokens.kinds, lexer.tokens.offsets, lexer.tokens.lines, lexer.tokens.columns)
+        if reference is None:
+            baseline, reference = elapsed, columns
+        same = "sí" if columns == reference else "NO"
+        print(f"{workers} procesos {elapsed:8.2f}s  x{baseline / elapsed:5.2f}  "
+              f"{len(lexer.tokens) / elapsed:12,.0f} tokens/s  iguales: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# Rendimiento (tokens por segundo) del Parser recursivo y del TableParser LL(1),
+# comprobando que ambos producen el mismo AST y los mismos errores.
+# Uso: python -m benchmarks.parser_benchmark
+import time
+
+from core.lexer.lexer import Lexer
+from core.parser.parser import Parser
+from core.parser.table_parser import TableParser
+from benchmarks.sources import generate_sized
+
+
+def main():
+    for megabytes in (1, 4):
+        lexer = Lexer()
+        lexer.analyze(generate_sized(megabytes * 1_000_000))
+        count = len(lexer.tokens)
+        results = []
+        for name, engine in (("recursivo", Parser), ("tabla LL(1)", TableParser)):
+            parser = engine(lexer.tokens)
+            start = time.perf_counter()
+            ast = parser.parse()
+            elapsed = time.perf_counter() - start
+            results.append((ast, parser.errors))
+            print(f"{megabytes} MB {name:<12} {count:>9} tokens {elapsed:7.2f}s {count / elapsed:12,.0f} tokens/s")
+        print("mismo AST y errores:", "sí" if results[0] == results[1] else "NO")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Costo del perfilador de VCIExecutor (core/codegen/vci_profiler.py) frente a ejecutar
+# sin traza y con CounterTrace, y los puntos calientes por línea y por bloque básico
+# de un programa de ejemplo. Los CSV y el archivo de pilas colapsadas se escriben en
+# un directorio temporal.
+# Uso: python -m benchmarks.profiler_benchmark
+import os
+import tempfile
+import time
+
+from core import pipeline
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_io import ListOutput
+from core.codegen.vci_profiler import Profiler
+from core.codegen.vci_trace import CounterTrace
+from benchmarks.loop_optimizer_benchmark import generate_factorials
+
+TRACES = {"sin traza": lambda: None, "CounterTrace": CounterTrace, "Profiler": Profiler}
+TOP = 5
+
+
+def main():
+    program = pipeline.compile(generate_factorials(300)).link()
+    baseline = None
+    for name, factory in TRACES.items():
+        trace = factory()
+        executor = VCIExecutor(program, trace, writer=ListOutput())
+        start = time.perf_counter()
+        executor.execute()
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{name:<14} {elapsed:7.3f}s  {elapsed / baseline:5.2f}x")
+    profiler = trace
+
+    total = profiler.total_time or 1
+    print(f"\n{profiler.steps} instrucciones; líneas más costosas:")
+    for line, (executed, elapsed) in list(profiler.lines().items())[:TOP]:
+        print(f"  línea {line:<4} {executed:>9} instrucciones {100 * elapsed / total:6.2f}%")
+    print("bloques más costosos:")
+    for block, (start, entries, executed, elapsed) in list(profiler.blocks().items())[:TOP]:
+        print(f"  {block:<6} {entries:>9} entradas {executed:>9} instrucciones {100 * elapsed / total:6.2f}%")
+
+    with tempfile.TemporaryDirectory() as directory:
+        profiler.export(os.path.join(directory, "perfil.csv"))
+        profiler.export_blocks(os.path.join(directory, "perfil_bloques.csv"))
+        profiler.export_lines(os.path.join(directory, "perfil_lineas.csv"))
+        collapsed = os.path.join(directory, "perfil.folded")
+        profiler.export_collapsed(collapsed)
+        with open(collapsed, encoding="utf-8") as f:
+            print(f"pilas colapsadas: {sum(1 for _ in f)} líneas")
+
+
+if __name__ == "__main__":
+    main()
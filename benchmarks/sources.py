@@ -0,0 +1,44 @@
+# Generadores de programas sintéticos para los benchmarks
+
+
+def generate_program(statements, name="generado@"):
+    # Programa válido con `statements` asignaciones, condicionales y ciclos
+    lines = [
+        f"programa {name};",
+        "variables",
+        "    entero a&, b&, c&, i&;",
+        "    real r%;",
+        "    cadena s$;",
+        "    logico f#;",
+        "inicio",
+        "    a& = 1;",
+        "    b& = 2;",
+        "    i& = 0;",
+    ]
+    templates = [
+        "    a& = a& + b& * (c& - {n}); // comentario {n}",
+        "    r% = r% + {n}.5;",
+        '    s$ = "texto {n}";',
+        "    si (a& > {n}) entonces inicio b& = b& - 1; fin sino inicio b& = b& + 1; fin",
+        "    mientras (i& < {n}) hacer inicio i& = i& + 1; fin",
+        "    f# = true; /* bloque {n} */",
+    ]
+    for n in range(statements):
+        lines.append(templates[n % len(templates)].format(n=n))
+    lines.append("    escribir(a&);")
+    lines.append("fin")
+    return "\n".join(lines) + "\n"
+
+
+def generate_long_lines(line_count, line_length):
+    # Líneas muy largas de expresiones; peor caso para el ciclo por línea
+    chunk = "a& + 12 * (b& - 3.5) / c& "
+    line = (chunk * (line_length // len(chunk) + 1))[:line_length]
+    return "\n".join(line for _ in range(line_count)) + "\n"
+
+
+def generate_sized(target_bytes):
+    # Programa de aproximadamente `target_bytes` bytes
+    sample = generate_program(100)
+    statements = max(1, int(100 * target_bytes / len(sample)))
+    return generate_program(statements)
@@ -0,0 +1,45 @@
+# Memoria pico de Lexer.analyze contra Lexer.iter_tokens sobre un archivo mapeado.
+# Uso: python -m benchmarks.streaming_benchmark
+import os
+import tempfile
+import time
+import tracemalloc
+
+from core.lexer.lexer import Lexer
+from benchmarks.sources import generate_sized
+
+
+def measure(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return count, elapsed, peak / 1_000_000
+
+
+def main():
+    for megabytes in (1, 4):
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", encoding="utf-8", delete=False) as f:
+            f.write(generate_sized(megabytes * 1_000_000))
+            path = f.name
+        try:
+            def in_memory():
+                with open(path, encoding="utf-8") as source:
+                    lexer = Lexer()
+                    lexer.analyze(source.read())
+                    return len(lexer.tokens)
+
+            def streaming():
+                return sum(1 for _ in Lexer().iter_tokens(path, chunk_size=1 << 16))
+
+            for name, function in (("analyze", in_memory), ("iter_tokens", streaming)):
+                count, elapsed, peak = measure(function)
+                print(f"{megabytes} MB {name:<12} {count:>9} tokens {elapsed:7.2f}s pico {peak:8.1f} MB")
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Análisis semántico de programas con 10^4–10^5 declaraciones usando la SymbolTable
+# con diccionarios frente a la búsqueda lineal anterior sobre una lista.
+# Uso: python -m benchmarks.symbol_table_benchmark
+import time
+
+from core.lexer.lexer import Lexer
+from core.parser.parser import Parser
+from core.semantic.semantic_analyzer import SemanticAnalyzer
+from models.symbol import Symbol
+from models.syntax_error import SyntaxError
+
+LINEAR_LIMIT = 20_000   # la versión lineal es cuadrática; no se mide más allá
+
+
+class LinearAnalyzer(SemanticAnalyzer):
+    def __init__(self):
+        super().__init__()
+        self.symbol_table = []
+        self.types.symbol_table = self
+
+    def declare(self, name, var_type, scope):
+        if self.lookup(name, scope):
+            self.errors.append(SyntaxError("Variable ya declarada", name, -1, -1))
+        else:
+            self.symbol_table.append(Symbol(name=name, type=var_type, scope=scope))
+
+    def lookup(self, name, scope):
+        for s in self.symbol_table:
+            if s.name == name and s.scope == scope:
+                return s
+        return None
+
+
+def generate_declarations(count):
+    lines = ["programa decl@;", "variables"]
+    lines += [f"    entero v{n}&;" for n in range(count)]
+    lines.append("inicio")
+    lines += [f"    v{n}& = {n};" for n in range(count)]
+    lines.append("fin")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    for count in (10_000, 20_000, 50_000, 100_000):
+        lexer = Lexer()
+        lexer.analyze(generate_declarations(count))
+        ast = Parser(lexer.tokens).parse()
+        row = f"{count:>7} declaraciones"
+        for name, engine in (("SymbolTable", SemanticAnalyzer), ("lista", LinearAnalyzer)):
+            if engine is LinearAnalyzer and count > LINEAR_LIMIT:
+                continue
+            analyzer = engine()
+            start = time.perf_counter()
+            analyzer.analyze(ast)
+            row += f"  {name} {time.perf_counter() - start:8.3f}s"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+# Temporales antes y después de reuse_temps, máximo de temporales vivos a la vez y
+# tamaño final de VCIExecutor.variables para cada archivo de input/ y programas
+# generados, comprobando que la ejecución no cambia.
+# Uso: python -m benchmarks.temp_liveness_report
+import glob
+
+from core import pipeline
+from benchmarks.sources import generate_program
+from benchmarks.vci_optimizer_report import run, execute
+
+
+def main():
+    programs = [(path, open(path, encoding="utf-8").read()) for path in sorted(glob.glob("input/*.txt"))]
+    programs += [(f"generado ({n} instrucciones)", generate_program(n)) for n in (60, 600)]
+    for name, source in programs:
+        plain = pipeline.compile(source, optimize=True)
+        if not plain.succeeded:
+            print(f"{name:<30} no compila")
+            continue
+        reused = pipeline.compile(source, optimize=True, reuse_temps=True)
+        allocation = reused.allocation
+        same = run(plain.instructions) == run(reused.instructions)
+        before = len(execute(plain.instructions).variables)
+        after = len(execute(reused.instructions).variables)
+        print(f"{name:<30} temporales {allocation.temps:>4} -> {allocation.slots:<3} vivos a la vez {allocation.peak_live:>2}"
+              f"  variables del ejecutor {before:>4} -> {after:<4} misma ejecución: {'sí' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
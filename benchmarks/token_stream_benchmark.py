@@ -0,0 +1,38 @@
+# Memoria por token y tiempo de análisis sintáctico: lista de Token contra TokenStream.
+# Uso: python -m benchmarks.token_stream_benchmark
+import time
+import tracemalloc
+
+from core.lexer.lexer import Lexer
+from core.parser.parser import Parser
+from benchmarks.sources import generate_sized
+
+
+def traced(function):
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    text = generate_sized(2_000_000)
+    lexer = Lexer()
+
+    stream, stream_bytes = traced(lambda: lexer.scanner.scan_stream(text, []))
+    tokens, list_bytes = traced(lambda: list(lexer.scanner.scan(text, [])))
+    count = len(stream)
+    print(f"{count} tokens")
+    print(f"lista de Token  {list_bytes / count:7.1f} bytes/token")
+    print(f"TokenStream     {stream_bytes / count:7.1f} bytes/token (el texto fuente se comparte)")
+
+    for name, source in (("lista de Token", tokens), ("TokenStream", stream)):
+        start = time.perf_counter()
+        Parser(source).parse()
+        elapsed = time.perf_counter() - start
+        print(f"parse {name:<15} {elapsed:6.2f}s  {count / elapsed:12,.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Costo de cada modo de traza de VCIExecutor en un ciclo largo: tiempo de ejecución,
+# pasos registrados y memoria máxima (tracemalloc, en una segunda ejecución). La
+# traza completa se escribe en un archivo temporal.
+# Uso: python -m benchmarks.trace_benchmark
+import os
+import tempfile
+import time
+import tracemalloc
+
+from core import pipeline
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_trace import CounterTrace, RingTrace, StreamTrace
+
+MODES = {
+    "sin traza": lambda path: None,
+    "contadores": lambda path: CounterTrace(),
+    "últimos 1000": lambda path: RingTrace(1000),
+    "completa (disco)": lambda path: StreamTrace(path),
+}
+
+
+def generate_loop(iterations):
+    return f"""programa ciclo@;
+variables
+    entero i&, suma&, n&;
+inicio
+    n& = {iterations};
+    i& = 0;
+    suma& = 0;
+    mientras (i& < n&) hacer
+    inicio
+        suma& = suma& + i& * 2;
+        i& = i& + 1;
+    fin
+fin
+"""
+
+
+def run(program, trace):
+    executor = VCIExecutor(program, trace)
+    start = time.perf_counter()
+    executor.execute()
+    return time.perf_counter() - start, executor
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "traza.csv")
+        for iterations in (10000, 100000):
+            program = pipeline.compile(generate_loop(iterations)).link()
+            baseline = None
+            for name, make in MODES.items():
+                elapsed, executor = run(program, make(path))
+                baseline = baseline or elapsed
+                tracemalloc.start()
+                run(program, make(path))
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                steps = executor.trace.steps if executor.trace else "-"
+                print(f"{iterations:>7} iteraciones  {name:<17} {elapsed:7.3f}s ({elapsed / baseline:5.1f}x)"
+                      f"  pasos {steps:>8}  memoria máxima {peak / 1e6:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Tiempo hasta tener un VCIExecutor listo para ejecutar a partir del VCI exportado:
+# vci.csv leído con csv.DictReader (como hacía la interfaz) frente a vci.vcib cargado
+# con vci_binary.load_program (mmap, sin recorrer filas). Comprueba que ambos
+# cargan el mismo programa enlazado.
+# Uso: python -m benchmarks.vci_load_benchmark
+import csv
+import os
+import tempfile
+import time
+
+from core import pipeline
+from core.codegen.vci_binary import load_program
+from core.codegen.vci_executor import VCIExecutor
+from models.vci_instruction import VCIInstruction
+from benchmarks.sources import generate_program
+
+
+def load_csv(path):
+    instructions = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            instructions.append(VCIInstruction(
+                operation=row["Operación"],
+                arg1=row["Arg1"],
+                arg2=row["Arg2"],
+                result=row["Resultado"]
+            ))
+    return VCIExecutor(instructions)
+
+
+def load_binary(path):
+    return VCIExecutor(load_program(path))
+
+
+def same_program(left, right):
+    return (list(left.code) == list(right.code) and left.names == right.names
+            and left.constants == right.constants and list(left.source) == list(right.source))
+
+
+def timed(load, path, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        executor = load(path)
+        best = min(best, time.perf_counter() - start)
+    return best, executor
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "vci.csv")
+        binary_path = os.path.join(directory, "vci.vcib")
+        for statements in (1000, 10000, 100000):
+            result = pipeline.compile(generate_program(statements))
+            result.generator.export_to_csv(csv_path)
+            result.generator.export_to_binary(binary_path)
+
+            csv_time, from_csv = timed(load_csv, csv_path)
+            binary_time, from_binary = timed(load_binary, binary_path)
+            same = same_program(from_csv.program, from_binary.program)
+            from_binary.program.close()
+            print(f"{len(result.instructions):>7} instrucciones  csv {os.path.getsize(csv_path) / 1e6:6.2f} MB {csv_time:7.4f}s"
+                  f"  binario {os.path.getsize(binary_path) / 1e6:6.2f} MB {binary_time:7.4f}s"
+                  f"  ({csv_time / binary_time:6.1f}x)  mismo programa: {'sí' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
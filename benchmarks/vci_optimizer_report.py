@@ -0,0 +1,52 @@
+# Instrucciones VCI antes y después del PassManager para cada archivo de input/ (y un
+# programa generado), comprobando que la ejecución produce la misma salida y las
+# mismas variables del programa. Las lecturas reciben siempre el valor 5.
+# Uso: python -m benchmarks.vci_optimizer_report
+import contextlib
+import glob
+import io
+import sys
+
+from core import pipeline
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_optimizer import is_temp
+from benchmarks.sources import generate_program
+
+
+def execute(instructions, output=None):
+    stdin, sys.stdin = sys.stdin, io.StringIO("5\n" * 1000)
+    try:
+        with contextlib.redirect_stdout(output or io.StringIO()):
+            executor = VCIExecutor(instructions)
+            executor.execute()
+    finally:
+        sys.stdin = stdin
+    return executor
+
+
+def run(instructions):
+    # Salida impresa y variables del programa (sin temporales)
+    output = io.StringIO()
+    executor = execute(instructions, output)
+    variables = {name: value for name, value in executor.variables.items() if not is_temp(name)}
+    return output.getvalue(), variables
+
+
+def main():
+    programs = [(path, open(path, encoding="utf-8").read()) for path in sorted(glob.glob("input/*.txt"))]
+    programs.append(("generado (60 instrucciones)", generate_program(60)))
+    for name, source in programs:
+        plain = pipeline.compile(source)
+        if not plain.succeeded:
+            print(f"{name:<30} no compila ({len(plain.syntax_errors)} errores sintácticos, "
+                  f"{len(plain.semantic_errors)} semánticos)")
+            continue
+        optimized = pipeline.compile(source, optimize=True)
+        manager = optimized.optimizer
+        same = run(plain.instructions) == run(optimized.instructions)
+        print(f"{name:<30} {manager.before:>5} -> {manager.after:<5} misma ejecución: {'sí' if same else 'NO'}")
+        print("    " + ", ".join(f"{pass_name}: {count}" for pass_name, count in manager.changes.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# Instrucciones por segundo de VCIExecutor (sin traza) y de la máquina de registros
+# VCIMachine en ciclos largos, comprobando que terminan con las mismas variables.
+# Uso: python -m benchmarks.vm_benchmark
+import contextlib
+import io
+import time
+
+from core import pipeline
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_trace import CounterTrace
+from core.codegen.vci_vm import VCIMachine
+from benchmarks.loop_optimizer_benchmark import generate_factorials
+from benchmarks.trace_benchmark import generate_loop
+
+ENGINES = {"VCIExecutor": VCIExecutor, "VCIMachine": VCIMachine}
+
+
+def main():
+    workloads = [("ciclo 300000", generate_loop(300000)), ("factoriales 400", generate_factorials(400))]
+    for name, source in workloads:
+        program = pipeline.compile(source, optimize=True).link()
+        counted = VCIExecutor(program, CounterTrace())
+        with contextlib.redirect_stdout(io.StringIO()):
+            counted.execute()
+        steps = counted.trace.steps
+
+        rates = {}
+        for engine_name, engine in ENGINES.items():
+            engine = engine(program)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                engine.execute()
+            elapsed = time.perf_counter() - start
+            rates[engine_name] = steps / elapsed
+            same = engine.variables == counted.variables
+            print(f"{name:<16} {engine_name:<12} {steps:>9} instrucciones {elapsed:7.3f}s "
+                  f"{steps / elapsed / 1e6:6.2f} M instr/s  mismas variables: {'sí' if same else 'NO'}")
+        print(f"{'':<16} VCIMachine / VCIExecutor: {rates['VCIMachine'] / rates['VCIExecutor']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import csv
+from dataclasses import dataclass, field
+from functools import partial
+from typing import List, Optional
+
+import numpy as np
+
+from core.codegen.vci_executor import apply_operator, compare, is_true
+from core.codegen.vci_linker import LinkedProgram, Opcode, link, parse_constant
+
+ARITHMETIC = {Opcode.ADD: np.add, Opcode.SUB: np.subtract, Opcode.MUL: np.multiply, Opcode.DIV: np.true_divide}
+COMPARISONS = {Opcode.LT: np.less, Opcode.LE: np.less_equal, Opcode.GT: np.greater,
+               Opcode.GE: np.greater_equal, Opcode.EQ: np.equal, Opcode.NE: np.not_equal}
+SYMBOLS = {Opcode.ADD: "+", Opcode.SUB: "-", Opcode.MUL: "*", Opcode.DIV: "/",
+           Opcode.LT: "<", Opcode.LE: "<=", Opcode.GT: ">", Opcode.GE: ">=", Opcode.EQ: "==", Opcode.NE: "!=",
+           Opcode.AND: "&&", Opcode.OR: "||"}
+truth = np.frompyfunc(is_true, 1, 1)
+
+
+@dataclass
+class BatchResult:
+    names: List[str]
+    variables: List[dict] = field(default_factory=list)       # variables de cada fila
+    outputs: List[List[str]] = field(default_factory=list)     # líneas que imprimió ESCRIBIR
+    errors: List[Optional[str]] = field(default_factory=list)  # None si la fila terminó
+
+    def __len__(self):
+        return len(self.variables)
+
+    def rows(self):
+        for index, (variables, output, error) in enumerate(zip(self.variables, self.outputs, self.errors)):
+            yield [index] + [variables.get(name, "") for name in self.names] + ["\n".join(output), error or ""]
+
+    def export_to_csv(self, path="output/vci_batch.csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Fila"] + self.names + ["Salida", "Error"])
+            writer.writerows(self.rows())
+
+
+# Ejecuta un programa enlazado sobre N filas de entrada a la vez. Cada variable es un
+# arreglo de NumPy (dtype object, para conservar enteros de precisión arbitraria,
+# cadenas y la semántica de Python de VCIExecutor) con una posición por fila (carril).
+# Cada carril tiene su propio contador de instrucción; en cada paso se ejecuta la
+# instrucción más baja pendiente solo sobre los carriles que están en ella, así que
+# los ciclos divergentes se compactan y los carriles vuelven a converger al salir.
+class BatchExecutor:
+    def __init__(self, instructions):
+        self.program = instructions if isinstance(instructions, LinkedProgram) else link(instructions)
+        program = self.program
+        self.code = program.rows()
+        self.constants = [np.array(value, dtype=object) for value in program.constants]
+        self.slot_of = {name: slot for slot, name in enumerate(program.names)}
+
+    def run(self, inputs):
+        # `inputs`: una secuencia por fila con los valores que leerá cada LEER, en orden
+        rows = [[str(value) for value in row] for row in inputs]
+        n = len(rows)
+        names = self.program.names
+        # Una variable sin asignar se lee como su propio nombre
+        self.frame = [np.full(n, name, dtype=object) for name in names]
+        self.written = [np.zeros(n, dtype=bool) for _ in names]
+        # Máscara de verdad de los resultados de comparaciones, para IF_FALSE
+        self.truths = {}
+        self.cursor = np.zeros(n, dtype=np.int64)
+        result = BatchResult(list(names), outputs=[[] for _ in range(n)], errors=[None] * n)
+
+        pc = np.zeros(n, dtype=np.int64)
+        # Las operaciones de Python sobre float ya dan inf/nan sin error, como en VCIExecutor
+        with np.errstate(all="ignore"):
+            self._execute(pc, rows, result)
+
+        frame, written = self.frame, self.written
+        result.variables = [
+            {name: frame[slot][lane] for slot, name in enumerate(names) if written[slot][lane]}
+            for lane in range(n)
+        ]
+        return result
+
+    def _execute(self, pc, rows, result):
+        size = len(self.code)
+        n = len(pc)
+        while n:
+            p = int(pc.min())
+            if p >= size:
+                break
+            lanes = np.flatnonzero(pc == p)
+            full = len(lanes) == n
+            opcode, a, b, c = self.code[p]
+
+            if opcode == Opcode.GOTO:
+                pc[lanes] = c
+                continue
+            if opcode == Opcode.IF_FALSE:
+                pc[lanes] = np.where(self.truth(a, lanes, full), p + 1, c)
+                continue
+
+            pc[lanes] = p + 1
+            if opcode == Opcode.ESCRIBIR:
+                label = self.program.source[p].arg1
+                values = self.read(a, lanes, full)
+                for lane, value in zip(lanes, np.broadcast_to(values, lanes.shape)):
+                    result.outputs[lane].append(f"{label} = {value}")
+            elif opcode == Opcode.LEER:
+                for lane in lanes:
+                    self.read_input(rows, lane, c, result, pc, size)
+            elif opcode == Opcode.ASSIGN:
+                self.write(c, lanes, full, self.read(a, lanes, full))
+            elif opcode in ARITHMETIC:
+                self.write(c, lanes, full, self.arithmetic(opcode, a, b, lanes, full))
+            else:
+                self.compare(opcode, a, b, c, lanes, full)
+
+    def read(self, ref, lanes, full):
+        if ref < 0:
+            return self.constants[~ref]
+        column = self.frame[ref]
+        return column if full else column[lanes]
+
+    def write(self, slot, lanes, full, values, mask=None):
+        if full:
+            column = np.empty(len(lanes), dtype=object)
+            column[:] = values
+            self.frame[slot] = column
+        else:
+            self.frame[slot][lanes] = values
+        self.written[slot][lanes] = True
+        if mask is None:
+            self.truths.pop(slot, None)
+        elif full:
+            self.truths[slot] = mask
+        elif slot in self.truths:
+            self.truths[slot][lanes] = mask
+
+    def truth(self, ref, lanes, full):
+        if ref >= 0 and ref in self.truths:
+            mask = self.truths[ref]
+            return mask if full else mask[lanes]
+        return np.broadcast_to(truth(self.read(ref, lanes, full)), lanes.shape).astype(bool)
+
+    def arithmetic(self, opcode, a, b, lanes, full):
+        left, right = self.read(a, lanes, full), self.read(b, lanes, full)
+        try:
+            return ARITHMETIC[opcode](left, right, dtype=object)
+        except (TypeError, ZeroDivisionError):
+            # Algún carril no admite la operación: se repite carril por carril
+            return np.frompyfunc(partial(apply_operator, SYMBOLS[opcode]), 2, 1)(left, right)
+
+    def compare(self, opcode, a, b, c, lanes, full):
+        if opcode in (Opcode.AND, Opcode.OR):
+            left, right = self.truth(a, lanes, full), self.truth(b, lanes, full)
+            mask = left & right if opcode == Opcode.AND else left | right
+        else:
+            left, right = self.read(a, lanes, full), self.read(b, lanes, full)
+            try:
+                mask = np.broadcast_to(COMPARISONS[opcode](left, right), lanes.shape)
+            except TypeError:
+                values = np.frompyfunc(partial(compare, SYMBOLS[opcode]), 2, 1)(left, right)
+                mask = np.broadcast_to(values, lanes.shape).astype(bool)
+        # Los carriles guardan bool de Python, igual que VCIExecutor
+        self.write(c, lanes, full, mask.astype(object), mask.copy())
+
+    def read_input(self, rows, lane, slot, result, pc, size):
+        row, position = rows[lane], self.cursor[lane]
+        if position >= len(row):
+            # VCIExecutor terminaría con EOFError en input(); el carril se detiene
+            result.errors[lane] = f"Sin entrada para {self.program.names[slot]}"
+            pc[lane] = size
+            return
+        text = row[position]
+        self.cursor[lane] += 1
+        source = self.slot_of.get(text)
+        if source is not None and self.written[source][lane]:
+            value = self.frame[source][lane]
+        else:
+            value = parse_constant(text)
+        self.frame[slot][lane] = value
+        self.written[slot][lane] = True
+        self.truths.pop(slot, None)
@@ -0,0 +1,172 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from core.codegen.vci_linker import FIELDS, LinkedProgram, parse_constant
+from models.vci_instruction import VCIInstruction
+
+# Formato binario del VCI enlazado (little-endian, todo alineado a 4 bytes):
+#   cabecera    MAGIC, versión, número de instrucciones, nombres, constantes y cadenas
+#   código      instrucciones * FIELDS enteros int32 (opcode, a, b, c)
+#   fuente      instrucciones * SOURCE_FIELDS índices de cadena (operación, arg1, arg2,
+#               resultado, tipo) para la traza, ESCRIBIR y la exportación
+#   líneas      instrucciones enteros int32: línea de la sentencia en el código fuente
+#   nombres     índices de cadena de las variables
+#   constantes  pares (índice de cadena, es_real): los reales se guardan con repr y se
+#               leen con float para conservar el valor exacto
+#   cadenas     cadenas + 1 desplazamientos uint32 y después los bytes UTF-8
+MAGIC = b"VCIB"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sB3xIIII")
+SOURCE_FIELDS = 5
+SUFFIX = ".vcib"
+
+
+def write_program(program, path):
+    strings = {}
+
+    def string(text):
+        index = strings.get(text)
+        if index is None:
+            index = strings[text] = len(strings)
+        return index
+
+    source = array("I")
+    for instr in program.source:
+        source.extend(string(text) for text in (instr.operation, instr.arg1, instr.arg2, instr.result, instr.data_type))
+    lines = array("i", (instr.line for instr in program.source))
+    names = array("I", (string(name) for name in program.names))
+    constants = array("I")
+    for value in program.constants:
+        constants.extend((string(repr(value) if isinstance(value, float) else str(value)), isinstance(value, float)))
+
+    encoded = [text.encode("utf-8", "surrogatepass") for text in strings]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    code = array("i", program.code)
+    sections = [code, source, lines, names, constants, offsets]
+    if sys.byteorder != "little":
+        for section in sections:
+            section.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(program), len(names), len(program.constants), len(strings)))
+        for section in sections:
+            section.tofile(f)
+        f.write(b"".join(encoded))
+
+
+# Instrucciones originales leídas del archivo bajo demanda: solo se construye el
+# VCIInstruction de las filas que se consultan
+class SourceView:
+    def __init__(self, fields, strings, lines):
+        self.fields = fields
+        self.strings = strings
+        self.lines = lines
+
+    def __len__(self):
+        return len(self.fields) // SOURCE_FIELDS
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        strings = self.strings
+        start = index * SOURCE_FIELDS
+        operation, arg1, arg2, result, data_type = self.fields[start:start + SOURCE_FIELDS]
+        return VCIInstruction(strings[operation], strings[arg1], strings[arg2], strings[result], strings[data_type],
+                              self.lines[index])
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+# Programa cargado de un archivo: `code` y la fuente son vistas sobre el mapa, que se
+# libera con close() (o usándolo con `with`). Después de cerrarlo ya no se puede leer.
+class MappedProgram(LinkedProgram):
+    _mapping = None
+
+    def close(self):
+        if self._mapping is None:
+            return
+        for view in (self.code, self.source.fields, self.source.lines):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mapping.close()
+        self._mapping = None
+
+
+# Carga un programa enlazado mapeando el archivo en memoria: el código y los índices
+# de la fuente son vistas (memoryview) sobre el mapa, sin copiar ni recorrer filas
+def load_program(path):
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    # Todo se valida antes de crear vistas, para poder cerrar el mapa si el archivo no sirve
+    try:
+        sizes, position = _check(data, path)
+    except ValueError:
+        data.close()
+        raise
+
+    view = memoryview(data)
+    sections = []
+    for size, typecode in zip(sizes, "iIiIII"):
+        end = position + size * 4
+        section = view[position:end]
+        sections.append(section.cast(typecode) if sys.byteorder == "little" else _swapped(section, typecode))
+        section.release()
+        position = end
+    code, source, lines, names, constants, offsets = sections
+
+    try:
+        blob = view[position:]
+        strings = [str(blob[offsets[i]:offsets[i + 1]], "utf-8", "surrogatepass") for i in range(len(offsets) - 1)]
+        blob.release()
+        program = MappedProgram(
+            code=code,
+            constants=[float(strings[index]) if is_float else parse_constant(strings[index])
+                       for index, is_float in zip(constants[::2], constants[1::2])],
+            names=[strings[index] for index in names],
+            source=SourceView(source, strings, lines),
+        )
+    except (ValueError, IndexError):
+        for section in sections + [blob]:
+            if isinstance(section, memoryview):
+                section.release()
+        view.release()
+        data.close()
+        raise ValueError(f"Archivo VCI inválido: {path}")
+    for section in (names, constants, offsets):
+        if isinstance(section, memoryview):
+            section.release()
+    view.release()
+    program._mapping = data
+    return program
+
+
+def _check(data, path):
+    # Tamaño de cada sección y posición donde empiezan, validando cabecera y longitudes
+    if len(data) < HEADER.size:
+        raise ValueError(f"Archivo VCI inválido: {path}")
+    magic, version, count, name_count, constant_count, string_count = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Archivo VCI inválido o de otra versión: {path}")
+    sizes = (count * FIELDS, count * SOURCE_FIELDS, count, name_count, constant_count * 2, string_count + 1)
+    end = HEADER.size + 4 * sum(sizes)
+    if end > len(data):
+        raise ValueError(f"Archivo VCI truncado: {path}")
+    (blob_size,) = struct.unpack_from("<I", data, end - 4)
+    if len(data) - end != blob_size:
+        raise ValueError(f"Archivo VCI truncado: {path}")
+    return sizes, HEADER.size
+
+
+def _swapped(section, typecode):
+    # Máquinas big-endian: se copia la sección para invertir el orden de los bytes
+    values = array(typecode, section.tobytes())
+    values.byteswap()
+    return values
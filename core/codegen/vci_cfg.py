@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+def jump_target(instr):
+    if instr.operation == "GOTO":
+        return instr.result
+    if instr.operation == "IF_FALSE":
+        return instr.result.split()[-1]
+    return None
+
+
+@dataclass
+class BasicBlock:
+    index: int
+    start: int     # primera instrucción del bloque
+    end: int       # índice después de la última instrucción
+    successors: List[int] = field(default_factory=list)
+    predecessors: List[int] = field(default_factory=list)
+
+
+# Grafo de flujo de control del VCI: bloques básicos delimitados por etiquetas y
+# saltos, dominadores y ciclos naturales (cabecera + bloques del cuerpo).
+class ControlFlowGraph:
+    def __init__(self, instructions):
+        self.instructions = instructions
+        self.blocks = []
+        self.block_of_label = {}
+        self._build()
+        self.dominators = self._dominators()
+
+    def _build(self):
+        instructions = self.instructions
+        leaders = {0}
+        for i, instr in enumerate(instructions):
+            if instr.operation == "LABEL":
+                leaders.add(i)
+            elif instr.operation in ("GOTO", "IF_FALSE"):
+                leaders.add(i + 1)
+        leaders = sorted(leader for leader in leaders if leader < len(instructions))
+
+        for index, start in enumerate(leaders):
+            end = leaders[index + 1] if index + 1 < len(leaders) else len(instructions)
+            self.blocks.append(BasicBlock(index, start, end))
+            for i in range(start, end):
+                if instructions[i].operation == "LABEL":
+                    self.block_of_label[instructions[i].result] = index
+
+        for block in self.blocks:
+            last = instructions[block.end - 1]
+            target = jump_target(last)
+            if target is not None and target in self.block_of_label:
+                block.successors.append(self.block_of_label[target])
+            if last.operation != "GOTO" and block.index + 1 < len(self.blocks):
+                block.successors.append(block.index + 1)
+            for successor in block.successors:
+                self.blocks[successor].predecessors.append(block.index)
+
+    def _dominators(self):
+        # Conjuntos de dominadores por iteración hasta punto fijo; los bloques
+        # inalcanzables quedan dominados por todos
+        everything = set(range(len(self.blocks)))
+        dominators = [set(everything) for _ in self.blocks]
+        if self.blocks:
+            dominators[0] = {0}
+        changed = True
+        while changed:
+            changed = False
+            for block in self.blocks[1:]:
+                incoming = [dominators[p] for p in block.predecessors]
+                new = set.intersection(*incoming) if incoming else set(everything)
+                new = new | {block.index}
+                if new != dominators[block.index]:
+                    dominators[block.index] = new
+                    changed = True
+        return dominators
+
+    def loops(self):
+        # Ciclos naturales (cabecera, bloques) a partir de las aristas de retorno
+        loops = {}
+        for block in self.blocks:
+            for successor in block.successors:
+                if successor in self.dominators[block.index]:
+                    body = loops.setdefault(successor, {successor})
+                    stack = [block.index]
+                    while stack:
+                        current = stack.pop()
+                        if current not in body:
+                            body.add(current)
+                            stack.extend(self.blocks[current].predecessors)
+        return sorted(loops.items())
+
+    def span(self, blocks):
+        # Rango [inicio, fin) de instrucciones si los bloques son contiguos; si no, None
+        ordered = sorted(blocks)
+        if ordered != list(range(ordered[0], ordered[-1] + 1)):
+            return None
+        return self.blocks[ordered[0]].start, self.blocks[ordered[-1]].end
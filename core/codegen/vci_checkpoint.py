@@ -0,0 +1,161 @@
+import os
+import struct
+import time
+
+from core.codegen.vci_compiler import program_hash
+from models.checkpoint import Checkpoint
+
+# Formato binario de un punto de control (little-endian):
+#   cabecera   MAGIC, versión, hash SHA-256 del programa, ip, instrucciones ejecutadas
+#              (-1 si no se contaron), número de variables y de valores de la pila
+#   variables  pares (ranura en program.names, valor)
+#   pila       valores
+# Cada valor es una etiqueta de un byte y sus datos: enteros de cualquier tamaño como
+# bytes con signo, reales como double y cadenas como UTF-8, con su longitud delante.
+MAGIC = b"VCIK"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sB3x32sIqII")
+SIZE = struct.Struct("<I")
+FLOAT = struct.Struct("<d")
+SUFFIX = ".vcik"
+
+
+def _encode_value(value, out):
+    if value is True or value is False:
+        out += b"T" if value else b"F"
+    elif value is None:
+        out += b"N"
+    elif isinstance(value, int):
+        data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+        out += b"I" + SIZE.pack(len(data)) + data
+    elif isinstance(value, float):
+        out += b"D" + FLOAT.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8", "surrogatepass")
+        out += b"S" + SIZE.pack(len(data)) + data
+    else:
+        raise ValueError(f"Valor no admitido en un punto de control: {value!r}")
+
+
+def _decode_value(view, position):
+    tag = view[position:position + 1]
+    position += 1
+    if tag == b"T":
+        return True, position
+    if tag == b"F":
+        return False, position
+    if tag == b"N":
+        return None, position
+    if tag == b"D":
+        return FLOAT.unpack_from(view, position)[0], position + FLOAT.size
+    if tag in (b"I", b"S"):
+        (size,) = SIZE.unpack_from(view, position)
+        start = position + SIZE.size
+        data = view[start:start + size]
+        if len(data) != size:
+            raise ValueError("Punto de control truncado")
+        if tag == b"I":
+            return int.from_bytes(data, "little", signed=True), start + size
+        return str(data, "utf-8", "surrogatepass"), start + size
+    raise ValueError("Punto de control inválido")
+
+
+def capture(executor, key=None):
+    # Estado actual de VCIExecutor o VCIMachine; `key` evita recalcular el hash
+    state = executor.state()
+    return Checkpoint(key or program_hash(executor.program), state.ip, state.steps,
+                      state.variables, list(executor.stack))
+
+
+def write_checkpoint(checkpoint, names, path):
+    slot_of = {name: slot for slot, name in enumerate(names)}
+    out = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, bytes.fromhex(checkpoint.program_hash), checkpoint.ip,
+                                -1 if checkpoint.steps is None else checkpoint.steps,
+                                len(checkpoint.variables), len(checkpoint.stack)))
+    for name, value in checkpoint.variables.items():
+        out += SIZE.pack(slot_of[name])
+        _encode_value(value, out)
+    for value in checkpoint.stack:
+        _encode_value(value, out)
+    # Se escribe aparte y se reemplaza: un corte a mitad de escritura no pierde el anterior
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as f:
+        f.write(out)
+    os.replace(temp, path)
+
+
+def load_checkpoint(path, program):
+    # Las ranuras de las variables son las de `program`, que debe ser el mismo programa
+    with open(path, "rb") as f:
+        view = f.read()
+    if len(view) < HEADER.size:
+        raise ValueError(f"Punto de control inválido: {path}")
+    magic, version, digest, ip, steps, variable_count, stack_count = HEADER.unpack_from(view)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"Punto de control inválido o de otra versión: {path}")
+    if digest.hex() != program_hash(program):
+        raise ValueError(f"El punto de control es de otro programa: {path}")
+    names = program.names
+    try:
+        position = HEADER.size
+        variables = {}
+        for _ in range(variable_count):
+            (slot,) = SIZE.unpack_from(view, position)
+            variables[names[slot]], position = _decode_value(view, position + SIZE.size)
+        stack = []
+        for _ in range(stack_count):
+            value, position = _decode_value(view, position)
+            stack.append(value)
+    except (struct.error, IndexError):
+        raise ValueError(f"Punto de control truncado: {path}")
+    return Checkpoint(digest.hex(), ip, None if steps < 0 else steps, variables, stack)
+
+
+def restore(executor, checkpoint):
+    # Comprueba que el punto de control (Checkpoint o ruta) es del programa del
+    # ejecutor y devuelve el Checkpoint; el ejecutor copia ip, variables y pila
+    program = executor.program
+    if not isinstance(checkpoint, Checkpoint):
+        checkpoint = load_checkpoint(checkpoint, program)
+    elif checkpoint.program_hash != program_hash(program):
+        raise ValueError("El punto de control es de otro programa")
+    if not 0 <= checkpoint.ip <= len(program):
+        raise ValueError(f"Instrucción fuera del programa en el punto de control: {checkpoint.ip}")
+    if executor.controller is not None and checkpoint.steps is not None:
+        executor.controller.steps = checkpoint.steps
+    return checkpoint
+
+
+# Guarda puntos de control periódicos desde ExecutionController.check_in: cada
+# `every_steps` instrucciones y/o cada `every_seconds` segundos, y al detenerse la
+# ejecución (presupuesto, tiempo o cancelación). Los intervalos se cumplen con la
+# precisión de check_every del controlador; fuera de check_in no cuesta nada.
+class Checkpointer:
+    def __init__(self, path, every_steps=None, every_seconds=None):
+        self.path = path
+        self.every_steps = every_steps
+        self.every_seconds = every_seconds
+        self.saved = 0
+        self._program = None
+        self._key = None
+        self._next_steps = None
+        self._next_time = None
+
+    def start(self, steps):
+        self._next_steps = steps + self.every_steps if self.every_steps else None
+        self._next_time = time.monotonic() + self.every_seconds if self.every_seconds else None
+
+    def check(self, executor, steps, stopping):
+        due = stopping or (self._next_steps is not None and steps >= self._next_steps)
+        if not due and self._next_time is not None and time.monotonic() >= self._next_time:
+            due = True
+        if due:
+            self.save(executor)
+            self.start(steps)
+
+    def save(self, executor):
+        program = executor.program
+        if self._program is not program:
+            self._program, self._key = program, program_hash(program)
+        write_checkpoint(capture(executor, self._key), program.names, self.path)
+        self.saved += 1
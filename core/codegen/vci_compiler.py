@@ -0,0 +1,177 @@
+import hashlib
+import math
+from collections import OrderedDict
+
+from core.codegen.vci_linker import LinkedProgram, Opcode, link, parse_constant
+from core.codegen.vci_io import ConsoleInput, ConsoleOutput
+
+# Programas ya compilados, indexados por el hash del programa enlazado (LRU)
+CACHE_SIZE = 64
+_cache = OrderedDict()
+
+FALSY = "('false', False, 0, '0', None, '')"
+ARITHMETIC = {Opcode.ADD: "+", Opcode.SUB: "-", Opcode.MUL: "*"}
+COMPARISONS = {Opcode.LT: "<", Opcode.LE: "<=", Opcode.GT: ">", Opcode.GE: ">="}
+
+
+def program_hash(program):
+    labels = [instr.arg1 for (opcode, *_), instr in zip(program.rows(), program.source) if opcode == Opcode.ESCRIBIR]
+    data = repr((bytes(program.code), program.names, program.constants, labels))
+    return hashlib.sha256(data.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+# Traduce el programa enlazado a una función de Python. Cada variable y temporal es una
+# variable local v<ranura> (con w<ranura> marcando si ya se asignó) y cada bloque básico
+# es una rama de un árbol de if sobre el número de bloque `b`, así que un salto cuesta
+# O(log bloques) comparaciones y el código de un bloque corre sin despacho.
+class PythonTranslator:
+    def __init__(self, program):
+        self.program = program
+        self.rows = program.rows()
+        self.namespace = {"parse_constant": parse_constant, "SLOTS": {n: i for i, n in enumerate(program.names)}}
+        self.lines = []
+
+    def translate(self):
+        rows = self.rows
+        size = len(rows)
+        leaders = {0}
+        for index, (opcode, a, b, c) in enumerate(rows):
+            if opcode in (Opcode.GOTO, Opcode.IF_FALSE):
+                leaders.update((c, index + 1))
+        starts = sorted(leader for leader in leaders if leader < size)
+        self.block_of = {start: block for block, start in enumerate(starts)}
+        self.block_of[size] = len(starts)
+        self.blocks = [(start, end) for start, end in zip(starts, starts[1:] + [size])]
+
+        slots = range(len(self.program.names))
+        self.emit(0, "def run(read, write):")
+        for slot, name in enumerate(self.program.names):
+            self.emit(1, f"v{slot} = {name!r}")
+            self.emit(1, f"w{slot} = False")
+        self.emit(1, "b = 0")
+        self.emit(1, f"while b < {len(self.blocks)}:")
+        if self.blocks:
+            self.dispatch(0, len(self.blocks), 2)
+        else:
+            self.emit(2, "break")
+        values = "".join(f"v{slot}, " for slot in slots)
+        flags = "".join(f"w{slot}, " for slot in slots)
+        self.emit(1, f"return ({values}), ({flags})")
+        return "\n".join(self.lines) + "\n"
+
+    def emit(self, indent, line):
+        # Un espacio por nivel: el árbol de bloques anida mucho en programas grandes
+        self.lines.append(" " * indent + line)
+
+    def dispatch(self, low, high, indent):
+        if high - low == 1:
+            self.block(low, indent)
+            return
+        middle = (low + high) // 2
+        self.emit(indent, f"if b < {middle}:")
+        self.dispatch(low, middle, indent + 1)
+        self.emit(indent, "else:")
+        self.dispatch(middle, high, indent + 1)
+
+    def block(self, block, indent):
+        start, end = self.blocks[block]
+        following = block + 1
+        for index in range(start, end):
+            opcode, a, b, c = self.rows[index]
+            if opcode == Opcode.GOTO:
+                self.emit(indent, f"b = {self.block_of[c]}")
+                return
+            if opcode == Opcode.IF_FALSE:
+                self.emit(indent, f"b = {self.block_of[c]} if {self.operand(a)} in {FALSY} else {following}")
+                return
+            self.instruction(index, opcode, a, b, c, indent)
+        self.emit(indent, f"b = {following}")
+
+    def instruction(self, index, opcode, a, b, c, indent):
+        left, right, target = self.operand(a), self.operand(b), f"v{c}"
+        if opcode == Opcode.ESCRIBIR:
+            label = self.constant(self.program.source[index].arg1, f"A{index}")
+            self.emit(indent, f"write({label}, {left})")
+            return
+        if opcode == Opcode.LEER:
+            self.emit(indent, f"text = read({self.program.names[c]!r})")
+            self.emit(indent, "slot = SLOTS.get(text)")
+            self.emit(indent, "scope = locals()")
+            self.emit(indent, f"{target} = scope[f'v{{slot}}'] if slot is not None and scope[f'w{{slot}}'] "
+                              f"else parse_constant(text)")
+        elif opcode == Opcode.ASSIGN:
+            self.emit(indent, f"{target} = {left}")
+        elif opcode in (Opcode.EQ, Opcode.NE):
+            self.emit(indent, f"{target} = {left} {'==' if opcode == Opcode.EQ else '!='} {right}")
+        elif opcode == Opcode.AND:
+            self.emit(indent, f"{target} = {left} not in {FALSY} and {right} not in {FALSY}")
+        elif opcode == Opcode.OR:
+            self.emit(indent, f"{target} = {left} not in {FALSY} or {right} not in {FALSY}")
+        else:
+            # Mismos resultados que apply_operator y compare ante TypeError o división por cero
+            if opcode == Opcode.DIV:
+                expression, fallback = f"{left} / {right} if {right} != 0 else 0", "0"
+            elif opcode in ARITHMETIC:
+                expression, fallback = f"{left} {ARITHMETIC[opcode]} {right}", "0"
+            else:
+                expression, fallback = f"{left} {COMPARISONS[opcode]} {right}", "False"
+            self.emit(indent, "try:")
+            self.emit(indent + 1, f"{target} = {expression}")
+            self.emit(indent, "except TypeError:")
+            self.emit(indent + 1, f"{target} = {fallback}")
+        self.emit(indent, f"w{c} = True")
+
+    def operand(self, ref):
+        if ref >= 0:
+            return f"v{ref}"
+        value = self.program.constants[~ref]
+        if isinstance(value, float) and not math.isfinite(value):
+            return self.constant(value, f"K{~ref}")
+        return repr(value)
+
+    def constant(self, value, name):
+        self.namespace[name] = value
+        return name
+
+
+def compile_program(program):
+    # Devuelve la función compilada del programa, traduciéndolo solo la primera vez
+    key = program_hash(program)
+    run = _cache.get(key)
+    if run is not None:
+        _cache.move_to_end(key)
+        return run
+    translator = PythonTranslator(program)
+    source = translator.translate()
+    namespace = translator.namespace
+    exec(compile(source, f"<vci {key[:12]}>", "exec"), namespace)
+    run = _cache[key] = namespace["run"]
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return run
+
+
+# Motor que ejecuta el programa traducido a Python. Termina con las mismas variables y
+# la misma salida que VCIExecutor; no tiene traza ni pila de resultados.
+class CompiledExecutor:
+    def __init__(self, instructions, reader=None, writer=None):
+        self.program = instructions if isinstance(instructions, LinkedProgram) else link(instructions)
+        self.run = compile_program(self.program)
+        self.reader = reader or ConsoleInput()
+        self.writer = writer or ConsoleOutput()
+        self.variables = {}
+
+    def execute(self):
+        try:
+            values, written = self.run(self.reader.read, self.writer.write)
+        finally:
+            self.writer.flush()
+        self.variables = {name: value for name, value, assigned in zip(self.program.names, values, written) if assigned}
+
+    def export_variables(self, path):
+        import csv
+        with open(path, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Variable", "Valor"])
+            for k, v in self.variables.items():
+                writer.writerow([k, v])
@@ -0,0 +1,82 @@
+import threading
+import time
+
+CANCELLED = "cancelado"
+BUDGET = "límite de instrucciones"
+TIMEOUT = "tiempo agotado"
+
+
+# Control cooperativo de una ejecución. El ejecutor llama a `check_in` cada
+# `check_every` instrucciones (o antes, para no pasarse de `max_steps`); ahí se
+# detiene si se canceló, se agotó el presupuesto de instrucciones o pasó `timeout`
+# (segundos de reloj desde `start`, incluidas las pausas), y espera mientras esté en
+# pausa. pause, resume y cancel se pueden llamar desde otro hilo. Con `checkpoint`
+# (un Checkpointer de core/codegen/vci_checkpoint.py) guarda además puntos de control
+# del ejecutor en los check_in que correspondan.
+class ExecutionController:
+    def __init__(self, max_steps=None, timeout=None, check_every=1000, checkpoint=None):
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.check_every = check_every
+        self.checkpoint = checkpoint
+        self.executor = None
+        self.steps = 0
+        self.reason = None
+        self.deadline = None
+        self.interval = 0
+        self._cancelled = False
+        self._running = threading.Event()
+        self._running.set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def cancel(self):
+        self._cancelled = True
+        self._running.set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def start(self, executor=None):
+        # Devuelve cuántas instrucciones ejecutar antes del primer check_in
+        self.executor = executor
+        self.reason = None
+        if self.checkpoint is not None:
+            self.checkpoint.start(self.steps)
+        self.deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        self.interval = self._next_interval()
+        return self.interval
+
+    def check_in(self):
+        # Devuelve las instrucciones hasta el siguiente check_in, o 0 para detenerse
+        self.steps += self.interval
+        self._running.wait()
+        if self._cancelled:
+            self.reason = CANCELLED
+        elif self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = TIMEOUT
+        elif self.max_steps is not None and self.steps >= self.max_steps:
+            self.reason = BUDGET
+        if self.checkpoint is not None:
+            self.checkpoint.check(self.executor, self.steps, self.reason is not None)
+        self.interval = 0 if self.reason else self._next_interval()
+        return self.interval
+
+    def finish(self, countdown):
+        # Instrucciones del último tramo que no llegó a un check_in
+        self.steps += self.interval - countdown
+        self.interval = 0
+
+    def _next_interval(self):
+        if self.max_steps is None:
+            return self.check_every
+        return max(0, min(self.check_every, self.max_steps - self.steps))
@@ -1,112 +1,153 @@
-from models.vci_instruction import VCIInstruction
+import operator
+
+from core.codegen.vci_linker import OPCODES, LinkedProgram, Opcode, link, parse_constant
+from core.codegen.vci_trace import HEADER
+from core.codegen.vci_io import ConsoleInput, ConsoleOutput
+from core.codegen.vci_checkpoint import restore
+from models.execution_state import ExecutionState
+
+COMPARISONS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt,
+    ">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+}
+
+OPERATIONS = {opcode: operation for operation, opcode in OPCODES.items()}
+
+
+def is_true(val):
+    return val not in ["false", False, 0, "0", None, ""]
+
+
+def apply_operator(op, left, right):
+    try:
+        if op == "+": return left + right
+        if op == "-": return left - right
+        if op == "*": return left * right
+        if op == "/": return left / right if right != 0 else 0
+    except TypeError:
+        return 0
+
+
+def compare(op, left, right):
+    if op == "&&":
+        return is_true(left) and is_true(right)
+    if op == "||":
+        return is_true(left) or is_true(right)
+    try:
+        return COMPARISONS[op](left, right)
+    except TypeError:
+        return False
+
 
 class VCIExecutor:
-    def __init__(self, instructions):
-        self.instructions = instructions
+    def __init__(self, instructions, trace=None, reader=None, writer=None, controller=None):
+        # Acepta la lista de VCIInstruction (se enlaza aquí) o un LinkedProgram ya enlazado.
+        # `trace` es una traza de core/codegen/vci_trace.py; None no registra nada.
+        # `reader` y `writer` son proveedores de core/codegen/vci_io.py (consola por defecto).
+        # `controller` (core/codegen/vci_control.py) limita y puede pausar o cancelar la
+        # ejecución; si la detiene, execute() se puede volver a llamar para continuar, y
+        # resume() continúa desde un punto de control guardado (core/codegen/vci_checkpoint.py).
+        self.program = instructions if isinstance(instructions, LinkedProgram) else link(instructions)
+        self.instructions = self.program.source
+        self.trace = trace
+        self.controller = controller
+        self.reader = reader or ConsoleInput()
+        self.writer = writer or ConsoleOutput()
         self.stack = []
-        self.labels = self._build_label_table()
         self.variables = {}
         self.ip = 0  # Instruction pointer
         self.output_steps = []
-        self.execution_trace = []
-
-    def _build_label_table(self):
-        labels = {}
-        for i, instr in enumerate(self.instructions):
-            if isinstance(instr, VCIInstruction) and instr.operation == "LABEL":
-                labels[instr.result] = i
-        return labels
 
     def execute(self):
-        while self.ip < len(self.instructions):
-            instr = self.instructions[self.ip]
-            op = instr.operation
-
-            snapshot = {
-                "Operación": instr.operation,
-                "Arg1": instr.arg1,
-                "Arg2": instr.arg2,
-                "Resultado": instr.result,
-                "Stack": list(self.stack),
-                "Variables": dict(self.variables)
-            }
-
-            jumped = False
-
-            if op == "=":
-                val = self._get_value(instr.arg1)
-                self.variables[instr.result] = val
-                self.stack.append(val)
-
-            elif op in {"+", "-", "*", "/"}:
-                left = self._get_value(instr.arg1)
-                right = self._get_value(instr.arg2)
-                result = self._apply_operator(op, left, right)
-                self.variables[instr.result] = result
-                self.stack.append(result)
-
-            elif op == "IF_FALSE":
-                cond = self._get_value(instr.arg1)
-                if not self._is_true(cond):
-                    self.execution_trace.append(snapshot)
-                    self.ip = self.labels.get(instr.result.split()[-1], self.ip)
-                    jumped = True
-
-
-            elif op == "GOTO":
-                self.execution_trace.append(snapshot)
-                self.ip = self.labels.get(instr.result, self.ip)
-                jumped = True
-
-            elif op == "LEER":
-                val = input(f"Ingrese valor para {instr.result}: ")
-                self.variables[instr.result] = self._get_value(val)
-
-            elif op == "ESCRIBIR":
-                val = self._get_value(instr.arg1)
-                print(f"{instr.arg1} = {val}")
-
-            elif op == "LABEL":
-                pass  # Track only
-
-            if not jumped:
-                self.execution_trace.append(snapshot)
-                self.ip += 1
-
-    def _get_value(self, val):
-        if val in self.variables:
-            return self.variables[val]
+        program = self.program
+        # Una tupla (opcode, a, b, c) por instrucción, armada una vez por programa
+        code = program.rows()
+        size = len(program)
+        names = program.names
+        constants = program.constants
+        variables = self.variables
+        # Una variable sin asignar se lee como su propio nombre
+        values = [variables.get(name, name) for name in names]
+        trace = self.trace
+        record = trace.record if trace is not None else None
+        # La pila de resultados solo se conserva si la traza la registra
+        stack = self.stack if trace is not None and trace.keeps_state else None
+        instructions = self.instructions
+        read, write = self.reader.read, self.writer.write
+        controller = self.controller
+        countdown = controller.start(self) if controller is not None else None
+        if trace is not None:
+            trace.start(program)
         try:
-            return float(val) if "." in val else int(val)
-        except (ValueError, TypeError):
-            return val
-
-    def _is_true(self, val):
-        return val not in ["false", False, 0, "0", None, ""]
-
-    def _apply_operator(self, op, left, right):
-        try:
-            if op == "+": return left + right
-            if op == "-": return left - right
-            if op == "*": return left * right
-            if op == "/": return left / right if right != 0 else 0
-        except TypeError:
-            return 0
+            while self.ip < size:
+                if countdown is not None:
+                    if not countdown:
+                        countdown = controller.check_in()
+                        if not countdown:
+                            break
+                    countdown -= 1
+                ip = self.ip
+                opcode, a, b, c = code[ip]
+                if record is not None:
+                    record(ip, stack, variables)
+                self.ip = ip + 1
+
+                if opcode == Opcode.GOTO:
+                    self.ip = c
+                    continue
+
+                left = values[a] if a >= 0 else constants[~a]
+
+                if opcode == Opcode.IF_FALSE:
+                    if not is_true(left):
+                        self.ip = c
+
+                elif opcode == Opcode.ESCRIBIR:
+                    write(instructions[ip].arg1, left)
+
+                elif opcode == Opcode.LEER:
+                    text = read(names[c])
+                    values[c] = variables[names[c]] = variables[text] if text in variables else parse_constant(text)
+
+                else:
+                    if opcode == Opcode.ASSIGN:
+                        result = left
+                    else:
+                        right = values[b] if b >= 0 else constants[~b]
+                        operation = OPERATIONS[opcode]
+                        result = apply_operator(operation, left, right) if opcode <= Opcode.DIV \
+                            else compare(operation, left, right)
+                    values[c] = variables[names[c]] = result
+                    if stack is not None:
+                        stack.append(result)
+        finally:
+            if controller is not None:
+                controller.finish(countdown)
+            self.writer.flush()
+            if trace is not None:
+                trace.finish()
+
+    def resume(self, checkpoint):
+        # Continúa desde un punto de control (Checkpoint o ruta) de este mismo programa
+        checkpoint = restore(self, checkpoint)
+        self.ip = checkpoint.ip
+        self.variables = dict(checkpoint.variables)
+        self.stack = list(checkpoint.stack)
+        self.execute()
+
+    def state(self):
+        controller = self.controller
+        return ExecutionState(self.ip, controller.steps if controller else None, dict(self.variables),
+                              controller.reason if controller else None)
 
     def export_execution_table(self, path):
+        if self.trace is not None:
+            self.trace.export(path)
+            return
+        # Sin traza solo se escribe la cabecera
         import csv
         with open(path, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Operación", "Arg1", "Arg2", "Resultado", "Stack", "Variables"])
-            for step in self.execution_trace:
-                writer.writerow([
-                    step["Operación"],
-                    step["Arg1"],
-                    step["Arg2"],
-                    step["Resultado"],
-                    str(step["Stack"]),
-                    str(step["Variables"])
-                ])
+            csv.writer(f).writerow(HEADER)
 
     def export_variables(self, path):
         import csv
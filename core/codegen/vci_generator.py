@@ -1,32 +1,44 @@
 from models.vci_instruction import VCIInstruction
 from models.ast_node import ASTNode
+from models.ast_arena import ASTArena, NodeKind
+from core.codegen.vci_binary import write_program
+from core.codegen.vci_linker import link
+
+STATEMENTS = {"ASIGNACION", "LEER", "ESCRIBIR", "SI", "MIENTRAS", "REPETIR"}
+ARENA_STATEMENTS = {NodeKind[kind] for kind in STATEMENTS}
 
 class VCIGenerator:
-    def __init__(self):
+    def __init__(self, token_lines=None):
+        # `token_lines`: línea de cada token (índice de token -> línea) para anotar cada
+        # instrucción con la línea de su sentencia (VCIInstruction.line)
+        self.token_lines = token_lines
         self.instructions = []
         self.temp_count = 0
         self.label_count = 0
 
     def generate(self, node: ASTNode):
+        first = len(self.instructions)
         if node.type == "ASIGNACION":
             target = node.children[0].value
-            value_expr = node.children[1]
-            result = self.evaluate_expr(value_expr.children[0])
-            self.instructions.append(VCIInstruction("=", result, "", target))
+            value_expr = node.children[1].children[0]
+            result = self.evaluate_expr(value_expr)
+            self.instructions.append(VCIInstruction("=", result, "", target, value_expr.data_type or ""))
 
         elif node.type == "LEER":
-            var = node.children[0].value
-            self.instructions.append(VCIInstruction("LEER", "", "", var))
+            var = node.children[0]
+            self.instructions.append(VCIInstruction("LEER", "", "", var.value, var.data_type or ""))
 
         elif node.type == "ESCRIBIR":
-            val = self.evaluate_expr(node.children[0].children[0])
-            self.instructions.append(VCIInstruction("ESCRIBIR", val, "", ""))
+            expr = node.children[0].children[0]
+            val = self.evaluate_expr(expr)
+            self.instructions.append(VCIInstruction("ESCRIBIR", val, "", "", expr.data_type or ""))
 
         elif node.type == "SI":
-            cond = self.evaluate_expr(node.children[0].children[0])
+            condition = node.children[0].children[0]
+            cond = self.evaluate_expr(condition)
             label_else = self.new_label()
             label_end = self.new_label()
-            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_else}"))
+            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_else}", condition.data_type or ""))
             self.generate(node.children[1])  # BLOQUE_SI
             if len(node.children) == 3:
                 self.instructions.append(VCIInstruction("GOTO", "", "", label_end))
@@ -40,8 +52,9 @@ class VCIGenerator:
             label_start = self.new_label()
             label_end = self.new_label()
             self.instructions.append(VCIInstruction("LABEL", "", "", label_start))
-            cond = self.evaluate_expr(node.children[0].children[0])
-            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_end}"))
+            condition = node.children[0].children[0]
+            cond = self.evaluate_expr(condition)
+            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_end}", condition.data_type or ""))
             self.generate(node.children[1])  # CUERPO
             self.instructions.append(VCIInstruction("GOTO", "", "", label_start))
             self.instructions.append(VCIInstruction("LABEL", "", "", label_end))
@@ -50,27 +63,140 @@ class VCIGenerator:
             label_start = self.new_label()
             self.instructions.append(VCIInstruction("LABEL", "", "", label_start))
             self.generate(node.children[0])  # CUERPO
-            cond = self.evaluate_expr(node.children[1].children[0])
-            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_start}"))
+            condition = node.children[1].children[0]
+            cond = self.evaluate_expr(condition)
+            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_start}", condition.data_type or ""))
 
         elif node.type in {"INSTRUCCIONES", "BLOQUE", "BLOQUE_SI", "BLOQUE_SINO", "CUERPO", "PROGRAMA"}:
             for child in node.children:
                 self.generate(child)
 
+        if node.type in STATEMENTS:
+            self.mark_line(node.start, first)
+
     def evaluate_expr(self, node: ASTNode):
-        if node.type == "LITERAL":
-            return node.value
-        elif node.type in {"OPERACION", "COMPARACION"}:
-            left = self.evaluate_expr(node.children[0])
-            right = self.evaluate_expr(node.children[1])
-            temp = self.new_temp()
-            self.instructions.append(VCIInstruction(node.value, left, right, temp))
-            return temp
-        elif node.type == "VALOR":
-            return self.evaluate_expr(node.children[0])
-        elif node.type == "EXPR":
-            return self.evaluate_expr(node.children[0])
-        return "?"
+        # Recorrido en postorden con pila explícita (sin recursión); devuelve el
+        # literal o temporal que contiene el valor de la expresión
+        results = []
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if current.type == "LITERAL":
+                results.append(current.value)
+            elif current.type in {"OPERACION", "COMPARACION"}:
+                if visited:
+                    right = results.pop()
+                    left = results.pop()
+                    temp = self.new_temp()
+                    self.instructions.append(VCIInstruction(current.value, left, right, temp, current.data_type or ""))
+                    results.append(temp)
+                else:
+                    stack.append((current, True))
+                    stack.append((current.children[1], False))
+                    stack.append((current.children[0], False))
+            elif current.type in {"VALOR", "EXPR"}:
+                stack.append((current.children[0], False))
+            else:
+                results.append("?")
+        return results.pop()
+
+    def generate_arena(self, arena: ASTArena, index=None):
+        # Igual que generate pero sobre el AST compacto, donde los envoltorios
+        # (CONDICION, CUERPO, VALOR, ...) no existen y cada hijo ocupa su posición
+        index = arena.root if index is None else index
+        kind = arena.kinds[index]
+        first = len(self.instructions)
+        if kind == NodeKind.ASIGNACION:
+            target, value = arena.children(index)
+            result = self.evaluate_arena_expr(arena, value)
+            self.instructions.append(VCIInstruction("=", result, "", arena.value(target), arena.data_type(value) or ""))
+
+        elif kind == NodeKind.LEER:
+            var = arena.first_child[index]
+            self.instructions.append(VCIInstruction("LEER", "", "", arena.value(var), arena.data_type(var) or ""))
+
+        elif kind == NodeKind.ESCRIBIR:
+            expr = arena.first_child[index]
+            val = self.evaluate_arena_expr(arena, expr)
+            self.instructions.append(VCIInstruction("ESCRIBIR", val, "", "", arena.data_type(expr) or ""))
+
+        elif kind == NodeKind.SI:
+            children = list(arena.children(index))
+            cond = self.evaluate_arena_expr(arena, children[0])
+            label_else = self.new_label()
+            label_end = self.new_label()
+            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_else}", arena.data_type(children[0]) or ""))
+            self.generate_arena(arena, children[1])
+            if len(children) == 3:
+                self.instructions.append(VCIInstruction("GOTO", "", "", label_end))
+                self.instructions.append(VCIInstruction("LABEL", "", "", label_else))
+                self.generate_arena(arena, children[2])
+                self.instructions.append(VCIInstruction("LABEL", "", "", label_end))
+            else:
+                self.instructions.append(VCIInstruction("LABEL", "", "", label_else))
+
+        elif kind == NodeKind.MIENTRAS:
+            condition, body = arena.children(index)
+            label_start = self.new_label()
+            label_end = self.new_label()
+            self.instructions.append(VCIInstruction("LABEL", "", "", label_start))
+            cond = self.evaluate_arena_expr(arena, condition)
+            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_end}", arena.data_type(condition) or ""))
+            self.generate_arena(arena, body)
+            self.instructions.append(VCIInstruction("GOTO", "", "", label_start))
+            self.instructions.append(VCIInstruction("LABEL", "", "", label_end))
+
+        elif kind == NodeKind.REPETIR:
+            body, condition = arena.children(index)
+            label_start = self.new_label()
+            self.instructions.append(VCIInstruction("LABEL", "", "", label_start))
+            self.generate_arena(arena, body)
+            cond = self.evaluate_arena_expr(arena, condition)
+            self.instructions.append(VCIInstruction("IF_FALSE", cond, "", f"GOTO {label_start}", arena.data_type(condition) or ""))
+
+        elif kind in (NodeKind.BLOQUE, NodeKind.PROGRAMA):
+            for child in arena.children(index):
+                self.generate_arena(arena, child)
+
+        if kind in ARENA_STATEMENTS:
+            self.mark_line(arena.starts[index], first)
+
+    def evaluate_arena_expr(self, arena: ASTArena, index):
+        # Postorden con pila de índices; los nodos visitados se marcan negando el índice
+        kinds = arena.kinds
+        first_child = arena.first_child
+        results = []
+        stack = [index]
+        while stack:
+            current = stack.pop()
+            if current < 0:
+                current = ~current
+                right = results.pop()
+                left = results.pop()
+                temp = self.new_temp()
+                self.instructions.append(VCIInstruction(arena.value(current), left, right, temp, arena.data_type(current) or ""))
+                results.append(temp)
+            elif kinds[current] == NodeKind.LITERAL:
+                results.append(arena.value(current))
+            elif kinds[current] in (NodeKind.OPERACION, NodeKind.COMPARACION):
+                left = first_child[current]
+                stack.append(~current)
+                stack.append(arena.next_sibling[left])
+                stack.append(left)
+            else:
+                results.append("?")
+        return results.pop()
+
+    def mark_line(self, start, first):
+        # Las instrucciones de la sentencia sin línea (las de sentencias anidadas ya la
+        # tienen) toman la línea de su primer token
+        if self.token_lines is None or start < 0:
+            return
+        line = self.token_lines[start]
+        instructions = self.instructions
+        for position in range(first, len(instructions)):
+            if instructions[position].line < 0:
+                instructions[position].line = line
 
     def new_temp(self):
         t = f"t{self.temp_count}"
@@ -90,6 +216,10 @@ class VCIGenerator:
             for i in self.instructions:
                 writer.writerow([i.operation, i.arg1, i.arg2, i.result])
 
+    def export_to_binary(self, path="output/vci.vcib"):
+        # VCI enlazado en formato binario; se carga con vci_binary.load_program
+        write_program(link(self.instructions), path)
+
     def print_ast_debug(self, node, indent=0):
         print("  " * indent + f"{node.type}: {node.value}")
         for child in node.children:
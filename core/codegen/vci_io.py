@@ -0,0 +1,126 @@
+import asyncio
+import sys
+from collections import deque
+
+PROMPT = "Ingrese valor para {}: "
+
+
+# Proveedores de entrada y salida de los ejecutores del VCI. LEER llama a
+# `reader.read(nombre)`, que devuelve el texto leído (EOFError si no hay más) y
+# ESCRIBIR llama a `writer.write(etiqueta, valor)`; el ejecutor llama a
+# `writer.flush()` al terminar, también si la ejecución se interrumpe.
+class ConsoleInput:
+    def read(self, name):
+        return input(PROMPT.format(name))
+
+
+# Una línea por LEER de un archivo o flujo de texto abierto, sin pedirla con un prompt
+class StreamInput:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def read(self, name):
+        line = self.stream.readline()
+        if not line:
+            raise EOFError(f"Sin entrada para {name}")
+        # Igual que input(): solo se quita el salto de línea final
+        return line[:-1] if line.endswith("\n") else line
+
+
+# Valores preparados de antemano; se pueden seguir agregando con `put`
+class QueueInput:
+    def __init__(self, values=()):
+        self.values = deque(str(value) for value in values)
+
+    def put(self, value):
+        self.values.append(str(value))
+
+    def read(self, name):
+        if not self.values:
+            raise EOFError(f"Sin entrada para {name}")
+        return self.values.popleft()
+
+
+class ConsoleOutput:
+    def write(self, label, value):
+        print(f"{label} = {value}")
+
+    def flush(self):
+        pass
+
+
+# Acumula las líneas y las escribe juntas cada `flush_lines` líneas y al terminar.
+# Sin `stream` escribe en sys.stdout (el vigente al vaciar el búfer).
+class BufferedOutput:
+    def __init__(self, stream=None, flush_lines=1024):
+        self.stream = stream
+        self.flush_lines = flush_lines
+        self.pending = []
+
+    def write(self, label, value):
+        self.pending.append(f"{label} = {value}")
+        if len(self.pending) >= self.flush_lines:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            stream = self.stream or sys.stdout
+            stream.write("\n".join(self.pending) + "\n")
+            self.pending.clear()
+
+
+# Guarda las líneas en memoria, para scripts y pruebas
+class ListOutput:
+    def __init__(self):
+        self.lines = []
+
+    def write(self, label, value):
+        self.lines.append(f"{label} = {value}")
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "".join(line + "\n" for line in self.lines)
+
+
+# Conecta un ejecutor con corrutinas de asyncio. El ejecutor corre en un hilo (`run`)
+# y usa el canal como reader y writer: LEER espera el siguiente valor enviado con
+# `send` y cada línea de ESCRIBIR se recibe con `receive`, que devuelve None cuando
+# el programa terminó. Así un mismo loop atiende muchos programas a la vez; los hilos
+# salen del executor por defecto del loop, que limita cuántos avanzan en paralelo.
+class AsyncChannel:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.inputs = asyncio.Queue()
+        self.outputs = asyncio.Queue()
+
+    def read(self, name):
+        value = asyncio.run_coroutine_threadsafe(self.inputs.get(), self.loop).result()
+        if value is None:
+            raise EOFError(f"Sin entrada para {name}")
+        return value
+
+    def write(self, label, value):
+        self.loop.call_soon_threadsafe(self.outputs.put_nowait, f"{label} = {value}")
+
+    def flush(self):
+        pass
+
+    async def send(self, value):
+        await self.inputs.put(str(value))
+
+    async def close(self):
+        # Las lecturas siguientes terminan con EOFError
+        await self.inputs.put(None)
+
+    async def receive(self):
+        return await self.outputs.get()
+
+    async def run(self, executor):
+        try:
+            await asyncio.to_thread(executor.execute)
+        finally:
+            # Las líneas del hilo ya están encoladas en el loop antes que este None
+            self.loop.call_soon(self.outputs.put_nowait, None)
+        return executor
@@ -0,0 +1,137 @@
+import csv
+from array import array
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import List
+
+from models.vci_instruction import VCIInstruction
+
+Opcode = IntEnum("Opcode", [
+    "ASSIGN", "ADD", "SUB", "MUL", "DIV",
+    "LT", "LE", "GT", "GE", "EQ", "NE", "AND", "OR",
+    "IF_FALSE", "GOTO", "LEER", "ESCRIBIR",
+], start=0)
+
+OPCODES = {
+    "=": Opcode.ASSIGN, "+": Opcode.ADD, "-": Opcode.SUB, "*": Opcode.MUL, "/": Opcode.DIV,
+    "<": Opcode.LT, "<=": Opcode.LE, ">": Opcode.GT, ">=": Opcode.GE, "==": Opcode.EQ, "!=": Opcode.NE,
+    "&&": Opcode.AND, "||": Opcode.OR,
+    "IF_FALSE": Opcode.IF_FALSE, "GOTO": Opcode.GOTO, "LEER": Opcode.LEER, "ESCRIBIR": Opcode.ESCRIBIR,
+}
+
+FIELDS = 4  # opcode, a, b, c por instrucción
+
+
+def parse_constant(val):
+    # Valor de un operando que no es variable: entero, real o el texto tal cual
+    try:
+        return float(val) if "." in val else int(val)
+    except (ValueError, TypeError):
+        return val
+
+
+def is_variable(text):
+    # Las variables y temporales empiezan con letra; true/false son constantes
+    return text[:1].isalpha() and text not in ("true", "false")
+
+
+# Programa VCI enlazado: código plano de enteros (opcode, a, b, c) sin LABEL, con los
+# destinos de salto resueltos a índices y los operandos como referencias: a >= 0 es
+# una variable de `names` y a < 0 la constante ~a de `constants`. `source` conserva
+# las instrucciones originales (sin etiquetas) para exportarlas e inspeccionarlas.
+@dataclass
+class LinkedProgram:
+    code: array = field(default_factory=lambda: array("i"))
+    constants: list = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    source: List[VCIInstruction] = field(default_factory=list)
+    _rows: list = field(default=None, init=False, repr=False, compare=False)
+
+    def __len__(self):
+        return len(self.code) // FIELDS
+
+    def rows(self):
+        # Tuplas (opcode, a, b, c) por instrucción; se arman la primera vez y se comparten
+        if self._rows is None:
+            code = self.code
+            self._rows = list(zip(code[0::FIELDS], code[1::FIELDS], code[2::FIELDS], code[3::FIELDS]))
+        return self._rows
+
+    def close(self):
+        # Solo los programas cargados de un archivo (vci_binary.load_program) retienen recursos
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def export_to_csv(self, path="output/vci_linked.csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Índice", "Código", "A", "B", "C", "Operación", "Arg1", "Arg2", "Resultado"])
+            for index, ((opcode, a, b, c), instr) in enumerate(zip(self.rows(), self.source)):
+                writer.writerow([index, Opcode(opcode).name, a, b, c,
+                                 instr.operation, instr.arg1, instr.arg2, instr.result])
+
+
+class Linker:
+    def __init__(self):
+        self.program = LinkedProgram()
+        self._names = {}
+        self._constants = {}
+
+    def link(self, instructions):
+        # Las etiquetas apuntan a la siguiente instrucción que queda tras quitarlas
+        targets = {}
+        position = 0
+        for instr in instructions:
+            if instr.operation == "LABEL":
+                targets[instr.result] = position
+            else:
+                position += 1
+
+        program = self.program
+        for instr in instructions:
+            op = instr.operation
+            if op == "LABEL":
+                continue
+            if op not in OPCODES:
+                raise ValueError(f"Operación VCI desconocida: {op}")
+            if op in ("GOTO", "IF_FALSE"):
+                label = instr.result.split()[-1]
+                if label not in targets:
+                    raise ValueError(f"Etiqueta no definida: {label}")
+                row = (self.reference(instr.arg1) if op == "IF_FALSE" else 0, 0, targets[label])
+            elif op == "LEER":
+                row = (0, 0, self.variable(instr.result))
+            elif op == "ESCRIBIR":
+                row = (self.reference(instr.arg1), 0, 0)
+            else:
+                row = (self.reference(instr.arg1), self.reference(instr.arg2), self.variable(instr.result))
+            program.code.append(OPCODES[op])
+            program.code.extend(row)
+            program.source.append(instr)
+        return program
+
+    def variable(self, name):
+        index = self._names.get(name)
+        if index is None:
+            index = self._names[name] = len(self.program.names)
+            self.program.names.append(name)
+        return index
+
+    def constant(self, text):
+        index = self._constants.get(text)
+        if index is None:
+            index = self._constants[text] = len(self.program.constants)
+            self.program.constants.append(parse_constant(text))
+        return ~index
+
+    def reference(self, text):
+        return self.variable(text) if is_variable(text) else self.constant(text)
+
+
+def link(instructions):
+    return Linker().link(instructions)
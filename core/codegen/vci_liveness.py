@@ -0,0 +1,104 @@
+from dataclasses import dataclass, replace
+
+from core.codegen.vci_cfg import ControlFlowGraph
+from core.codegen.vci_optimizer import is_temp, read_by
+
+
+@dataclass
+class TempAllocation:
+    temps: int        # temporales distintos antes de asignar
+    slots: int        # temporales (ranuras) después de asignar
+    peak_live: int    # máximo de temporales vivos a la vez
+
+
+def temp_defs_uses(instr):
+    defined = instr.result if is_temp(instr.result) and instr.operation not in ("GOTO", "LABEL", "IF_FALSE") else None
+    used = [arg for arg in (instr.arg1, instr.arg2) if is_temp(arg)]
+    return defined, used
+
+
+def live_out_of_blocks(cfg):
+    # Temporales vivos a la salida de cada bloque (análisis hacia atrás hasta punto fijo)
+    uses, defs = [], []
+    for block in cfg.blocks:
+        used, defined = set(), set()
+        for instr in cfg.instructions[block.start:block.end]:
+            d, u = temp_defs_uses(instr)
+            used.update(arg for arg in u if arg not in defined)
+            if d:
+                defined.add(d)
+        uses.append(used)
+        defs.append(defined)
+
+    live_in = [set() for _ in cfg.blocks]
+    live_out = [set() for _ in cfg.blocks]
+    changed = True
+    while changed:
+        changed = False
+        for block in reversed(cfg.blocks):
+            out = set().union(*(live_in[s] for s in block.successors))
+            new_in = uses[block.index] | (out - defs[block.index])
+            if out != live_out[block.index] or new_in != live_in[block.index]:
+                live_out[block.index], live_in[block.index] = out, new_in
+                changed = True
+    return live_out
+
+
+def interference(instructions):
+    # Grafo de interferencia entre temporales y máximo de temporales vivos a la vez
+    cfg = ControlFlowGraph(instructions)
+    live_out = live_out_of_blocks(cfg)
+    graph = {}
+    peak = 0
+    for block in cfg.blocks:
+        live = set(live_out[block.index])
+        for instr in reversed(instructions[block.start:block.end]):
+            defined, used = temp_defs_uses(instr)
+            if defined:
+                graph.setdefault(defined, set())
+                for other in live - {defined}:
+                    graph[defined].add(other)
+                    graph.setdefault(other, set()).add(defined)
+                peak = max(peak, len(live | {defined}))
+                live.discard(defined)
+            live.update(used)
+            for arg in used:
+                graph.setdefault(arg, set())
+            peak = max(peak, len(live))
+    return graph, peak
+
+
+# Reasigna los temporales a un conjunto mínimo de ranuras reutilizando nombres entre
+# rangos de vida que no se solapan. Debe aplicarse después del PassManager, cuyas
+# pasadas asumen que cada temporal se define una sola vez. Los temporales que lee
+# ESCRIBIR conservan su nombre (se imprime) y una ranura exclusiva.
+def reuse_temps(instructions):
+    graph, peak = interference(instructions)
+    readers = read_by(instructions)
+    pinned = {temp for temp in graph if "ESCRIBIR" in readers.get(temp, ())}
+
+    # Orden de primera definición
+    order = dict.fromkeys(temp_defs_uses(instr)[0] for instr in instructions)
+    order.update(dict.fromkeys(graph))
+    order = [temp for temp in order if temp and temp not in pinned]
+
+    names = (f"t{k}" for k in range(len(graph) + len(pinned) + 1))
+    slots = []
+    assigned = {temp: temp for temp in pinned}
+    for temp in order:
+        taken = {assigned.get(other) for other in graph[temp]}
+        for slot in slots:
+            if slot not in taken:
+                break
+        else:
+            slot = next(name for name in names if name not in pinned)
+            slots.append(slot)
+        assigned[temp] = slot
+
+    renamed = [
+        replace(instr, arg1=assigned.get(instr.arg1, instr.arg1), arg2=assigned.get(instr.arg2, instr.arg2),
+                result=assigned.get(instr.result, instr.result))
+        if instr.operation not in ("GOTO", "LABEL", "IF_FALSE") else replace(instr, arg1=assigned.get(instr.arg1, instr.arg1))
+        for instr in instructions
+    ]
+    return renamed, TempAllocation(len(graph), len(slots) + len(pinned), peak)
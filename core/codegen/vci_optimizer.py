@@ -0,0 +1,295 @@
+import itertools
+import re
+from dataclasses import replace
+
+from models.vci_instruction import VCIInstruction
+from core.codegen.vci_executor import COMPARISONS, is_true, apply_operator, compare
+from core.codegen.vci_linker import is_variable, parse_constant
+from core.codegen.vci_cfg import ControlFlowGraph, jump_target
+
+TEMP_RE = re.compile(r"t\d+")
+ARITHMETIC = {"+", "-", "*", "/"}
+# Operaciones que solo escriben su resultado; se pueden eliminar si nadie lo lee
+VALUE_OPS = ARITHMETIC | set(COMPARISONS) | {"&&", "||", "="}
+PURE_OPS = VALUE_OPS - {"="}
+# Operaciones cuyo resultado no depende del orden de los operandos; + y * solo
+# con operandos numéricos porque + también concatena cadenas
+COMMUTATIVE = {"==", "!=", "&&", "||"}
+NUMERIC_COMMUTATIVE = {"+", "*"}
+
+
+def is_temp(name):
+    return TEMP_RE.fullmatch(name) is not None
+
+
+def is_constant(text):
+    return not is_variable(text)
+
+
+def numeric(text):
+    value = parse_constant(text) if is_constant(text) else None
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def literal(value):
+    # Texto que el ejecutor vuelve a leer como el mismo valor; None si no existe
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    text = repr(value) if isinstance(value, float) else str(value)
+    parsed = parse_constant(text)
+    return text if type(parsed) is type(value) and parsed == value else None
+
+
+def retarget(instr, label):
+    return replace(instr, result=f"GOTO {label}" if instr.operation == "IF_FALSE" else label)
+
+
+def count_uses(instructions):
+    uses = {}
+    for instr in instructions:
+        for arg in (instr.arg1, instr.arg2):
+            if arg:
+                uses[arg] = uses.get(arg, 0) + 1
+    return uses
+
+
+def read_by(instructions):
+    # Operaciones que leen cada nombre
+    readers = {}
+    for instr in instructions:
+        for arg in (instr.arg1, instr.arg2):
+            readers.setdefault(arg, set()).add(instr.operation)
+    return readers
+
+
+def fold_constants(instructions):
+    # Evalúa operaciones entre constantes numéricas y sustituye el temporal por el
+    # literal resultante. Las comparaciones solo se pliegan si su temporal únicamente
+    # alimenta IF_FALSE (el ejecutor guarda True/False, no "true"/"false"), y un
+    # IF_FALSE con condición constante se convierte en GOTO o desaparece.
+    readers = read_by(instructions)
+
+    constants = {}
+    changes = 0
+    optimized = []
+    for instr in instructions:
+        if instr.arg1 in constants or instr.arg2 in constants:
+            instr = replace(instr, arg1=constants.get(instr.arg1, instr.arg1), arg2=constants.get(instr.arg2, instr.arg2))
+        op = instr.operation
+        if is_temp(instr.result) and (op in ARITHMETIC or op in COMPARISONS and readers.get(instr.result) == {"IF_FALSE"}):
+            left, right = numeric(instr.arg1), numeric(instr.arg2)
+            if left is not None and right is not None:
+                if op in ARITHMETIC:
+                    text = literal(apply_operator(op, left, right))
+                else:
+                    text = "true" if compare(op, left, right) else "false"
+                if text is not None and "ESCRIBIR" in readers.get(instr.result, ()):
+                    # ESCRIBIR imprime el nombre de su operando: el temporal se conserva
+                    instr = VCIInstruction("=", text, "", instr.result, instr.data_type, instr.line)
+                    changes += 1
+                elif text is not None:
+                    constants[instr.result] = text
+                    changes += 1
+                    continue
+        elif op == "IF_FALSE" and is_constant(instr.arg1):
+            changes += 1
+            if not is_true(parse_constant(instr.arg1)):
+                optimized.append(VCIInstruction("GOTO", "", "", jump_target(instr), line=instr.line))
+            continue
+        optimized.append(instr)
+    return optimized, changes
+
+
+def propagate_copies(instructions):
+    # `op a b tN` seguido de `= tN x` se reduce a `op a b x` si tN no se lee en otro lugar
+    uses = count_uses(instructions)
+    changes = 0
+    optimized = []
+    for instr in instructions:
+        previous = optimized[-1] if optimized else None
+        if (instr.operation == "=" and is_temp(instr.arg1) and uses[instr.arg1] == 1 and previous
+                and previous.result == instr.arg1 and previous.operation in VALUE_OPS):
+            optimized[-1] = replace(previous, result=instr.result)
+            changes += 1
+            continue
+        optimized.append(instr)
+    return optimized, changes
+
+
+def number_values(instructions):
+    # Numeración de valores local a cada bloque básico: una operación cuyo número de
+    # valor ya está en un temporal del mismo bloque se elimina y sus usos leen ese
+    # temporal (o se copia, si la lee ESCRIBIR, que imprime el nombre)
+    readers = read_by(instructions)
+    aliases = {}
+    changes = 0
+    optimized = []
+    for block in ControlFlowGraph(instructions).blocks:
+        numbers = {}
+        table = {}
+        holders = {}
+        fresh = itertools.count()
+
+        def number(name):
+            if name not in numbers:
+                numbers[name] = next(fresh)
+            return numbers[name]
+
+        for instr in instructions[block.start:block.end]:
+            if instr.arg1 in aliases or instr.arg2 in aliases:
+                instr = replace(instr, arg1=aliases.get(instr.arg1, instr.arg1), arg2=aliases.get(instr.arg2, instr.arg2))
+            op = instr.operation
+            if op in PURE_OPS:
+                key = [number(instr.arg1), number(instr.arg2)]
+                if op in COMMUTATIVE or op in NUMERIC_COMMUTATIVE and instr.data_type in ("entero", "real"):
+                    key.sort()
+                key = (op, *key)
+                value = table.get(key)
+                holder = holders.get(value)
+                if value is not None and holder is not None and is_temp(instr.result):
+                    changes += 1
+                    if "ESCRIBIR" not in readers.get(instr.result, ()):
+                        aliases[instr.result] = holder
+                        continue
+                    instr = VCIInstruction("=", holder, "", instr.result, instr.data_type, instr.line)
+                elif value is None:
+                    value = table[key] = next(fresh)
+                numbers[instr.result] = value
+                if is_temp(instr.result):
+                    holders.setdefault(value, instr.result)
+            elif op == "=":
+                numbers[instr.result] = number(instr.arg1)
+            elif op == "LEER":
+                numbers[instr.result] = next(fresh)
+            optimized.append(instr)
+    return optimized, changes
+
+
+def hoist_loop_invariants(instructions):
+    # Mueve antes de la cabecera de cada ciclo las operaciones puras cuyo resultado es
+    # un temporal y cuyos operandos no se escriben dentro del ciclo. Se procesan de la
+    # última cabecera a la primera: los ciclos internos primero, y mover instrucciones
+    # dentro de un rango no desplaza los rangos de los ciclos anteriores.
+    cfg = ControlFlowGraph(instructions)
+    instructions = list(instructions)
+    changes = 0
+    for header, body in reversed(cfg.loops()):
+        span = cfg.span(body)
+        outside = [p for p in cfg.blocks[header].predecessors if p not in body]
+        if span is None or span[0] != cfg.blocks[header].start or outside != [header - 1]:
+            continue
+        entry = instructions[cfg.blocks[header - 1].end - 1]
+        if jump_target(entry) is not None and cfg.block_of_label.get(jump_target(entry)) == header:
+            continue
+
+        start, end = span
+        written = {instr.result for instr in instructions[start:end] if instr.operation in VALUE_OPS or instr.operation == "LEER"}
+        hoisted, kept = [], []
+        for instr in instructions[start:end]:
+            if (instr.operation in PURE_OPS and is_temp(instr.result)
+                    and instr.arg1 not in written and instr.arg2 not in written):
+                hoisted.append(instr)
+                written.discard(instr.result)
+            else:
+                kept.append(instr)
+        if hoisted:
+            instructions[start:end] = hoisted + kept
+            changes += len(hoisted)
+    return instructions, changes
+
+
+def remove_dead_temps(instructions):
+    # Recorrido hacia atrás: al quitar una instrucción sus operandos pierden un uso
+    uses = count_uses(instructions)
+    changes = 0
+    optimized = []
+    for instr in reversed(instructions):
+        if instr.operation in VALUE_OPS and is_temp(instr.result) and not uses.get(instr.result):
+            for arg in (instr.arg1, instr.arg2):
+                if arg:
+                    uses[arg] -= 1
+            changes += 1
+            continue
+        optimized.append(instr)
+    optimized.reverse()
+    return optimized, changes
+
+
+def remove_unused_labels(instructions):
+    targets = {jump_target(instr) for instr in instructions}
+    optimized = [instr for instr in instructions if instr.operation != "LABEL" or instr.result in targets]
+    return optimized, len(instructions) - len(optimized)
+
+
+def next_executable(instructions, index):
+    # Índice de la primera instrucción distinta de LABEL a partir de `index`
+    while index < len(instructions) and instructions[index].operation == "LABEL":
+        index += 1
+    return index
+
+
+def thread_jumps(instructions):
+    # Los saltos a un GOTO van directo a su destino final, y un GOTO a la
+    # instrucción siguiente (sin contar etiquetas) se elimina
+    positions = {instr.result: i for i, instr in enumerate(instructions) if instr.operation == "LABEL"}
+
+    def landing(label):
+        return next_executable(instructions, positions.get(label, len(instructions)))
+
+    def final_target(label):
+        seen = {label}
+        while True:
+            i = landing(label)
+            if i == len(instructions) or instructions[i].operation != "GOTO" or instructions[i].result in seen:
+                return label
+            label = instructions[i].result
+            seen.add(label)
+
+    changes = 0
+    optimized = []
+    for i, instr in enumerate(instructions):
+        label = jump_target(instr)
+        if label is not None and label in positions:
+            target = final_target(label)
+            if instr.operation == "GOTO" and landing(target) == next_executable(instructions, i + 1):
+                changes += 1
+                continue
+            if target != label:
+                instr = retarget(instr, target)
+                changes += 1
+        optimized.append(instr)
+    return optimized, changes
+
+
+PASSES = {
+    "constant_folding": fold_constants,
+    "cse": number_values,
+    "licm": hoist_loop_invariants,
+    "copy_propagation": propagate_copies,
+    "dead_temps": remove_dead_temps,
+    "jump_threading": thread_jumps,
+    "unused_labels": remove_unused_labels,
+}
+
+
+# Aplica las pasadas indicadas (por nombre o como funciones lista -> (lista, cambios))
+# en orden, repitiendo la secuencia hasta que ninguna cambie el programa.
+class PassManager:
+    def __init__(self, passes=None, max_rounds=10):
+        self.passes = [(p, PASSES[p]) if isinstance(p, str) else (p.__name__, p) for p in (passes or PASSES)]
+        self.max_rounds = max_rounds
+        self.changes = {name: 0 for name, _ in self.passes}
+        self.before = self.after = 0
+
+    def run(self, instructions):
+        self.before = len(instructions)
+        for _ in range(self.max_rounds):
+            changed = False
+            for name, optimize in self.passes:
+                instructions, count = optimize(instructions)
+                self.changes[name] += count
+                changed = changed or count > 0
+            if not changed:
+                break
+        self.after = len(instructions)
+        return instructions
@@ -0,0 +1,128 @@
+import csv
+from array import array
+from time import perf_counter_ns
+
+from core.codegen.vci_linker import Opcode
+
+NO_LINE = "sin línea"
+
+
+def basic_blocks(program):
+    # (inicio, fin, nombre) de cada bloque básico del programa enlazado. Un bloque que
+    # es destino de un salto se nombra con la etiqueta del VCI original (el texto del
+    # salto, "GOTO L3"); el resto con el índice de su primera instrucción.
+    rows = program.rows()
+    size = len(rows)
+    leaders = {0}
+    names = {}
+    for index, (opcode, a, b, c) in enumerate(rows):
+        if opcode in (Opcode.GOTO, Opcode.IF_FALSE):
+            leaders.update((c, index + 1))
+            names.setdefault(c, program.source[index].result.split()[-1])
+    starts = sorted(leader for leader in leaders if leader < size)
+    return [(start, end, names.get(start, f"@{start}")) for start, end in zip(starts, starts[1:] + [size])]
+
+
+# Perfil de ejecución de VCIExecutor, usado como traza (`trace=Profiler()`): cuenta
+# las ejecuciones de cada instrucción y acumula su tiempo, medido entre una llamada a
+# `record` y la siguiente (incluye el despacho y el propio registro). Los totales por
+# bloque básico y por línea del código fuente se agregan al exportar. Sin traza el
+# ejecutor no hace ninguna de estas mediciones.
+class Profiler:
+    keeps_state = False
+
+    def __init__(self):
+        self.program = None
+        self.counts = array("q")
+        self.times = array("q")  # nanosegundos
+        self._last_ip = 0
+        self._last = 0
+
+    def start(self, program):
+        if self.program is not program:
+            self.program = program
+            self.counts = array("q", bytes(8 * len(program)))
+            # Una posición extra recibe el tiempo previo a la primera instrucción
+            self.times = array("q", bytes(8 * (len(program) + 1)))
+        self._last_ip = len(program)
+        self._last = perf_counter_ns()
+
+    def record(self, ip, stack, variables):
+        now = perf_counter_ns()
+        self.times[self._last_ip] += now - self._last
+        self.counts[ip] += 1
+        self._last_ip = ip
+        self._last = now
+
+    def finish(self):
+        self.times[self._last_ip] += perf_counter_ns() - self._last
+        self._last_ip = len(self.program)
+
+    @property
+    def steps(self):
+        return sum(self.counts)
+
+    @property
+    def total_time(self):
+        return sum(self.times[:len(self.program)])
+
+    def instructions(self):
+        # Filas (índice, instrucción, bloque, ejecuciones, ns) ordenadas por tiempo
+        rows = []
+        for start, end, block in basic_blocks(self.program):
+            for index in range(start, end):
+                rows.append((index, self.program.source[index], block, self.counts[index], self.times[index]))
+        return sorted(rows, key=lambda row: (-row[4], row[0]))
+
+    def blocks(self):
+        # {bloque: (primera instrucción, ejecuciones del bloque, instrucciones, ns)}
+        totals = {}
+        for start, end, block in basic_blocks(self.program):
+            totals[block] = (start, self.counts[start], sum(self.counts[start:end]), sum(self.times[start:end]))
+        return dict(sorted(totals.items(), key=lambda item: (-item[1][3], item[1][0])))
+
+    def lines(self):
+        # {línea: (instrucciones ejecutadas, ns)}
+        totals = {}
+        for instr, count, elapsed in zip(self.program.source, self.counts, self.times):
+            line = instr.line if instr.line >= 0 else NO_LINE
+            executed, total = totals.get(line, (0, 0))
+            totals[line] = (executed + count, total + elapsed)
+        return dict(sorted(totals.items(), key=lambda item: (-item[1][1], str(item[0]))))
+
+    def export(self, path):
+        # Puntos calientes por instrucción
+        total = self.total_time or 1
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Índice", "Operación", "Arg1", "Arg2", "Resultado", "Línea", "Bloque",
+                             "Ejecuciones", "Tiempo (ms)", "% Tiempo"])
+            for index, instr, block, count, elapsed in self.instructions():
+                writer.writerow([index, instr.operation, instr.arg1, instr.arg2, instr.result,
+                                 instr.line if instr.line >= 0 else NO_LINE, block, count,
+                                 f"{elapsed / 1e6:.3f}", f"{100 * elapsed / total:.2f}"])
+
+    def export_blocks(self, path):
+        total = self.total_time or 1
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Bloque", "Inicio", "Ejecuciones", "Instrucciones", "Tiempo (ms)", "% Tiempo"])
+            for block, (start, entries, executed, elapsed) in self.blocks().items():
+                writer.writerow([block, start, entries, executed, f"{elapsed / 1e6:.3f}", f"{100 * elapsed / total:.2f}"])
+
+    def export_lines(self, path):
+        total = self.total_time or 1
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Línea", "Instrucciones", "Tiempo (ms)", "% Tiempo"])
+            for line, (executed, elapsed) in self.lines().items():
+                writer.writerow([line, executed, f"{elapsed / 1e6:.3f}", f"{100 * elapsed / total:.2f}"])
+
+    def export_collapsed(self, path):
+        # Formato "bloque;línea;instrucción microsegundos" de flamegraph.pl y speedscope
+        with open(path, "w", encoding="utf-8") as f:
+            for index, instr, block, count, elapsed in sorted(self.instructions(), key=lambda row: row[0]):
+                micros = elapsed // 1000
+                if micros:
+                    line = f"línea {instr.line}" if instr.line >= 0 else NO_LINE
+                    f.write(f"{block};{line};{index} {instr.operation} {micros}\n")
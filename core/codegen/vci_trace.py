@@ -0,0 +1,145 @@
+import csv
+import os
+import shutil
+import tempfile
+from array import array
+from collections import deque
+
+HEADER = ["Operación", "Arg1", "Arg2", "Resultado", "Stack", "Variables"]
+# La pila de resultados solo crece; cada paso muestra sus últimos STACK_TAIL valores
+# para que registrarlo no cueste más a medida que avanza la ejecución
+STACK_TAIL = 32
+
+
+def stack_text(stack):
+    if len(stack) <= STACK_TAIL:
+        return str(stack)
+    return "[..., " + str(stack[-STACK_TAIL:])[1:]
+
+
+# Trazas de ejecución para VCIExecutor. Sin traza (trace=None) el ejecutor no registra
+# nada; cada clase decide qué guarda de cada paso. `record` recibe el índice de la
+# instrucción a ejecutar y el estado antes de ejecutarla. Las trazas con
+# `keeps_state` necesitan la pila de resultados, que sin ellas no se conserva. Si una
+# ejecución detenida continúa, `start` vuelve a llamarse y la traza sigue acumulando.
+class CounterTrace:
+    keeps_state = False
+
+    def __init__(self):
+        self.program = None
+        self.counts = array("q")
+
+    def start(self, program):
+        if self.program is not program:
+            self.program = program
+            self.counts = array("q", bytes(8 * len(program)))
+
+    def record(self, ip, stack, variables):
+        self.counts[ip] += 1
+
+    def finish(self):
+        pass
+
+    @property
+    def steps(self):
+        return sum(self.counts)
+
+    def operations(self):
+        # Pasos ejecutados por operación
+        totals = {}
+        for instr, count in zip(self.program.source, self.counts):
+            totals[instr.operation] = totals.get(instr.operation, 0) + count
+        return totals
+
+    def export(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Índice", "Operación", "Arg1", "Arg2", "Resultado", "Ejecuciones"])
+            for index, (instr, count) in enumerate(zip(self.program.source, self.counts)):
+                writer.writerow([index, instr.operation, instr.arg1, instr.arg2, instr.result, count])
+
+
+# Últimos `size` pasos con la pila y las variables de cada uno
+class RingTrace:
+    keeps_state = True
+
+    def __init__(self, size=1000):
+        self.program = None
+        self.steps = 0
+        self.buffer = deque(maxlen=size)
+
+    def start(self, program):
+        self.program = program
+
+    def record(self, ip, stack, variables):
+        self.steps += 1
+        self.buffer.append((ip, stack_text(stack), dict(variables)))
+
+    def finish(self):
+        pass
+
+    def rows(self):
+        source = self.program.source
+        for ip, stack, variables in self.buffer:
+            instr = source[ip]
+            yield [instr.operation, instr.arg1, instr.arg2, instr.result, stack, str(variables)]
+
+    def export(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            writer.writerows(self.rows())
+
+
+# Traza completa escrita en CSV a medida que se ejecuta, sin guardarla en memoria.
+# Sin `path` se escribe en un archivo temporal que `export` copia al destino; ese
+# archivo es de la traza y se borra con `close()` o al empezar otro programa.
+class StreamTrace:
+    keeps_state = True
+
+    def __init__(self, path=None):
+        self.path = path
+        self.program = None
+        self.steps = 0
+        self._file = None
+        self._writer = None
+        self._temporary = path is None
+
+    def start(self, program):
+        if self.program is program:
+            self._file = open(self.path, "a", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            return
+        self.close()
+        self.program = program
+        self.steps = 0
+        if self._temporary:
+            fd, self.path = tempfile.mkstemp(prefix="vci_trace_", suffix=".csv")
+            os.close(fd)
+        self._file = open(self.path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(HEADER)
+
+    def record(self, ip, stack, variables):
+        self.steps += 1
+        instr = self.program.source[ip]
+        self._writer.writerow([instr.operation, instr.arg1, instr.arg2, instr.result, stack_text(stack), str(variables)])
+
+    def finish(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def export(self, path):
+        if os.path.abspath(path) != os.path.abspath(self.path):
+            shutil.copyfile(self.path, path)
+
+    def close(self):
+        # Cierra el archivo y, si es temporal, lo borra; la traza ya no se puede exportar
+        self.finish()
+        if self._temporary and self.path is not None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
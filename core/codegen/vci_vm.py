@@ -0,0 +1,156 @@
+from collections import deque
+
+from core.codegen.vci_linker import LinkedProgram, Opcode, link, parse_constant
+from core.codegen.vci_io import ConsoleInput, ConsoleOutput
+from core.codegen.vci_checkpoint import restore
+from models.execution_state import ExecutionState
+
+# Valores que is_true considera falsos
+FALSY = ("false", False, 0, "0", None, "")
+# Últimos resultados que conserva la pila de la máquina
+STACK_SIZE = 64
+
+# Opcodes como int simples: el bucle de la máquina los compara en cada paso
+(ASSIGN, ADD, SUB, MUL, DIV, LT, LE, GT, GE, EQ, NE, AND, OR,
+ IF_FALSE, GOTO, LEER, ESCRIBIR) = map(int, Opcode)
+
+
+# Máquina de registros para el VCI enlazado. Cada variable y temporal ocupa una ranura
+# del marco (frame), seguida de las constantes ya convertidas, así que todo operando
+# se lee con frame[i]. Produce la misma salida y las mismas variables que VCIExecutor,
+# sin traza; `stack` guarda solo los últimos STACK_SIZE resultados.
+class VCIMachine:
+    def __init__(self, instructions, stack_size=STACK_SIZE, reader=None, writer=None, controller=None):
+        self.program = instructions if isinstance(instructions, LinkedProgram) else link(instructions)
+        self.controller = controller
+        self.reader = reader or ConsoleInput()
+        self.writer = writer or ConsoleOutput()
+        program = self.program
+        names = program.names
+        slots = len(names)
+        # Las referencias a constantes (~k) pasan a la ranura slots + k
+        self.code = [
+            (opcode, a if a >= 0 else slots + ~a, b if b >= 0 else slots + ~b, c)
+            for opcode, a, b, c in program.rows()
+        ]
+        # Una variable sin asignar se lee como su propio nombre
+        self.frame = list(names) + list(program.constants)
+        self.written = bytearray(slots)
+        self.slot_of = {name: slot for slot, name in enumerate(names)}
+        self.stack = deque(maxlen=stack_size)
+        self.ip = 0
+
+    @property
+    def variables(self):
+        frame = self.frame
+        return {name: frame[slot] for slot, name in enumerate(self.program.names) if self.written[slot]}
+
+    def execute(self):
+        code = self.code
+        frame = self.frame
+        written = self.written
+        push = self.stack.append
+        size = len(code)
+        ip = self.ip
+        controller = self.controller
+        countdown = controller.start(self) if controller is not None else None
+        try:
+            while ip < size:
+                if countdown is not None:
+                    if not countdown:
+                        self.ip = ip
+                        countdown = controller.check_in()
+                        if not countdown:
+                            break
+                    countdown -= 1
+                opcode, a, b, c = code[ip]
+                ip += 1
+
+                if opcode == ASSIGN:
+                    value = frame[a]
+                elif opcode == IF_FALSE:
+                    if frame[a] in FALSY:
+                        ip = c
+                    continue
+                elif opcode == GOTO:
+                    ip = c
+                    continue
+                elif opcode <= DIV:
+                    try:
+                        if opcode == ADD:
+                            value = frame[a] + frame[b]
+                        elif opcode == SUB:
+                            value = frame[a] - frame[b]
+                        elif opcode == MUL:
+                            value = frame[a] * frame[b]
+                        else:
+                            right = frame[b]
+                            value = frame[a] / right if right != 0 else 0
+                    except TypeError:
+                        value = 0
+                elif opcode <= NE:
+                    try:
+                        if opcode == LT:
+                            value = frame[a] < frame[b]
+                        elif opcode == LE:
+                            value = frame[a] <= frame[b]
+                        elif opcode == GT:
+                            value = frame[a] > frame[b]
+                        elif opcode == GE:
+                            value = frame[a] >= frame[b]
+                        elif opcode == EQ:
+                            value = frame[a] == frame[b]
+                        else:
+                            value = frame[a] != frame[b]
+                    except TypeError:
+                        value = False
+                elif opcode == AND:
+                    value = frame[a] not in FALSY and frame[b] not in FALSY
+                elif opcode == OR:
+                    value = frame[a] not in FALSY or frame[b] not in FALSY
+                elif opcode == ESCRIBIR:
+                    self.writer.write(self.program.source[ip - 1].arg1, frame[a])
+                    continue
+                else:  # LEER
+                    text = self.reader.read(self.program.names[c])
+                    slot = self.slot_of.get(text)
+                    frame[c] = frame[slot] if slot is not None and written[slot] else parse_constant(text)
+                    written[c] = 1
+                    continue
+
+                frame[c] = value
+                written[c] = 1
+                push(value)
+        finally:
+            self.ip = ip
+            if controller is not None:
+                controller.finish(countdown)
+            self.writer.flush()
+
+    def resume(self, checkpoint):
+        # Continúa desde un punto de control (Checkpoint o ruta) de este mismo programa
+        checkpoint = restore(self, checkpoint)
+        names = self.program.names
+        self.frame[:len(names)] = names
+        self.written[:] = bytes(len(names))
+        for name, value in checkpoint.variables.items():
+            slot = self.slot_of[name]
+            self.frame[slot] = value
+            self.written[slot] = 1
+        self.stack.clear()
+        self.stack.extend(checkpoint.stack)
+        self.ip = checkpoint.ip
+        self.execute()
+
+    def state(self):
+        controller = self.controller
+        return ExecutionState(self.ip, controller.steps if controller else None, self.variables,
+                              controller.reason if controller else None)
+
+    def export_variables(self, path):
+        import csv
+        with open(path, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Variable", "Valor"])
+            for k, v in self.variables.items():
+                writer.writerow([k, v])
@@ -0,0 +1,214 @@
+import hashlib
+import marshal
+import os
+from dataclasses import dataclass
+
+from core import pipeline
+from core.lexer.lexer import Lexer
+from core.lexer.token_stream import TokenStream
+from core.semantic.semantic_analyzer import SemanticAnalyzer
+from core.codegen.vci_generator import VCIGenerator
+from models.ast_arena import ASTArena
+from models.lexical_error import LexicalError
+from models.syntax_error import SyntaxError
+from models.vci_instruction import VCIInstruction
+
+# Cabecera de cada entrada: MAGIC, versión del formato (1 byte) y sha256 del contenido
+MAGIC = b"VCIC"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 1 + 32
+SUFFIX = ".vcic"
+
+STREAM_COLUMNS = ("kinds", "lines", "columns", "offsets", "lengths")
+ARENA_COLUMNS = ("kinds", "values", "first_child", "next_sibling", "starts", "ends", "data_types")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalid: int = 0      # entradas descartadas por cabecera o checksum incorrectos
+    failures: int = 0     # escrituras que fallaron (directorio sin permisos, disco lleno, ...)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+# Caché en disco de compilaciones, direccionada por el hash del código fuente y de la
+# versión del compilador. Cada entrada guarda tokens, AST (como ASTArena), tabla de
+# símbolos, errores y VCI serializados con marshal; al superar `max_bytes` se eliminan
+# las entradas usadas hace más tiempo (según su mtime, que se actualiza en cada acierto).
+# La caché nunca hace fallar una compilación: si no se puede escribir, solo no guarda.
+class CompileCache:
+    def __init__(self, directory=".cache/compile", max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def key(self, source, parser="recursive"):
+        digest = hashlib.sha256(f"{pipeline.COMPILER_VERSION}\0{parser}\0".encode("utf-8"))
+        digest.update(source.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def compile(self, source, parser="recursive"):
+        result = self.load(source, parser)
+        if result is None:
+            result = pipeline.compile(source, parser)
+            self.store(source, result, parser)
+        return result
+
+    def load(self, source, parser="recursive"):
+        path = self.path(self.key(source, parser))
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.stats.misses += 1
+            return None
+
+        payload = data[HEADER_SIZE:]
+        if (len(data) < HEADER_SIZE or data[:len(MAGIC)] != MAGIC or data[len(MAGIC)] != FORMAT_VERSION
+                or data[len(MAGIC) + 1:HEADER_SIZE] != hashlib.sha256(payload).digest()):
+            self._discard(path)
+            return None
+        try:
+            result = _decode(source, marshal.loads(payload), parser)
+        except (ValueError, TypeError, EOFError, IndexError, KeyError):
+            self._discard(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.stats.hits += 1
+        return result
+
+    def store(self, source, result, parser="recursive"):
+        payload = marshal.dumps(_encode(result))
+        path = self.path(self.key(source, parser))
+        temp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp, "wb") as f:
+                f.write(MAGIC + bytes([FORMAT_VERSION]) + hashlib.sha256(payload).digest())
+                f.write(payload)
+            os.replace(temp, path)
+        except OSError:
+            self.stats.failures += 1
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return
+        self.stats.stores += 1
+        self._evict()
+
+    def clear(self):
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def _discard(self, path):
+        self.stats.invalid += 1
+        self.stats.misses += 1
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _entries(self):
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry for entry in entries if entry.name.endswith(SUFFIX)]
+        except OSError:
+            return []
+
+    def _evict(self):
+        # Otro proceso puede borrar entradas mientras tanto; las que ya no están se omiten
+        entries = []
+        for entry in self._entries():
+            try:
+                info = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((info.st_mtime, info.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return
+            self.stats.evictions += 1
+
+
+def _encode(result):
+    stream = result.tokens
+    ast = result.ast if isinstance(result.ast, ASTArena) else ASTArena.from_node(result.ast)
+    return (
+        tuple(getattr(stream, name).tobytes() for name in STREAM_COLUMNS),
+        [(e.message, e.value, e.line, e.column) for e in result.lexical_errors],
+        (tuple(getattr(ast, name).tobytes() for name in ARENA_COLUMNS), ast.strings, ast.root),
+        [(e.message, e.value, e.line, e.column) for e in result.syntax_errors],
+        None if result.analyzer is None else (
+            [(s.name, s.type, s.scope, s.value) for s in result.analyzer.symbol_table],
+            [(e.message, e.value, e.line, e.column) for e in result.analyzer.errors],
+        ),
+        None if result.generator is None else (
+            [(i.operation, i.arg1, i.arg2, i.result, i.data_type, i.line) for i in result.generator.instructions],
+            result.generator.temp_count,
+            result.generator.label_count,
+        ),
+    )
+
+
+def _decode(source, data, parser="recursive"):
+    stream_columns, lexical_errors, (arena_columns, strings, root), syntax_errors, semantic, code = data
+
+    lexer = Lexer()
+    lexer.tokens = stream = TokenStream(source)
+    for name, raw in zip(STREAM_COLUMNS, stream_columns):
+        getattr(stream, name).frombytes(raw)
+    if len({len(getattr(stream, name)) for name in STREAM_COLUMNS}) != 1:
+        raise ValueError("columnas de tokens inconsistentes")
+    lexer.errors = [LexicalError(*error) for error in lexical_errors]
+
+    ast = ASTArena()
+    for name, raw in zip(ARENA_COLUMNS, arena_columns):
+        getattr(ast, name).frombytes(raw)
+    ast.strings = list(strings)
+    ast._string_index = {value: index for index, value in enumerate(ast.strings)}
+    ast.root = root
+
+    parser = pipeline.PARSERS[parser](stream)
+    parser.errors = [SyntaxError(*error) for error in syntax_errors]
+    result = pipeline.CompilationResult(lexer, parser, ast)
+
+    if semantic is not None:
+        symbols, errors = semantic
+        result.analyzer = SemanticAnalyzer()
+        for name, var_type, scope, value in symbols:
+            result.analyzer.symbol_table.declare(name, var_type, scope, value)
+        result.analyzer.errors = [SyntaxError(*error) for error in errors]
+    if code is not None:
+        instructions, temp_count, label_count = code
+        result.generator = VCIGenerator()
+        result.generator.instructions = [VCIInstruction(*instruction) for instruction in instructions]
+        result.generator.temp_count = temp_count
+        result.generator.label_count = label_count
+    return result
@@ -1,6 +1,12 @@
 import re
+import os
+import mmap
 from models.token import Token
 from models.lexical_error import LexicalError
+from core.lexer.scanner import Scanner
+from core.lexer.token_stream import TokenStream
+from core.lexer.parallel_lexer import lex_parallel, PARALLEL_THRESHOLD
+from core.lexer.token_kinds import RESERVED_WORDS, OPERATORS, SYMBOLS
 import csv
 from pathlib import Path
 
@@ -10,22 +16,9 @@ class Lexer:
         self.errors = []
         self.line_number = 1
 
-        self.reserved_words = {
-            "programa", "real", "leer", "haz", "default", "funcion", "cadena", "escribir", "mientras","entonces","hacer","repetir",
-            "regresar", "vacio", "variables", "si", "encaso", "ejecutar", "entero", "sino", "caso", "logico","inicio", "fin","hasta"
-        }
-
-        self.operators = {
-            "+": "SUMA", "-": "RESTA", "*": "MULTIPLICACION", "/": "DIVISION", "%": "MODULO", "=": "ASIGNACION",
-            "<": "MENOR", "<=": "MENOR_IGUAL", ">": "MAYOR", ">=": "MAYOR_IGUAL", "==": "IGUAL", "!=": "DIFERENTE",
-            "!": "NOT", "&&": "AND", "||": "OR"
-        }
-
-        self.symbols = {
-            ";": "PUNTO_COMA", ",": "COMA", ":": "DOS_PUNTOS",
-            "(": "PARENTESIS_ABRE", ")": "PARENTESIS_CIERRA",
-            "{": "LLAVE_ABRE", "}": "LLAVE_CIERRA"
-        }
+        self.reserved_words = set(RESERVED_WORDS)
+        self.operators = dict(OPERATORS)
+        self.symbols = dict(SYMBOLS)
 
         # Expresiones regulares para tokens válidos
         self.token_patterns = [
@@ -46,8 +39,42 @@ class Lexer:
 
         self.multi_char_ops = ["==", "!=", "<=", ">=", "&&", "||"]
 
+        self.scanner = Scanner(self.reserved_words, self.operators, self.symbols, self.multi_char_ops)
+
     def analyze(self, text):
-        self.tokens.clear()
+        # self.tokens queda como un TokenStream; los Token se crean solo al iterarlo
+        self.errors.clear()
+        self.tokens = self.scanner.scan_stream(text, self.errors)
+
+    def analyze_parallel(self, text, workers=None, threshold=PARALLEL_THRESHOLD):
+        # Igual que analyze, repartiendo fuentes grandes entre varios procesos
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(text) < threshold:
+            self.analyze(text)
+            return
+        self.tokens, errors = lex_parallel(text, workers)
+        self.errors.clear()
+        self.errors.extend(errors)
+
+    def iter_tokens(self, source, chunk_size=1 << 20):
+        # Genera los tokens de forma perezosa sin guardarlos en self.tokens.
+        # `source` es la ruta de un archivo (se mapea en memoria) o un buffer de
+        # bytes UTF-8 (bytes, bytearray o mmap); los errores van a self.errors.
+        self.errors.clear()
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    yield from self.scanner.scan_buffer(buffer, self.errors, chunk_size)
+        else:
+            yield from self.scanner.scan_buffer(source, self.errors, chunk_size)
+
+    def analyze_legacy(self, text):
+        # Ciclo original por línea; se conserva como referencia para comparar resultados.
+        # A diferencia de analyze, no reconoce comentarios /* */ de varias líneas: los
+        # reporta sin cerrar y analiza su contenido. Fuera de eso producen lo mismo.
+        self.tokens = []
         self.errors.clear()
 
         lines = text.splitlines()
@@ -116,15 +143,18 @@ class Lexer:
                     self.errors.append(LexicalError("Caracter no reconocido", current, line_number, position+1))
                     position += 1
 
-    def export_to_csv(self):
-        output_path = Path("output")
+    def export_to_csv(self, output_dir="output"):
+        output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
 
         with open(output_path / "tokens.csv", mode="w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(["Tipo", "Valor", "Línea", "Columna"])
-            for token in self.tokens:
-                writer.writerow([token.type, token.value, token.line, token.column])
+            if isinstance(self.tokens, TokenStream):
+                writer.writerows(self.tokens.rows())
+            else:
+                for token in self.tokens:
+                    writer.writerow([token.type, token.value, token.line, token.column])
 
         with open(output_path / "lexical_errors.csv", mode="w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
@@ -0,0 +1,77 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from core.lexer.scanner import LINE_BREAKS, count_lines
+from core.lexer.token_stream import TokenStream
+
+# Fuentes más pequeñas que esto se analizan en el mismo proceso
+PARALLEL_THRESHOLD = 8 * 1024 * 1024
+
+# Cadenas y comentarios: un límite de bloque nunca puede caer dentro de ellos
+_NOT_BREAK = "[^" + re.escape(LINE_BREAKS) + "]"
+SPAN_RE = re.compile(r'//' + _NOT_BREAK + r'*|"[^"' + re.escape(LINE_BREAKS) + r']*"|/\*/|/\*[\s\S]*?\*/|/\*' + _NOT_BREAK + '*')
+
+_lexer = None
+
+
+def split_source(text, parts):
+    # Índices de inicio de cada bloque: siempre justo después de un "\n" que no
+    # está dentro de un comentario /* */ (las cadenas no cruzan líneas).
+    bounds = [0]
+    spans = SPAN_RE.finditer(text)
+    span = next(spans, None)
+    step = max(1, len(text) // parts)
+
+    for part in range(1, parts):
+        newline = text.find("\n", max(part * step, bounds[-1]))
+        if newline == -1:
+            break
+        cut = newline + 1
+        while span is not None and span.end() <= cut - 1:
+            span = next(spans, None)
+        while span is not None and span.start() < cut < span.end():
+            newline = text.find("\n", span.end() - 1)
+            if newline == -1:
+                return bounds
+            cut = newline + 1
+            while span is not None and span.end() <= cut - 1:
+                span = next(spans, None)
+        if cut >= len(text):
+            break
+        bounds.append(cut)
+    return bounds
+
+
+def _lex_chunk(args):
+    global _lexer
+    text, line, offset = args
+    if _lexer is None:
+        from core.lexer.lexer import Lexer
+        _lexer = Lexer()
+    errors = []
+    stream = _lexer.scanner.scan_stream(text, errors, line, offset)
+    return stream.kinds, stream.offsets, stream.lengths, stream.lines, stream.columns, errors
+
+
+def lex_parallel(text, workers, chunks_per_worker=4):
+    # Analiza `text` en `workers` procesos y une los resultados en orden, de modo que
+    # tokens y errores quedan igual que con Lexer.analyze.
+    bounds = split_source(text, workers * chunks_per_worker)
+    bounds.append(len(text))
+
+    jobs = []
+    line = 1
+    for start, end in zip(bounds, bounds[1:]):
+        jobs.append((text[start:end], line, start))
+        line += count_lines(text, start, end)
+
+    stream = TokenStream(text)
+    errors = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for kinds, offsets, lengths, lines, columns, chunk_errors in pool.map(_lex_chunk, jobs):
+            stream.kinds.extend(kinds)
+            stream.offsets.extend(offsets)
+            stream.lengths.extend(lengths)
+            stream.lines.extend(lines)
+            stream.columns.extend(columns)
+            errors.extend(chunk_errors)
+    return stream, errors
@@ -0,0 +1,185 @@
+import re
+from itertools import chain
+from models.token import Token
+from models.lexical_error import LexicalError
+from core.lexer.token_kinds import TokenKind, KIND_TYPE, KIND_LEXEME, LEXEME_KIND
+from core.lexer.token_stream import TokenStream
+
+# Caracteres que str.splitlines() considera fin de línea
+LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+_NOT_BREAK = "[^" + re.escape(LINE_BREAKS) + "]"
+
+BREAK_RE = re.compile(r"\r\n|[" + re.escape(LINE_BREAKS) + "]")
+
+
+def count_lines(text, start=0, end=None):
+    # Igual que count_breaks(...)[0], contando con str.count para textos grandes
+    end = len(text) if end is None else end
+    return sum(text.count(ch, start, end) for ch in LINE_BREAKS) - text.count("\r\n", start, end)
+
+
+def count_breaks(text, start=0, end=None):
+    # Cantidad de saltos de línea en text[start:end] y el índice donde inicia la última línea
+    count = 0
+    last = -1
+    for m in BREAK_RE.finditer(text, start, len(text) if end is None else end):
+        count += 1
+        last = m.end()
+    return count, last
+
+# Grupos con nombre cuyo tipo de token no depende del lexema
+GROUP_KINDS = {
+    name: TokenKind[name]
+    for name in ("CADENA", "REAL", "ENTERO", "BOOLEANO", "ID_METODO", "ID_ENTERO", "ID_REAL", "ID_CADENA", "ID_LOGICO")
+}
+
+
+# Escáner de una sola pasada: una alternancia precompilada de grupos con nombre,
+# en el mismo orden de prioridad que el ciclo por línea original del Lexer.
+class Scanner:
+    def __init__(self, reserved_words, operators, symbols, multi_char_ops):
+        self.reserved_kinds = {word: LEXEME_KIND[word] for word in reserved_words}
+
+        single_ops = [op for op in operators if len(op) == 1]
+        op_alternatives = [re.escape(op) for op in multi_char_ops] + [re.escape(op) for op in single_ops]
+
+        parts = [
+            ("WS", r"[ \t]+"),
+            ("NL", r"\r\n|[" + re.escape(LINE_BREAKS) + "]"),
+            ("COMMENT", r"//" + _NOT_BREAK + r"*|/\*/|/\*[\s\S]*?\*/"),
+            # Sin "*/" en el resto del texto el comentario termina con su línea, como en
+            # el ciclo original por línea (analyze_legacy), y se reporta como error
+            ("OPEN_COMMENT", r"/\*" + _NOT_BREAK + r"*"),
+            ("OP", "|".join(op_alternatives)),
+            ("SYM", "[" + "".join(re.escape(s) for s in symbols) + "]"),
+            ("CADENA", r'"[^"' + re.escape(LINE_BREAKS) + r']*"'),
+            ("REAL", r"\d+\.\d+"),
+            ("ENTERO", r"\d+"),
+            ("BOOLEANO", r"(?:true|false)\b"),
+            ("ID_METODO", r"[a-zA-Z][a-zA-Z0-9]*@"),
+            ("ID_ENTERO", r"[a-zA-Z][a-zA-Z0-9]*&"),
+            ("ID_REAL", r"[a-zA-Z][a-zA-Z0-9]*%"),
+            ("ID_CADENA", r"[a-zA-Z][a-zA-Z0-9]*\$"),
+            ("ID_LOGICO", r"[a-zA-Z][a-zA-Z0-9]*#"),
+            ("ID", r"[a-zA-Z][a-zA-Z0-9]*"),
+            ("ERR", r"[\s\S]"),
+        ]
+        self.pattern = re.compile("|".join(f"(?P<{name}>{regex})" for name, regex in parts))
+        # Después del último "*/" ningún "/*" puede cerrarse: sin esa alternativa cada
+        # comentario sin cerrar no recorre el resto del texto buscando su cierre
+        parts[2] = ("COMMENT", r"//" + _NOT_BREAK + r"*|/\*/")
+        self.tail_pattern = re.compile("|".join(f"(?P<{name}>{regex})" for name, regex in parts))
+
+    def matches(self, text, pos=0):
+        # Hasta el fin de la línea del último "*/" con el patrón completo y el resto sin
+        # comentarios de varias líneas; ningún token cruza un salto de línea
+        last_close = text.rfind("*/", pos)
+        if last_close == -1:
+            return self.tail_pattern.finditer(text, pos)
+        newline = BREAK_RE.search(text, last_close)
+        if newline is None:
+            return self.pattern.finditer(text, pos)
+        return chain(self.pattern.finditer(text, pos, newline.end()), self.tail_pattern.finditer(text, newline.end()))
+
+    def scan_kinds(self, text, errors, line=1, line_start=0, pos=0, closes_later=None):
+        # Genera (tipo entero, inicio, fin, línea, columna) por cada token de `text`;
+        # los errores léxicos se agregan a `errors`. Si `text` es un bloque de una
+        # fuente mayor, `closes_later()` indica si hay un "*/" después del bloque: en
+        # ese caso un comentario sin cerrar continúa en el siguiente bloque y se
+        # devuelve (línea final, (línea, columna) del "/*").
+        group_kinds = GROUP_KINDS
+        lexeme_kinds = LEXEME_KIND
+        reserved_kinds = self.reserved_kinds
+        identifier = TokenKind.ID
+
+        for m in self.matches(text, pos):
+            group = m.lastgroup
+            kind = group_kinds.get(group)
+            if kind is not None:
+                start = m.start()
+                yield kind, start, m.end(), line, start - line_start + 1
+            elif group == "OP" or group == "SYM" or group == "ID":
+                start, end = m.span()
+                if group == "ID":
+                    kind = reserved_kinds.get(m.group(), identifier)
+                else:
+                    kind = lexeme_kinds[m.group()]
+                yield kind, start, end, line, start - line_start + 1
+            elif group == "NL":
+                line += 1
+                line_start = m.end()
+            elif group == "COMMENT":
+                if text[m.start() + 1] == "*":
+                    breaks, last = count_breaks(text, m.start(), m.end())
+                    if breaks:
+                        line += breaks
+                        line_start = last
+            elif group == "ERR":
+                errors.append(LexicalError("Caracter no reconocido", m.group(), line, m.start() - line_start + 1))
+            elif group == "OPEN_COMMENT":
+                opened = (line, m.start() - line_start)
+                if closes_later is not None and closes_later():
+                    return line + count_breaks(text, m.start())[0], opened
+                errors.append(LexicalError("Comentario multilinea no cerrado", "/*", *opened))
+        return line, None
+
+    def scan(self, text, errors, line=1, line_start=0, pos=0, closes_later=None):
+        # Igual que scan_kinds, pero genera objetos Token
+        kinds = self.scan_kinds(text, errors, line, line_start, pos, closes_later)
+        types = KIND_TYPE
+        lexemes = KIND_LEXEME
+        while True:
+            try:
+                kind, start, end, line, column = next(kinds)
+            except StopIteration as stop:
+                return stop.value
+            lexeme = lexemes[kind]
+            yield Token(types[kind], text[start:end] if lexeme is None else lexeme, line, column)
+
+    def scan_stream(self, text, errors, line=1, offset=0):
+        # Tokens de `text` en forma columnar (TokenStream), sin crear objetos Token.
+        # `line` y `offset` ubican a `text` dentro de una fuente mayor.
+        stream = TokenStream(text)
+        append = stream.append
+        for kind, start, end, line, column in self.scan_kinds(text, errors, line):
+            append(kind, start + offset, end - start, line, column)
+        return stream
+
+    def scan_buffer(self, buffer, errors, chunk_size=1 << 20):
+        # Escanea un buffer de bytes UTF-8 (bytes, bytearray o mmap) por bloques que
+        # terminan en salto de línea; la memoria usada depende de chunk_size.
+        size = len(buffer)
+        start = 0
+        line = 1
+        opened = None  # (línea, columna) de un comentario que sigue abierto
+
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                cut = buffer.find(b"\n", end)
+                end = size if cut == -1 else cut + 1
+            text = buffer[start:end].decode("utf-8")
+            start = end
+            # Los bloques terminan en salto de línea, así que un "*/" no queda partido
+            closes_later = None if end == size else (lambda end=end: buffer.find(b"*/", end) != -1)
+
+            pos = 0
+            line_start = 0
+            if opened:
+                close = text.find("*/")
+                if close == -1:
+                    line += count_breaks(text)[0]
+                    continue
+                pos = close + 2
+                breaks, last = count_breaks(text, 0, pos)
+                line += breaks
+                line_start = last if breaks else 0
+                opened = None
+
+            line, opened = yield from self.scan(text, errors, line, line_start, pos, closes_later)
+
+        if opened:
+            errors.append(LexicalError("Comentario multilinea no cerrado", "/*", *opened))
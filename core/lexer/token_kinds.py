@@ -0,0 +1,60 @@
+from enum import IntEnum
+
+# Tablas del lenguaje; el Lexer y los tipos de token enteros se construyen a partir de ellas
+RESERVED_WORDS = [
+    "programa", "real", "leer", "haz", "default", "funcion", "cadena", "escribir", "mientras", "entonces", "hacer", "repetir",
+    "regresar", "vacio", "variables", "si", "encaso", "ejecutar", "entero", "sino", "caso", "logico", "inicio", "fin", "hasta"
+]
+
+OPERATORS = {
+    "+": "SUMA", "-": "RESTA", "*": "MULTIPLICACION", "/": "DIVISION", "%": "MODULO", "=": "ASIGNACION",
+    "<": "MENOR", "<=": "MENOR_IGUAL", ">": "MAYOR", ">=": "MAYOR_IGUAL", "==": "IGUAL", "!=": "DIFERENTE",
+    "!": "NOT", "&&": "AND", "||": "OR"
+}
+
+SYMBOLS = {
+    ";": "PUNTO_COMA", ",": "COMA", ":": "DOS_PUNTOS",
+    "(": "PARENTESIS_ABRE", ")": "PARENTESIS_CIERRA",
+    "{": "LLAVE_ABRE", "}": "LLAVE_CIERRA"
+}
+
+# Tipos de token cuyo lexema varía
+LITERAL_TYPES = [
+    "CADENA", "REAL", "ENTERO", "BOOLEANO",
+    "ID_METODO", "ID_ENTERO", "ID_REAL", "ID_CADENA", "ID_LOGICO", "ID"
+]
+
+# Un tipo entero por cada palabra reservada, operador y símbolo, de modo que el
+# parser compare enteros en lugar de pares (tipo, valor) de cadenas.
+TokenKind = IntEnum(
+    "TokenKind",
+    ["EOF"] + LITERAL_TYPES
+    + ["KW_" + word.upper() for word in RESERVED_WORDS]
+    + ["OP_" + name for name in OPERATORS.values()]
+    + ["SYM_" + name for name in SYMBOLS.values()],
+    start=0,
+)
+
+# Tipo (cadena) reportado para cada tipo entero y lexema fijo, si lo tiene
+KIND_TYPE = [None] * len(TokenKind)
+KIND_LEXEME = [None] * len(TokenKind)
+LEXEME_KIND = {}
+
+for _type in LITERAL_TYPES:
+    KIND_TYPE[TokenKind[_type]] = _type
+for _word in RESERVED_WORDS:
+    _kind = TokenKind["KW_" + _word.upper()]
+    KIND_TYPE[_kind], KIND_LEXEME[_kind], LEXEME_KIND[_word] = "RESERVADA", _word, _kind
+for _op, _name in OPERATORS.items():
+    _kind = TokenKind["OP_" + _name]
+    KIND_TYPE[_kind], KIND_LEXEME[_kind], LEXEME_KIND[_op] = "OPERADOR", _op, _kind
+for _symbol, _name in SYMBOLS.items():
+    _kind = TokenKind["SYM_" + _name]
+    KIND_TYPE[_kind], KIND_LEXEME[_kind], LEXEME_KIND[_symbol] = "SIMBOLO", _symbol, _kind
+
+
+def kind_of(token_type, value):
+    # Tipo entero de un Token (tipo, valor) ya construido
+    if token_type in ("RESERVADA", "OPERADOR", "SIMBOLO"):
+        return LEXEME_KIND[value]
+    return TokenKind[token_type]
@@ -0,0 +1,125 @@
+from array import array
+from models.token import Token
+from core.lexer.token_kinds import TokenKind, KIND_TYPE, KIND_LEXEME, kind_of
+
+EOF = TokenKind.EOF
+
+
+# Secuencia de tokens en columnas: tipo entero, línea, columna, desplazamiento y
+# longitud del lexema dentro de `source`. Los Token solo se crean al indexar o iterar.
+class TokenStream:
+    def __init__(self, source=""):
+        self.source = source
+        self.kinds = array("B")
+        self.lines = array("i")
+        self.columns = array("i")
+        self.offsets = array("q")
+        self.lengths = array("i")
+
+    def append(self, kind, offset, length, line, column):
+        self.kinds.append(kind)
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def extend(self, other):
+        # Concatena columnas ya calculadas sobre el mismo `source`
+        self.kinds.extend(other.kinds)
+        self.offsets.extend(other.offsets)
+        self.lengths.extend(other.lengths)
+        self.lines.extend(other.lines)
+        self.columns.extend(other.columns)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def kind(self, index):
+        return self.kinds[index]
+
+    def type(self, index):
+        return KIND_TYPE[self.kinds[index]]
+
+    def value(self, index):
+        lexeme = KIND_LEXEME[self.kinds[index]]
+        if lexeme is None:
+            offset = self.offsets[index]
+            lexeme = self.source[offset:offset + self.lengths[index]]
+        return lexeme
+
+    def token(self, index):
+        return Token(self.type(index), self.value(index), self.lines[index], self.columns[index])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.token(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice de token fuera de rango")
+        return self.token(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.token(index)
+
+    def rows(self):
+        # Filas (tipo, valor, línea, columna) para exportar sin crear Token
+        for index in range(len(self)):
+            yield self.type(index), self.value(index), self.lines[index], self.columns[index]
+
+    def cursor(self):
+        return StreamCursor(self)
+
+
+# Cursores con un token de anticipación que usa el Parser: exponen el tipo entero
+# del token actual y solo construyen el lexema o el Token cuando se piden.
+class StreamCursor:
+    __slots__ = ("stream", "index", "kind", "_kinds", "_size")
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._kinds = stream.kinds
+        self._size = len(stream)
+        self.index = -1
+        self.advance()
+
+    def advance(self):
+        index = self.index = self.index + 1
+        self.kind = self._kinds[index] if index < self._size else EOF
+
+    def value(self):
+        return self.stream.value(self.index)
+
+    def line(self):
+        return self.stream.lines[self.index]
+
+    def column(self):
+        return self.stream.columns[self.index]
+
+    def token(self):
+        return self.stream.token(self.index) if self.kind != EOF else None
+
+
+class TokenCursor:
+    __slots__ = ("_source", "_token", "kind")
+
+    def __init__(self, tokens):
+        self._source = iter(tokens)
+        self.advance()
+
+    def advance(self):
+        self._token = next(self._source, None)
+        self.kind = EOF if self._token is None else kind_of(self._token.type, self._token.value)
+
+    def value(self):
+        return self._token.value
+
+    def line(self):
+        return self._token.line
+
+    def column(self):
+        return self._token.column
+
+    def token(self):
+        return self._token
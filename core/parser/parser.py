@@ -1,39 +1,70 @@
 from models.token import Token
 from models.ast_node import ASTNode
 from models.syntax_error import SyntaxError
+from core.lexer.token_kinds import TokenKind as K, KIND_TYPE, LEXEME_KIND
+from core.lexer.token_stream import TokenStream, TokenCursor
+
+ID_KINDS = frozenset({K.ID_ENTERO, K.ID_REAL, K.ID_CADENA, K.ID_LOGICO})
+TYPE_KINDS = frozenset({K.KW_ENTERO, K.KW_REAL, K.KW_CADENA, K.KW_LOGICO})
+STATEMENT_KINDS = frozenset({K.KW_LEER, K.KW_ESCRIBIR, K.KW_SI, K.KW_MIENTRAS, K.KW_REPETIR}) | ID_KINDS
+FACTOR_KINDS = ID_KINDS | {K.ENTERO, K.REAL, K.CADENA, K.BOOLEANO}
+COMPARISON_KINDS = frozenset({K.OP_MAYOR, K.OP_MENOR, K.OP_MAYOR_IGUAL, K.OP_MENOR_IGUAL, K.OP_IGUAL, K.OP_DIFERENTE})
+ADDITIVE_KINDS = frozenset({K.OP_SUMA, K.OP_RESTA, K.OP_OR})
+MULTIPLICATIVE_KINDS = frozenset({K.OP_MULTIPLICACION, K.OP_DIVISION, K.OP_AND})
 
 class Parser:
     def __init__(self, tokens):
+        # `tokens` puede ser un TokenStream (se lee por tipo entero, sin crear Token),
+        # una lista o cualquier iterador de Token; solo hay un token de anticipación.
         self.tokens = tokens
+        self.cursor = tokens.cursor() if isinstance(tokens, TokenStream) else TokenCursor(tokens)
         self.position = 0
         self.errors = []
 
     def current_token(self):
-        if self.position < len(self.tokens):
-            return self.tokens[self.position]
+        return self.cursor.token()
+
+    def advance(self):
+        self.cursor.advance()
+        self.position += 1
+
+    def accept(self, kinds):
+        # Consume el token actual si su tipo está en `kinds` y devuelve su lexema
+        if self.cursor.kind in kinds:
+            value = self.cursor.value()
+            self.advance()
+            return value
         return None
 
     def match(self, expected_type=None, expected_value=None):
-        token = self.current_token()
-        if token is None:
+        cursor = self.cursor
+        if cursor.kind == K.EOF:
             return None
-        if expected_type and token.type != expected_type:
+        if expected_type and KIND_TYPE[cursor.kind] != expected_type:
             return None
-        if expected_value and token.value != expected_value:
+        if expected_value and cursor.kind != LEXEME_KIND.get(expected_value):
             return None
-        self.position += 1
+        token = cursor.token()
+        self.advance()
         return token
 
     def expect(self, expected_type=None, expected_value=None):
-        token = self.match(expected_type, expected_value)
-        if token is None:
-            current = self.current_token()
-            msg = f"Se esperaba {'tipo ' + expected_type if expected_type else ''} {'valor ' + expected_value if expected_value else ''}"
-            if current:
-                self.errors.append(SyntaxError(msg, current.value, current.line, current.column))
-            else:
-                self.errors.append(SyntaxError(msg, "EOF", -1, -1))
-        return token
+        cursor = self.cursor
+        if cursor.kind != K.EOF and (expected_value and cursor.kind == LEXEME_KIND.get(expected_value)
+                                     or not expected_value and KIND_TYPE[cursor.kind] == expected_type):
+            value = cursor.value()
+            self.advance()
+            return value
+        msg = f"Se esperaba {'tipo ' + expected_type if expected_type else ''} {'valor ' + expected_value if expected_value else ''}"
+        self.error(msg)
+        return None
+
+    def error(self, message):
+        cursor = self.cursor
+        if cursor.kind != K.EOF:
+            self.errors.append(SyntaxError(message, cursor.value(), cursor.line(), cursor.column()))
+        else:
+            self.errors.append(SyntaxError(message, "EOF", -1, -1))
 
     def parse(self):
         return self.programa()
@@ -41,20 +72,19 @@ class Parser:
     def programa(self):
         root = ASTNode("PROGRAMA")
         self.expect("RESERVADA", "programa")
-        id_token = self.expect("ID_METODO")
-        root.children.append(ASTNode("ID", id_token.value) if id_token else ASTNode("ID", "ERROR"))
+        id_value = self.expect("ID_METODO")
+        root.children.append(ASTNode("ID", id_value) if id_value else ASTNode("ID", "ERROR"))
         self.expect("SIMBOLO", ";")
-        if self.current_token() and self.current_token().value == "variables":
-            self.match("RESERVADA", "variables")  # consumir palabra "variables"
+        if self.cursor.kind == K.KW_VARIABLES:
+            self.advance()  # consumir palabra "variables"
             root.children.append(self.declaraciones())
         root.children.append(self.bloque())
         return root
 
     def declaraciones(self):
         decls = ASTNode("DECLARACIONES")
-        while self.current_token() and self.current_token().value in {"entero", "real", "cadena", "logico"}:
-            tipo_token = self.match("RESERVADA")
-            tipo = ASTNode("TIPO", tipo_token.value)
+        while self.cursor.kind in TYPE_KINDS:
+            tipo = ASTNode("TIPO", self.accept(TYPE_KINDS))
             lista = self.lista_id()
             tipo.children.extend(lista.children)
             self.expect("SIMBOLO", ";")
@@ -63,65 +93,66 @@ class Parser:
 
     def lista_id(self):
         lista = ASTNode("LISTA_ID")
-        token = self.match("ID_ENTERO") or self.match("ID_REAL") or self.match("ID_CADENA") or self.match("ID_LOGICO")
-        if token:
-            lista.children.append(ASTNode("ID", token.value))
+        value = self.accept(ID_KINDS)
+        if value:
+            lista.children.append(ASTNode("ID", value))
         else:
-            self.errors.append(SyntaxError("Se esperaba un identificador válido", self.current_token().value, self.current_token().line, self.current_token().column))
+            self.error("Se esperaba un identificador válido")
             return lista
-        while self.match("SIMBOLO", ","):
-            token = self.match("ID_ENTERO") or self.match("ID_REAL") or self.match("ID_CADENA") or self.match("ID_LOGICO")
-            if token:
-                lista.children.append(ASTNode("ID", token.value))
+        while self.cursor.kind == K.SYM_COMA:
+            self.advance()
+            value = self.accept(ID_KINDS)
+            if value:
+                lista.children.append(ASTNode("ID", value))
             else:
-                print(token)
-                self.errors.append(SyntaxError("Se esperaba otro identificador", self.current_token().value, self.current_token().line, self.current_token().column))
+                print(value)
+                self.error("Se esperaba otro identificador")
         return lista
 
     def bloque(self):
-        bloque = ASTNode("BLOQUE")
+        bloque = ASTNode("BLOQUE", start=self.position)
         self.expect("RESERVADA", "inicio")
         instrucciones = self.instrucciones()
         bloque.children.extend(instrucciones.children)
         self.expect("RESERVADA", "fin")
+        bloque.end = self.position
         return bloque
 
     def instrucciones(self):
         instrucciones = ASTNode("INSTRUCCIONES")
-        while True:
-            token = self.current_token()
-            if token and (token.value in {"leer", "escribir", "si", "mientras", "repetir"} or token.type in {"ID_ENTERO", "ID_REAL", "ID_CADENA", "ID_LOGICO"}):
-                instrucciones.children.append(self.instruccion())
-            else:
-                break
+        while self.cursor.kind in STATEMENT_KINDS:
+            instrucciones.children.append(self.instruccion())
         return instrucciones
 
     def instruccion(self):
-        token = self.current_token()
-        if token.value == "leer":
-            return self.instruccion_leer()
-        elif token.value == "escribir":
-            return self.instruccion_escribir()
-        elif token.value == "si":
-            return self.instruccion_si()
-        elif token.value == "mientras":
-            return self.instruccion_mientras()
-        elif token.value == "repetir":
-            return self.instruccion_repetir()
-        elif token.type in {"ID_ENTERO", "ID_REAL", "ID_CADENA", "ID_LOGICO"}:
-            return self.asignacion()
+        start = self.position
+        kind = self.cursor.kind
+        if kind == K.KW_LEER:
+            nodo = self.instruccion_leer()
+        elif kind == K.KW_ESCRIBIR:
+            nodo = self.instruccion_escribir()
+        elif kind == K.KW_SI:
+            nodo = self.instruccion_si()
+        elif kind == K.KW_MIENTRAS:
+            nodo = self.instruccion_mientras()
+        elif kind == K.KW_REPETIR:
+            nodo = self.instruccion_repetir()
+        elif kind in ID_KINDS:
+            nodo = self.asignacion()
         else:
-            self.errors.append(SyntaxError("Instrucción no reconocida", token.value, token.line, token.column))
-            self.position += 1
-            return ASTNode("ERROR")
+            self.error("Instrucción no reconocida")
+            self.advance()
+            nodo = ASTNode("ERROR")
+        nodo.start, nodo.end = start, self.position
+        return nodo
 
     def instruccion_leer(self):
         nodo = ASTNode("LEER")
         self.expect("RESERVADA", "leer")
         self.expect("SIMBOLO", "(")
-        id_token = self.match("ID_ENTERO") or self.match("ID_REAL") or self.match("ID_CADENA") or self.match("ID_LOGICO")
-        if id_token:
-            nodo.children.append(ASTNode("ID", id_token.value))
+        id_value = self.accept(ID_KINDS)
+        if id_value:
+            nodo.children.append(ASTNode("ID", id_value))
         self.expect("SIMBOLO", ")")
         self.expect("SIMBOLO", ";")
         return nodo
@@ -138,9 +169,9 @@ class Parser:
 
     def asignacion(self):
         nodo = ASTNode("ASIGNACION")
-        id_token = self.match("ID_ENTERO") or self.match("ID_REAL") or self.match("ID_CADENA") or self.match("ID_LOGICO")
-        if id_token:
-            nodo.children.append(ASTNode("ID", id_token.value))
+        id_value = self.accept(ID_KINDS)
+        if id_value:
+            nodo.children.append(ASTNode("ID", id_value))
         self.expect("OPERADOR", "=")
         expr = self.expresion()
         nodo.children.append(ASTNode("VALOR", None, [expr]))
@@ -157,8 +188,8 @@ class Parser:
         self.expect("RESERVADA", "entonces")
         nodo_si = self.bloque()
         nodo.children.append(ASTNode("BLOQUE_SI", None, [nodo_si]))
-        if self.current_token() and self.current_token().value == "sino":
-            self.match("RESERVADA", "sino")
+        if self.cursor.kind == K.KW_SINO:
+            self.advance()
             nodo_sino = self.bloque()
             nodo.children.append(ASTNode("BLOQUE_SINO", None, [nodo_sino]))
         return nodo
@@ -189,40 +220,54 @@ class Parser:
         return nodo
 
     def expresion(self):
-        nodo = self.expresion_simple()
-        if self.current_token() and self.current_token().value in {">", "<", ">=", "<=", "==", "!="}:
-            op = self.match("OPERADOR")
-            if op:
-                derecho = self.expresion_simple()
-                nodo = ASTNode("COMPARACION", op.value, [nodo, derecho])
-        return nodo
+        # expresion      -> expresion_simple [comparación expresion_simple]
+        # expresion_simple -> termino {(+ | - | ||) termino}
+        # termino        -> factor {(* | / | &&) factor}
+        # factor         -> literal | "(" expresion ")"
+        # Se evalúa con una pila explícita de marcos (uno por paréntesis abierto) en
+        # lugar de recursión, así la profundidad solo está limitada por la memoria.
+        cursor = self.cursor
+        frames = []
+        cmp_op = cmp_left = add_op = add_left = mul_op = mul_left = None
 
-    def expresion_simple(self):
-        nodo = self.termino()
-        while self.current_token() and self.current_token().value in {"+", "-", "||"}:
-            op = self.match("OPERADOR")
-            if op:
-                derecho = self.termino()
-                nodo = ASTNode("OPERACION", op.value, [nodo, derecho])
-        return nodo
+        while True:
+            value = self.accept(FACTOR_KINDS)
+            if value:
+                nodo = ASTNode("LITERAL", value)
+            elif cursor.kind == K.SYM_PARENTESIS_ABRE:
+                self.advance()
+                frames.append((cmp_op, cmp_left, add_op, add_left, mul_op, mul_left))
+                cmp_op = cmp_left = add_op = add_left = mul_op = mul_left = None
+                continue
+            else:
+                self.error("Factor inválido")
+                nodo = ASTNode("ERROR")
 
-    def termino(self):
-        nodo = self.factor()
-        while self.current_token() and self.current_token().value in {"*", "/", "&&"}:
-            op = self.match("OPERADOR")
-            if op:
-                derecho = self.factor()
-                nodo = ASTNode("OPERACION", op.value, [nodo, derecho])
-        return nodo
+            # Con un factor completo se cierran término, expresión simple y expresión
+            # mientras no siga un operador; cerrar un paréntesis produce un factor.
+            while True:
+                if mul_left is not None:
+                    nodo = ASTNode("OPERACION", mul_op, [mul_left, nodo])
+                if cursor.kind in MULTIPLICATIVE_KINDS:
+                    mul_left, mul_op = nodo, self.accept(MULTIPLICATIVE_KINDS)
+                    break
+                mul_left = None
 
-    def factor(self):
-        token = self.match("ID_ENTERO") or self.match("ID_REAL") or self.match("ID_CADENA") or self.match("ID_LOGICO") or self.match("ENTERO") or self.match("REAL") or self.match("CADENA") or self.match("BOOLEANO")
-        if token:
-            return ASTNode("LITERAL", token.value)
-        elif self.match("SIMBOLO", "("):
-            expr = self.expresion()
-            self.expect("SIMBOLO", ")")
-            return expr
-        else:
-            self.errors.append(SyntaxError("Factor inválido", self.current_token().value, self.current_token().line, self.current_token().column))
-            return ASTNode("ERROR")
+                if add_left is not None:
+                    nodo = ASTNode("OPERACION", add_op, [add_left, nodo])
+                if cursor.kind in ADDITIVE_KINDS:
+                    add_left, add_op = nodo, self.accept(ADDITIVE_KINDS)
+                    break
+                add_left = None
+
+                if cmp_left is not None:
+                    nodo = ASTNode("COMPARACION", cmp_op, [cmp_left, nodo])
+                    cmp_left = None
+                elif cursor.kind in COMPARISON_KINDS:
+                    cmp_left, cmp_op = nodo, self.accept(COMPARISON_KINDS)
+                    break
+
+                if not frames:
+                    return nodo
+                self.expect("SIMBOLO", ")")
+                cmp_op, cmp_left, add_op, add_left, mul_op, mul_left = frames.pop()
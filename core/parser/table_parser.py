@@ -0,0 +1,320 @@
+from core.lexer.token_kinds import TokenKind as K, KIND_TYPE, KIND_LEXEME
+from core.parser.parser import (
+    Parser, ID_KINDS, TYPE_KINDS, FACTOR_KINDS,
+    COMPARISON_KINDS, ADDITIVE_KINDS, MULTIPLICATIVE_KINDS,
+)
+from models.ast_node import ASTNode
+
+
+# Acciones semánticas: se ejecutan al sacarlas de la pila y construyen el AST sobre
+# la pila de valores del parser, igual que lo hacen los métodos del Parser recursivo.
+class Action:
+    __slots__ = ("run", "name")
+
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __repr__(self):
+        return f"@{self.name}"
+
+
+def _shift(p):
+    p.values.append(p.cursor.value())
+    p.advance()
+
+
+
+def _push_none(p):
+    p.values.append(None)
+
+
+def _missing_program_id(p):
+    p.error("Se esperaba tipo ID_METODO ")
+    p.values.append(None)
+
+
+def _programa(p):
+    bloque = p.values.pop()
+    decls = p.values.pop()
+    id_value = p.values.pop()
+    root = ASTNode("PROGRAMA")
+    root.children.append(ASTNode("ID", id_value) if id_value else ASTNode("ID", "ERROR"))
+    if decls is not None:
+        root.children.append(decls)
+    root.children.append(bloque)
+    p.values.append(root)
+
+
+def _tipo(p):
+    p.values.append(ASTNode("TIPO", p.cursor.value()))
+    p.advance()
+
+
+def _append(p):
+    node = p.values.pop()
+    p.values[-1].children.append(node)
+
+
+def _append_id(p):
+    p.values[-1].children.append(ASTNode("ID", p.cursor.value()))
+    p.advance()
+
+
+def _begin_block(p):
+    p.values.append(ASTNode("BLOQUE", start=p.position))
+
+
+def _end_block(p):
+    p.values[-1].end = p.position
+
+
+def _mark(p):
+    p.starts.append(p.position)
+
+
+def _span(p):
+    node = p.values[-1]
+    node.start, node.end = p.starts.pop(), p.position
+
+
+def _unknown_statement(p):
+    p.error("Instrucción no reconocida")
+    p.advance()
+    p.values.append(ASTNode("ERROR"))
+
+
+def _literal(p):
+    p.values.append(ASTNode("LITERAL", p.cursor.value()))
+    p.advance()
+
+
+def _invalid_factor(p):
+    p.error("Factor inválido")
+    p.values.append(ASTNode("ERROR"))
+
+
+def _new(node_type):
+    return Action(lambda p: p.values.append(ASTNode(node_type)), "new " + node_type)
+
+
+def _wrap(node_type):
+    def run(p):
+        node = p.values.pop()
+        p.values[-1].children.append(ASTNode(node_type, None, [node]))
+    return Action(run, "wrap " + node_type)
+
+
+def _binary(node_type):
+    def run(p):
+        right = p.values.pop()
+        op = p.values.pop()
+        left = p.values.pop()
+        p.values.append(ASTNode(node_type, op, [left, right]))
+    return Action(run, "binary " + node_type)
+
+
+def _error(message):
+    return Action(lambda p: p.error(message), "error")
+
+
+SHIFT = Action(_shift, "shift")
+PUSH_NONE = Action(_push_none, "none")
+APPEND = Action(_append, "append")
+APPEND_ID = Action(_append_id, "append id")
+MARK = Action(_mark, "mark")
+SPAN = Action(_span, "span")
+
+# Alternativa que se elige con cualquier otro token (recuperación de errores)
+OTHERWISE = None
+
+# Gramática LL(1): no terminal -> alternativas. Cada alternativa es una lista de
+# terminales (TokenKind), no terminales (str) y acciones. Las alternativas cuyo
+# primer token lo consume una acción se escriben (conjunto de tipos, símbolos);
+# (OTHERWISE, símbolos) es la alternativa de error del no terminal.
+GRAMMAR = {
+    "PROGRAMA": [[K.KW_PROGRAMA, "PROG_ID", K.SYM_PUNTO_COMA, "DECL_OPT", "BLOQUE", Action(_programa, "programa")]],
+    "PROG_ID": [({K.ID_METODO}, [SHIFT]), (OTHERWISE, [Action(_missing_program_id, "missing id")])],
+    "DECL_OPT": [[K.KW_VARIABLES, _new("DECLARACIONES"), "DECL_LIST"], [PUSH_NONE]],
+    "DECL_LIST": [(TYPE_KINDS, [Action(_tipo, "tipo"), "LISTA_ID", K.SYM_PUNTO_COMA, APPEND, "DECL_LIST"]), []],
+    "LISTA_ID": [(ID_KINDS, [APPEND_ID, "LISTA_MAS"]), (OTHERWISE, [_error("Se esperaba un identificador válido")])],
+    "LISTA_MAS": [[K.SYM_COMA, "LISTA_SIG", "LISTA_MAS"], []],
+    "LISTA_SIG": [(ID_KINDS, [APPEND_ID]), (OTHERWISE, [_error("Se esperaba otro identificador")])],
+    "BLOQUE": [[Action(_begin_block, "bloque"), K.KW_INICIO, "INSTRS", K.KW_FIN, Action(_end_block, "fin bloque")]],
+    "INSTRS": [["INSTR", APPEND, "INSTRS"], []],
+    "INSTR": [
+        [MARK, "LEER", SPAN],
+        [MARK, "ESCRIBIR", SPAN],
+        [MARK, "SI", SPAN],
+        [MARK, "MIENTRAS", SPAN],
+        [MARK, "REPETIR", SPAN],
+        [MARK, "ASIGNACION", SPAN],
+        (OTHERWISE, [MARK, Action(_unknown_statement, "instrucción no reconocida"), SPAN]),
+    ],
+    "LEER": [[_new("LEER"), K.KW_LEER, K.SYM_PARENTESIS_ABRE, "OPT_ID", K.SYM_PARENTESIS_CIERRA, K.SYM_PUNTO_COMA]],
+    "ESCRIBIR": [[_new("ESCRIBIR"), K.KW_ESCRIBIR, K.SYM_PARENTESIS_ABRE, "EXPR", _wrap("EXPR"),
+                  K.SYM_PARENTESIS_CIERRA, K.SYM_PUNTO_COMA]],
+    "ASIGNACION": [(ID_KINDS, [_new("ASIGNACION"), APPEND_ID, K.OP_ASIGNACION, "EXPR", _wrap("VALOR"), K.SYM_PUNTO_COMA])],
+    "OPT_ID": [(ID_KINDS, [APPEND_ID]), []],
+    "SI": [[_new("SI"), K.KW_SI, K.SYM_PARENTESIS_ABRE, "EXPR", _wrap("CONDICION"), K.SYM_PARENTESIS_CIERRA,
+            K.KW_ENTONCES, "BLOQUE", _wrap("BLOQUE_SI"), "SINO_OPT"]],
+    "SINO_OPT": [[K.KW_SINO, "BLOQUE", _wrap("BLOQUE_SINO")], []],
+    "MIENTRAS": [[_new("MIENTRAS"), K.KW_MIENTRAS, K.SYM_PARENTESIS_ABRE, "EXPR", _wrap("CONDICION"),
+                  K.SYM_PARENTESIS_CIERRA, K.KW_HACER, "BLOQUE", _wrap("CUERPO")]],
+    "REPETIR": [[_new("REPETIR"), K.KW_REPETIR, "BLOQUE", _wrap("CUERPO"), K.KW_HASTA, K.SYM_PARENTESIS_ABRE,
+                 "EXPR", _wrap("CONDICION"), K.SYM_PARENTESIS_CIERRA, K.SYM_PUNTO_COMA]],
+    "EXPR": [["SIMPLE", "CMP_OPT"]],
+    "CMP_OPT": [(COMPARISON_KINDS, [SHIFT, "SIMPLE", _binary("COMPARACION")]), []],
+    "SIMPLE": [["TERM", "SIMPLE_MAS"]],
+    "SIMPLE_MAS": [(ADDITIVE_KINDS, [SHIFT, "TERM", _binary("OPERACION"), "SIMPLE_MAS"]), []],
+    "TERM": [["FACTOR", "TERM_MAS"]],
+    "TERM_MAS": [(MULTIPLICATIVE_KINDS, [SHIFT, "FACTOR", _binary("OPERACION"), "TERM_MAS"]), []],
+    "FACTOR": [
+        (FACTOR_KINDS, [Action(_literal, "literal")]),
+        [K.SYM_PARENTESIS_ABRE, "EXPR", K.SYM_PARENTESIS_CIERRA],
+        (OTHERWISE, [Action(_invalid_factor, "factor inválido")]),
+    ],
+}
+
+START = "PROGRAMA"
+
+
+def _alternatives(nonterminal):
+    # (conjunto que la inicia, OTHERWISE o "first" si se calcula, símbolos)
+    for alternative in GRAMMAR[nonterminal]:
+        if isinstance(alternative, tuple):
+            lead, symbols = alternative
+            yield (OTHERWISE if lead is OTHERWISE else frozenset(int(k) for k in lead)), symbols
+        else:
+            yield "first", alternative
+
+
+def _first_of(symbols, first, nullable):
+    # FIRST de una secuencia y si la secuencia puede no consumir tokens
+    result = set()
+    for symbol in symbols:
+        if isinstance(symbol, Action):
+            continue
+        if isinstance(symbol, str):
+            result |= first[symbol]
+            if symbol not in nullable:
+                return result, False
+        else:
+            result.add(int(symbol))
+            return result, False
+    return result, True
+
+
+def _alternative_first(lead, symbols, first, nullable):
+    if lead == "first":
+        return _first_of(symbols, first, nullable)
+    return set(lead or ()), False
+
+
+def compute_first_follow():
+    first = {nt: set() for nt in GRAMMAR}
+    nullable = set()
+    changed = True
+    while changed:
+        changed = False
+        for nt in GRAMMAR:
+            for lead, symbols in _alternatives(nt):
+                symbols_first, is_nullable = _alternative_first(lead, symbols, first, nullable)
+                if not symbols_first <= first[nt]:
+                    first[nt] |= symbols_first
+                    changed = True
+                if is_nullable and nt not in nullable:
+                    nullable.add(nt)
+                    changed = True
+
+    follow = {nt: set() for nt in GRAMMAR}
+    follow[START].add(int(K.EOF))
+    changed = True
+    while changed:
+        changed = False
+        for nt in GRAMMAR:
+            for lead, symbols in _alternatives(nt):
+                for index, symbol in enumerate(symbols):
+                    if not isinstance(symbol, str):
+                        continue
+                    rest_first, rest_nullable = _first_of(symbols[index + 1:], first, nullable)
+                    new = rest_first | (follow[nt] if rest_nullable else set())
+                    if not new <= follow[symbol]:
+                        follow[symbol] |= new
+                        changed = True
+    return first, follow, nullable
+
+
+def build_table():
+    # Tabla de predicción: no terminal -> (dict tipo -> símbolos invertidos, alternativa
+    # por defecto invertida). La alternativa por defecto es la que no consume tokens,
+    # la de error o la única; se usa con cualquier tipo que no esté en la tabla, como
+    # hace el Parser recursivo cuando no reconoce el token actual.
+    first, follow, nullable = compute_first_follow()
+    table = {}
+    for nt in GRAMMAR:
+        entries = {}
+        defaults = []
+        alternatives = list(_alternatives(nt))
+        for lead, symbols in alternatives:
+            symbols_first, is_nullable = _alternative_first(lead, symbols, first, nullable)
+            if is_nullable or lead is OTHERWISE or len(alternatives) == 1:
+                defaults.append(symbols)
+                if is_nullable and symbols_first & follow[nt]:
+                    raise ValueError(f"Conflicto FIRST/FOLLOW en {nt}")
+            if len(alternatives) == 1:
+                continue
+            for kind in symbols_first:
+                if kind in entries:
+                    raise ValueError(f"Conflicto FIRST/FIRST en {nt} con {K(kind).name}")
+                entries[kind] = _compile(symbols)
+        if len(defaults) > 1:
+            raise ValueError(f"Más de una alternativa por defecto en {nt}")
+        if nt in nullable:
+            for kind in follow[nt] & set(entries):
+                raise ValueError(f"Conflicto FIRST/FOLLOW en {nt} con {K(kind).name}")
+        table[nt] = (entries, _compile(defaults[0] if defaults else []))
+    return table
+
+
+def _compile(symbols):
+    # Símbolos en orden inverso, listos para apilar; terminales como int simples
+    return [int(s) if isinstance(s, K) else s for s in reversed(symbols)]
+
+
+TABLE = build_table()
+
+
+# Parser LL(1) dirigido por tabla: una pila explícita de símbolos y una consulta a
+# la tabla de predicción por decisión. Produce los mismos ASTNode y errores que el
+# Parser recursivo.
+class TableParser(Parser):
+    def __init__(self, tokens):
+        super().__init__(tokens)
+        self.values = []
+        self.starts = []
+
+    def parse(self):
+        return self.parse_from(START)
+
+    def parse_from(self, nonterminal):
+        table = TABLE
+        cursor = self.cursor
+        stack = [nonterminal]
+        pop = stack.pop
+        extend = stack.extend
+
+        while stack:
+            symbol = pop()
+            symbol_type = type(symbol)
+            if symbol_type is int:
+                if cursor.kind == symbol:
+                    self.advance()
+                else:
+                    self.error(f"Se esperaba tipo {KIND_TYPE[symbol]} valor {KIND_LEXEME[symbol]}")
+            elif symbol_type is str:
+                entries, default = table[symbol]
+                extend(entries.get(cursor.kind, default))
+            else:
+                symbol.run(self)
+        return self.values.pop()
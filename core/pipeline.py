@@ -0,0 +1,162 @@
+import os
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from core.lexer.lexer import Lexer
+from core.lexer.token_stream import TokenStream
+from core.parser.parser import Parser
+from core.parser.table_parser import TableParser
+from core.semantic.semantic_analyzer import SemanticAnalyzer
+from core.codegen.vci_generator import VCIGenerator
+from core.codegen.vci_executor import VCIExecutor
+from core.codegen.vci_linker import link
+from core.codegen.vci_vm import VCIMachine
+from core.codegen.vci_compiler import CompiledExecutor
+from core.codegen.vci_optimizer import PassManager
+from core.codegen import vci_liveness
+from models.ast_node import ASTNode
+from models.ast_arena import ASTArena
+
+# Cambiar al modificar cualquier fase: invalida las entradas de CompileCache
+COMPILER_VERSION = "3"
+
+
+# Resultado de compilar un programa en memoria. Cada fase se conserva para poder
+# exportarla después; analyzer y generator quedan en None si una fase anterior falló.
+@dataclass
+class CompilationResult:
+    lexer: Lexer
+    parser: Parser
+    ast: Union[ASTNode, ASTArena]
+    analyzer: Optional[SemanticAnalyzer] = None
+    generator: Optional[VCIGenerator] = None
+    optimizer: Optional[PassManager] = None
+    allocation: Optional[vci_liveness.TempAllocation] = None
+
+    @property
+    def tokens(self):
+        return self.lexer.tokens
+
+    @property
+    def lexical_errors(self):
+        return self.lexer.errors
+
+    @property
+    def syntax_errors(self):
+        return self.parser.errors
+
+    @property
+    def symbol_table(self):
+        return self.analyzer.symbol_table if self.analyzer else []
+
+    @property
+    def semantic_errors(self):
+        return self.analyzer.errors if self.analyzer else []
+
+    @property
+    def instructions(self):
+        return self.generator.instructions if self.generator else []
+
+    @property
+    def succeeded(self):
+        return self.generator is not None
+
+    def link(self):
+        return link(self.instructions)
+
+    def execute(self, trace=None, engine="executor", reader=None, writer=None, controller=None):
+        # `trace` solo lo registra VCIExecutor; los demás motores ejecutan sin traza.
+        # `controller` (ExecutionController) lo admiten VCIExecutor y VCIMachine
+        if engine == "executor":
+            executor = VCIExecutor(self.link(), trace, reader=reader, writer=writer, controller=controller)
+        elif trace is not None:
+            raise ValueError(f"El motor {engine} no registra traza")
+        elif controller is not None and engine == "compiled":
+            raise ValueError(f"El motor {engine} no admite control de ejecución")
+        elif controller is not None:
+            executor = ENGINES[engine](self.link(), reader=reader, writer=writer, controller=controller)
+        else:
+            executor = ENGINES[engine](self.link(), reader=reader, writer=writer)
+        executor.execute()
+        return executor
+
+    def resume(self, checkpoint, engine="executor", reader=None, writer=None, controller=None):
+        # Continúa una ejecución desde un punto de control de core/codegen/vci_checkpoint.py
+        if engine == "compiled":
+            raise ValueError(f"El motor {engine} no continúa desde un punto de control")
+        executor = ENGINES[engine](self.link(), reader=reader, writer=writer, controller=controller)
+        executor.resume(checkpoint)
+        return executor
+
+    def execute_batch(self, inputs):
+        # Una fila de valores para LEER por ejecución; requiere numpy
+        from core.codegen.vci_batch import BatchExecutor
+        return BatchExecutor(self.link()).run(inputs)
+
+    def export_csv(self, output_dir="output"):
+        # Escribe los mismos CSV que generaba la interfaz en cada compilación
+        self.lexer.export_to_csv(output_dir)
+        if self.analyzer:
+            self.analyzer.export_symbol_table(os.path.join(output_dir, "symbol_table.csv"))
+        if self.generator:
+            self.generator.export_to_csv(os.path.join(output_dir, "vci.csv"))
+            self.generator.export_to_binary(os.path.join(output_dir, "vci.vcib"))
+            self.link().export_to_csv(os.path.join(output_dir, "vci_linked.csv"))
+
+
+# Motores de análisis sintáctico intercambiables; producen el mismo AST
+PARSERS = {
+    "recursive": Parser,
+    "table": TableParser,
+}
+
+
+# Motores de ejecución del VCI enlazado; terminan con las mismas variables y salida
+ENGINES = {
+    "executor": VCIExecutor,
+    "vm": VCIMachine,
+    "compiled": CompiledExecutor,
+}
+
+
+def compile(source, parser="recursive", compact_ast=False, optimize=False, reuse_temps=False):
+    # Con compact_ast el AST se convierte a ASTArena tras el análisis sintáctico y
+    # las fases siguientes lo recorren sin el árbol de ASTNode. `optimize` puede ser
+    # True (todas las pasadas) o una lista de nombres de vci_optimizer.PASSES;
+    # reuse_temps reasigna los temporales a ranuras reutilizables al final.
+    lexer = Lexer()
+    lexer.analyze(source)
+
+    parser = PARSERS[parser](lexer.tokens)
+    ast = parser.parse()
+    result = CompilationResult(lexer, parser, ast)
+    if parser.errors:
+        return result
+    if compact_ast:
+        ast = result.ast = ASTArena.from_node(ast)
+
+    result.analyzer = SemanticAnalyzer()
+    if compact_ast:
+        result.analyzer.analyze_arena(ast)
+    else:
+        result.analyzer.analyze(ast)
+    if result.analyzer.errors:
+        return result
+
+    tokens = result.tokens
+    result.generator = VCIGenerator(tokens.lines if isinstance(tokens, TokenStream) else [t.line for t in tokens])
+    if compact_ast:
+        result.generator.generate_arena(ast)
+    else:
+        result.generator.generate(ast)
+    if optimize:
+        result.optimizer = PassManager(None if optimize is True else optimize)
+        result.generator.instructions = result.optimizer.run(result.generator.instructions)
+    if reuse_temps:
+        result.generator.instructions, result.allocation = vci_liveness.reuse_temps(result.generator.instructions)
+    return result
+
+
+def compile_file(path, parser="recursive", compact_ast=False, optimize=False, reuse_temps=False):
+    with open(path, encoding="utf-8") as f:
+        return compile(f.read(), parser, compact_ast, optimize, reuse_temps)
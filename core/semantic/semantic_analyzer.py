@@ -1,58 +1,94 @@
-from models.symbol import Symbol
+from core.semantic.symbol_table import SymbolTable
 from models.syntax_error import SyntaxError
 from models.ast_node import ASTNode
+from models.ast_arena import ASTArena, NodeKind, DATA_TYPE_CODE
+from core.semantic.type_inference import TypeInference, literal_type, NUMERIC
+
+# Nodos cuyos hijos no se recorren: se analizan completos al visitarlos
+EXPRESSIONS = {"LITERAL", "OPERACION", "COMPARACION"}
+PRUNED = {"DECLARACIONES", "ASIGNACION", "LEER", "ESCRIBIR"} | EXPRESSIONS
+ARENA_EXPRESSIONS = {NodeKind.LITERAL, NodeKind.OPERACION, NodeKind.COMPARACION}
+ARENA_PRUNED = {NodeKind.DECLARACIONES, NodeKind.ASIGNACION, NodeKind.LEER, NodeKind.ESCRIBIR} | ARENA_EXPRESSIONS
 
 class SemanticAnalyzer:
     def __init__(self):
-        self.symbol_table = []
+        self.symbol_table = SymbolTable()
         self.errors = []
+        self.types = TypeInference(self.symbol_table, self.errors)
+
+    def analyze(self, root: ASTNode, scope="global"):
+        # Recorrido en preorden con pila explícita para soportar árboles muy profundos
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self.visit(node, scope)
+            if node.type not in PRUNED:
+                stack.extend(reversed(node.children))
 
-    def analyze(self, node: ASTNode, scope="global"):
+    def visit(self, node: ASTNode, scope):
         if node.type == "DECLARACIONES":
             for tipo in node.children:
-                var_type = tipo.value
                 for var in tipo.children:
-                    name = var.value
-                    if self.lookup(name, scope):
-                        self.errors.append(SyntaxError("Variable ya declarada", name, -1, -1))
-                    else:
-                        self.symbol_table.append(Symbol(name=name, type=var_type, scope=scope))
+                    self.declare(var.value, tipo.value, scope)
         elif node.type == "ASIGNACION":
-            var_node = node.children[0]
+            symbol = self.check_declared(node.children[0].value, scope)
             value_node = node.children[1].children[0]
-            symbol = self.lookup(var_node.value, scope)
-            if not symbol:
-                self.errors.append(SyntaxError("Variable no declarada", var_node.value, -1, -1))
-            else:
-                # Validación de tipo simple por tipo de valor
-                if value_node.type == "LITERAL":
-                    val = value_node.value
-                    if val.replace(".", "", 1).isdigit():  # numérico
-                        expected = "entero" if "." not in val else "real"
-                    elif val in {"true", "false"}:
-                        expected = "logico"
-                    elif val.startswith('"'):
-                        expected = "cadena"
-                    else:
-                        expected = None  # Puede ser otro ID
-
-                    if expected and symbol.type != expected:
-                        self.errors.append(SyntaxError(f"Asignación incompatible: se esperaba tipo {symbol.type}", val, -1, -1))
+            data_type = self.types.infer(value_node, scope)
+            self.check_assignment(symbol, value_node.type, value_node.value, data_type)
         elif node.type in {"LEER", "ESCRIBIR"}:
             var_node = node.children[0]
             if var_node.type == "ID":
-                symbol = self.lookup(var_node.value, scope)
-                if not symbol:
-                    self.errors.append(SyntaxError("Variable no declarada", var_node.value, -1, -1))
-        elif node.children:
-            for child in node.children:
-                self.analyze(child, scope)
+                symbol = self.check_declared(var_node.value, scope)
+                var_node.data_type = symbol.type if symbol else None
+            else:
+                self.types.infer(var_node, scope)
+        elif node.type in EXPRESSIONS:
+            self.types.infer(node, scope)
+
+    def analyze_arena(self, arena: ASTArena, scope="global"):
+        # Mismo análisis sobre el AST compacto; recorre índices sin crear nodos
+        kinds = arena.kinds
+        for index in arena.walk(prune=ARENA_PRUNED):
+            kind = kinds[index]
+            if kind == NodeKind.DECLARACIONES:
+                for tipo in arena.children(index):
+                    for var in arena.children(tipo):
+                        self.declare(arena.value(var), arena.value(tipo), scope)
+            elif kind == NodeKind.ASIGNACION:
+                var, value = arena.children(index)
+                symbol = self.check_declared(arena.value(var), scope)
+                data_type = self.types.infer_arena(arena, value, scope)
+                self.check_assignment(symbol, NodeKind(kinds[value]).name, arena.value(value), data_type)
+            elif kind in (NodeKind.LEER, NodeKind.ESCRIBIR):
+                var = arena.first_child[index]
+                if kinds[var] == NodeKind.ID:
+                    symbol = self.check_declared(arena.value(var), scope)
+                    arena.data_types[var] = DATA_TYPE_CODE[symbol.type if symbol else None]
+                else:
+                    self.types.infer_arena(arena, var, scope)
+            elif kind in ARENA_EXPRESSIONS:
+                self.types.infer_arena(arena, index, scope)
+
+    def declare(self, name, var_type, scope):
+        if not self.symbol_table.declare(name, var_type, scope):
+            self.errors.append(SyntaxError("Variable ya declarada", name, -1, -1))
+
+    def check_declared(self, name, scope):
+        symbol = self.lookup(name, scope)
+        if not symbol:
+            self.errors.append(SyntaxError("Variable no declarada", name, -1, -1))
+        return symbol
+
+    def check_assignment(self, symbol, value_kind, val, data_type):
+        # Las constantes deben coincidir exactamente con el tipo de la variable; en el
+        # resto de expresiones entero y real son compatibles entre sí
+        if symbol is None or data_type is None or data_type == symbol.type:
+            return
+        if value_kind == "LITERAL" and literal_type(val) or not (data_type in NUMERIC and symbol.type in NUMERIC):
+            self.errors.append(SyntaxError(f"Asignación incompatible: se esperaba tipo {symbol.type}", val, -1, -1))
 
     def lookup(self, name, scope):
-        for s in self.symbol_table:
-            if s.name == name and s.scope == scope:
-                return s
-        return None
+        return self.symbol_table.lookup(name, scope)
 
     def export_symbol_table(self, path="output/symbol_table.csv"):
         import csv
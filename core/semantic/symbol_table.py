@@ -0,0 +1,76 @@
+from models.symbol import Symbol
+
+
+class Scope:
+    __slots__ = ("name", "parent", "symbols")
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.symbols = {}
+
+
+# Tabla de símbolos con un diccionario por ámbito y ámbitos encadenados a su padre
+# (global → funcion → ...). La búsqueda recorre la cadena desde el ámbito pedido;
+# iterar la tabla devuelve los símbolos en orden de declaración para exportarlos.
+class SymbolTable:
+    def __init__(self, scope="global"):
+        self.root = self.current = Scope(scope)
+        self.scopes = {scope: self.root}
+        self.symbols = []
+
+    def enter(self, name):
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = Scope(name, self.current)
+        self.current = scope
+        return scope
+
+    def exit(self):
+        if self.current.parent is None:
+            raise ValueError("No se puede salir del ámbito global")
+        self.current = self.current.parent
+
+    def scope(self, name=None):
+        # Ámbito por nombre; los desconocidos se crean como hijos del global
+        if name is None:
+            return self.current
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = self.scopes[name] = Scope(name, self.root)
+        return scope
+
+    def declare(self, name, var_type, scope=None, value=None):
+        # Devuelve el símbolo nuevo, o None si ya existe en ese mismo ámbito
+        frame = self.scope(scope)
+        if name in frame.symbols:
+            return None
+        symbol = frame.symbols[name] = Symbol(name=name, type=var_type, scope=frame.name, value=value)
+        self.symbols.append(symbol)
+        return symbol
+
+    def lookup(self, name, scope=None):
+        frame = self.scope(scope)
+        while frame is not None:
+            symbol = frame.symbols.get(name)
+            if symbol is not None:
+                return symbol
+            frame = frame.parent
+        return None
+
+    def lookup_local(self, name, scope=None):
+        return self.scope(scope).symbols.get(name)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __iter__(self):
+        return iter(self.symbols)
+
+    def __getitem__(self, index):
+        return self.symbols[index]
+
+    def __eq__(self, other):
+        if isinstance(other, SymbolTable):
+            other = other.symbols
+        return self.symbols == other
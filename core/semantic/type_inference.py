@@ -0,0 +1,103 @@
+from models.ast_node import ASTNode
+from models.ast_arena import ASTArena, NodeKind, DATA_TYPES, DATA_TYPE_CODE
+from models.syntax_error import SyntaxError
+
+ENTERO, REAL, CADENA, LOGICO = "entero", "real", "cadena", "logico"
+NUMERIC = {ENTERO, REAL}
+COMPARISONS = {"<", "<=", ">", ">=", "==", "!="}
+LOGICAL = {"&&", "||"}
+
+
+def literal_type(value):
+    # Tipo de una constante; None si el literal es un identificador
+    if value.isdigit():
+        return ENTERO
+    if value.replace(".", "", 1).isdigit():
+        return REAL
+    if value in ("true", "false"):
+        return LOGICO
+    if value.startswith('"'):
+        return CADENA
+    return None
+
+
+def binary_type(op, left, right):
+    # Tipo del resultado de `left op right`; None si la operación no es válida
+    if op in COMPARISONS:
+        return LOGICO if left == right or left in NUMERIC and right in NUMERIC else None
+    if op in LOGICAL:
+        return LOGICO if left == right == LOGICO else None
+    if left in NUMERIC and right in NUMERIC:
+        return REAL if op == "/" or REAL in (left, right) else ENTERO
+    if op == "+" and left == right == CADENA:
+        return CADENA
+    return None
+
+
+# Inferencia de tipos de expresiones: anota cada nodo LITERAL, OPERACION y
+# COMPARACION con su tipo (node.data_type o la columna data_types del ASTArena) en
+# un solo recorrido en postorden. Los nodos ya anotados no se vuelven a visitar.
+class TypeInference:
+    def __init__(self, symbol_table, errors=None):
+        self.symbol_table = symbol_table
+        self.errors = [] if errors is None else errors
+
+    def identifier_type(self, name, scope):
+        symbol = self.symbol_table.lookup(name, scope)
+        if symbol is None:
+            self.errors.append(SyntaxError("Variable no declarada", name, -1, -1))
+            return None
+        return symbol.type
+
+    def combine(self, op, left, right):
+        if left is None or right is None:
+            return None
+        result = binary_type(op, left, right)
+        if result is None:
+            self.errors.append(SyntaxError(f"Operación incompatible: {left} {op} {right}", op, -1, -1))
+        return result
+
+    def infer(self, node: ASTNode, scope="global"):
+        stack = [(node, False)]
+        while stack:
+            current, visited = stack.pop()
+            if current.data_type is not None:
+                continue
+            if current.type == "LITERAL":
+                current.data_type = literal_type(current.value) or self.identifier_type(current.value, scope)
+            elif current.type in {"OPERACION", "COMPARACION"}:
+                if visited:
+                    left, right = current.children
+                    current.data_type = self.combine(current.value, left.data_type, right.data_type)
+                else:
+                    stack.append((current, True))
+                    stack.append((current.children[1], False))
+                    stack.append((current.children[0], False))
+            elif current.type in {"VALOR", "EXPR", "CONDICION"}:
+                stack.append((current.children[0], False))
+        return node.data_type
+
+    def infer_arena(self, arena: ASTArena, index, scope="global"):
+        kinds = arena.kinds
+        data_types = arena.data_types
+        first_child = arena.first_child
+        stack = [index]
+        while stack:
+            current = stack.pop()
+            if current < 0:
+                current = ~current
+                left = first_child[current]
+                right = arena.next_sibling[left]
+                result = self.combine(arena.value(current), DATA_TYPES[data_types[left]], DATA_TYPES[data_types[right]])
+                data_types[current] = DATA_TYPE_CODE[result]
+            elif data_types[current]:
+                continue
+            elif kinds[current] == NodeKind.LITERAL:
+                value = arena.value(current)
+                data_types[current] = DATA_TYPE_CODE[literal_type(value) or self.identifier_type(value, scope)]
+            elif kinds[current] in (NodeKind.OPERACION, NodeKind.COMPARACION):
+                left = first_child[current]
+                stack.append(~current)
+                stack.append(arena.next_sibling[left])
+                stack.append(left)
+        return DATA_TYPES[data_types[index]]
@@ -0,0 +1,163 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from core.lexer.lexer import Lexer
+from core.lexer.scanner import LINE_BREAKS, count_lines
+from core.lexer.parallel_lexer import SPAN_RE
+from core.parser.parser import Parser
+from models.ast_node import ASTNode
+
+# Nodos que envuelven un solo BLOQUE
+WRAPPERS = {"BLOQUE_SI", "BLOQUE_SINO", "CUERPO"}
+
+
+@dataclass
+class EditResult:
+    changed_nodes: List[ASTNode] = field(default_factory=list)   # subárboles nuevos
+    replaced_nodes: List[ASTNode] = field(default_factory=list)  # subárboles que reemplazan
+    relexed_tokens: int = 0
+    full_relex: bool = False
+    full_reparse: bool = False
+
+
+# Sesión de compilación incremental: conserva líneas, tokens y AST de un programa y,
+# ante una edición de líneas, vuelve a analizar solo las líneas y la instrucción o
+# bloque afectados.
+class CompilationSession:
+    def __init__(self, source=""):
+        self.lexer = Lexer()
+        self.load(source)
+
+    @property
+    def text(self):
+        return "".join(self.lines)
+
+    def load(self, source):
+        self.lines = source.splitlines(keepends=True)
+        self.lexical_errors = []
+        self.tokens = list(self.lexer.scanner.scan(source, self.lexical_errors))
+        self.comment_open = self._comment_lines(source)
+        self._parse()
+
+    def _parse(self):
+        parser = Parser(self.tokens)
+        self.ast = parser.parse()
+        self.syntax_errors = parser.errors
+
+    def _comment_lines(self, source):
+        # comment_open[i] indica si la línea i + 1 comienza dentro de un comentario /* */
+        comment_open = [False] * len(self.lines)
+        line = 1
+        position = 0
+        for m in SPAN_RE.finditer(source):
+            if not m.group().startswith("/*"):
+                continue
+            line += count_lines(source, position, m.start())
+            end_line = line + count_lines(source, m.start(), m.end())
+            for index in range(line, min(end_line, len(comment_open))):
+                comment_open[index] = True
+            line, position = end_line, m.end()
+        return comment_open
+
+    def apply_edit(self, start_line, end_line, text):
+        # Reemplaza las líneas start_line..end_line (desde 1, inclusivas) por `text`;
+        # con end_line = start_line - 1 el texto se inserta antes de start_line.
+        if not (1 <= start_line <= len(self.lines) + 1 and start_line - 1 <= end_line <= len(self.lines)):
+            raise ValueError("Rango de líneas inválido")
+
+        new_lines = text.splitlines(keepends=True)
+        if new_lines and end_line < len(self.lines) and not new_lines[-1].endswith(tuple(LINE_BREAKS)):
+            new_lines[-1] += "\n"
+        old_text = "".join(self.lines[start_line - 1:end_line])
+        new_text = "".join(new_lines)
+
+        # Los delimitadores /* */ cambian el estado de las líneas siguientes
+        if (start_line <= len(self.lines) and self.comment_open[start_line - 1]
+                or any(d in old_text or d in new_text for d in ("/*", "*/"))
+                or start_line > len(self.lines) and self.lines and not self.lines[-1].endswith(tuple(LINE_BREAKS))):
+            lines = self.lines[:start_line - 1] + new_lines + self.lines[end_line:]
+            self.load("".join(lines))
+            return EditResult([self.ast], [], len(self.tokens), True, True)
+
+        delta_lines = len(new_lines) - (end_line - start_line + 1)
+        errors = []
+        new_tokens = list(self.lexer.scanner.scan(new_text, errors, start_line))
+
+        i0 = _first_after(self.tokens, start_line - 1)
+        i1 = _first_after(self.tokens, end_line)
+        e0 = _first_after(self.lexical_errors, start_line - 1)
+        e1 = _first_after(self.lexical_errors, end_line)
+        if delta_lines:
+            for token in self.tokens[i1:]:
+                token.line += delta_lines
+            for error in self.lexical_errors[e1:]:
+                error.line += delta_lines
+        self.tokens[i0:i1] = new_tokens
+        self.lexical_errors[e0:e1] = errors
+        self.lines[start_line - 1:end_line] = new_lines
+        self.comment_open[start_line - 1:end_line] = [False] * len(new_lines)
+
+        result = self._reparse(i0, i1, len(new_tokens) - (i1 - i0))
+        result.relexed_tokens = len(new_tokens)
+        return result
+
+    def _reparse(self, i0, i1, delta):
+        # Vuelve a analizar la instrucción o bloque más interno que contiene los tokens
+        # [i0, i1) reemplazados; si el resultado no encaja, sube al nodo contenedor.
+        if not self.syntax_errors:
+            for node, parent, index in reversed(self._enclosing(i0, i1)):
+                parser = Parser(map(self.tokens.__getitem__, range(node.start, len(self.tokens))))
+                parser.position = node.start
+                new = parser.bloque() if node.type == "BLOQUE" else parser.instruccion()
+                if parser.errors or parser.position != node.end + delta:
+                    continue
+                parent.children[index] = new
+                self._shift_spans(node, new, delta)
+                return EditResult([new], [node])
+
+        self._parse()
+        return EditResult([self.ast], [], full_reparse=True)
+
+    def _enclosing(self, i0, i1):
+        # Camino (nodo, padre, índice) desde la raíz hasta el nodo con span más interno
+        path = []
+        node = self.ast
+        while True:
+            for index, child in enumerate(node.children):
+                parent = node
+                if child.type in WRAPPERS:
+                    parent, index, child = child, 0, child.children[0]
+                if child.start != -1 and child.start <= i0 and i1 <= child.end:
+                    path.append((child, parent, index))
+                    node = child
+                    break
+            else:
+                return path
+
+    def _shift_spans(self, old, new, delta):
+        if not delta:
+            return
+        stack = [self.ast]
+        while stack:
+            node = stack.pop()
+            if node is new:
+                continue
+            if node.start != -1:
+                if node.start >= old.end:
+                    node.start += delta
+                    node.end += delta
+                elif node.end >= old.end:
+                    node.end += delta
+            stack.extend(node.children)
+
+
+def _first_after(items, line):
+    # Índice del primer elemento (token o error) cuya línea es mayor que `line`
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        if items[middle].line <= line:
+            low = middle + 1
+        else:
+            high = middle
+    return low
@@ -0,0 +1,154 @@
+from array import array
+from enum import IntEnum
+from models.ast_node import ASTNode
+
+NodeKind = IntEnum("NodeKind", [
+    "PROGRAMA", "ID", "DECLARACIONES", "TIPO", "BLOQUE",
+    "LEER", "ESCRIBIR", "ASIGNACION", "SI", "MIENTRAS", "REPETIR",
+    "LITERAL", "OPERACION", "COMPARACION", "ERROR", "INSTRUCCIONES", "LISTA_ID",
+], start=0)
+
+# Nodos de un solo hijo que el arena no guarda; su hijo se enlaza directamente
+WRAPPERS = {"EXPR", "VALOR", "CONDICION", "CUERPO", "BLOQUE_SI", "BLOQUE_SINO"}
+
+# Envoltorio que corresponde a cada hijo al reconstruir un ASTNode (índice desde el
+# final en ASIGNACION porque su ID puede faltar)
+REWRAP = {
+    NodeKind.ESCRIBIR: {0: "EXPR"},
+    NodeKind.ASIGNACION: {-1: "VALOR"},
+    NodeKind.SI: {0: "CONDICION", 1: "BLOQUE_SI", 2: "BLOQUE_SINO"},
+    NodeKind.MIENTRAS: {0: "CONDICION", 1: "CUERPO"},
+    NodeKind.REPETIR: {0: "CUERPO", 1: "CONDICION"},
+}
+
+NONE = -1
+
+# Códigos de la columna data_types (0: sin tipo inferido)
+DATA_TYPES = (None, "entero", "real", "cadena", "logico")
+DATA_TYPE_CODE = {data_type: code for code, data_type in enumerate(DATA_TYPES)}
+
+
+# AST compacto: columnas paralelas (tipo, índice del valor, primer hijo, siguiente
+# hermano, intervalo de tokens y tipo de dato inferido) indexadas por número de nodo. Los valores se guardan
+# una sola vez en `strings`.
+class ASTArena:
+    def __init__(self):
+        self.kinds = array("B")
+        self.values = array("i")
+        self.first_child = array("i")
+        self.next_sibling = array("i")
+        self.starts = array("i")
+        self.ends = array("i")
+        self.data_types = array("B")
+        self.strings = []
+        self._string_index = {}
+        self.root = NONE
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def add(self, kind, value=None, start=-1, end=-1, data_type=None):
+        if value is None:
+            value_index = NONE
+        else:
+            value_index = self._string_index.get(value)
+            if value_index is None:
+                value_index = self._string_index[value] = len(self.strings)
+                self.strings.append(value)
+        self.kinds.append(kind)
+        self.values.append(value_index)
+        self.first_child.append(NONE)
+        self.next_sibling.append(NONE)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.data_types.append(DATA_TYPE_CODE[data_type])
+        return len(self.kinds) - 1
+
+    def kind(self, index):
+        return self.kinds[index]
+
+    def value(self, index):
+        value_index = self.values[index]
+        return None if value_index == NONE else self.strings[value_index]
+
+    def data_type(self, index):
+        return DATA_TYPES[self.data_types[index]]
+
+    def children(self, index):
+        child = self.first_child[index]
+        next_sibling = self.next_sibling
+        while child != NONE:
+            yield child
+            child = next_sibling[child]
+
+    def child(self, index, position):
+        # Hijo número `position` (negativo cuenta desde el final)
+        if position < 0:
+            children = list(self.children(index))
+            return children[position]
+        child = self.first_child[index]
+        for _ in range(position):
+            child = self.next_sibling[child]
+        return child
+
+    def walk(self, index=None, prune=()):
+        # Índices en preorden; la pila solo guarda el siguiente hermano pendiente de
+        # cada nivel. Los hijos de los nodos cuyo tipo está en `prune` no se visitan.
+        start = node = self.root if index is None else index
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        kinds = self.kinds
+        stack = []
+        while True:
+            yield node
+            if node != start and next_sibling[node] != NONE:
+                stack.append(next_sibling[node])
+            child = first_child[node]
+            if child != NONE and kinds[node] not in prune:
+                node = child
+            elif stack:
+                node = stack.pop()
+            else:
+                return
+
+    def nbytes(self):
+        # Bytes ocupados por las columnas (sin contar las cadenas compartidas)
+        columns = (self.kinds, self.values, self.first_child, self.next_sibling, self.starts, self.ends, self.data_types)
+        return sum(column.itemsize * len(column) for column in columns)
+
+    @classmethod
+    def from_node(cls, root: ASTNode):
+        arena = cls()
+        last_child = {}
+        stack = [(root, NONE)]
+        while stack:
+            node, parent = stack.pop()
+            while node.type in WRAPPERS:
+                node = node.children[0]
+            index = arena.add(NodeKind[node.type], node.value, node.start, node.end, node.data_type)
+            if parent == NONE:
+                arena.root = index
+            elif parent in last_child:
+                arena.next_sibling[last_child[parent]] = index
+            else:
+                arena.first_child[parent] = index
+            if parent != NONE:
+                last_child[parent] = index
+            stack.extend((child, index) for child in reversed(node.children))
+        return arena
+
+    def to_node(self):
+        # Reconstruye el ASTNode equivalente, con sus nodos envoltorio
+        nodes = {}
+        for index in self.walk():
+            nodes[index] = ASTNode(NodeKind(self.kinds[index]).name, self.value(index),
+                                   start=self.starts[index], end=self.ends[index],
+                                   data_type=self.data_type(index))
+        for index, node in nodes.items():
+            children = [nodes[child] for child in self.children(index)]
+            wrappers = REWRAP.get(self.kinds[index], {})
+            for position, wrapper in wrappers.items():
+                if -len(children) <= position < len(children):
+                    children[position] = ASTNode(wrapper, None, [children[position]])
+            node.children = children
+        return nodes[self.root]
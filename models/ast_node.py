@@ -6,3 +6,6 @@ class ASTNode:
     type: str
     value: Optional[str] = None
     children: List['ASTNode'] = field(default_factory=list)
+    start: int = field(default=-1, compare=False, repr=False)  # índice del primer token
+    end: int = field(default=-1, compare=False, repr=False)    # índice después del último token
+    data_type: Optional[str] = field(default=None, compare=False, repr=False)  # tipo inferido de una expresión
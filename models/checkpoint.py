@@ -0,0 +1,10 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+@dataclass
+class Checkpoint:
+    program_hash: str              # Hash del programa enlazado (vci_compiler.program_hash)
+    ip: int                        # Siguiente instrucción a ejecutar
+    steps: Optional[int]           # Instrucciones ejecutadas; None si no se contaron
+    variables: dict = field(default_factory=dict)
+    stack: list = field(default_factory=list)
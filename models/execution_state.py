@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+@dataclass
+class ExecutionState:
+    ip: int                        # Siguiente instrucción a ejecutar (índice enlazado)
+    steps: Optional[int]           # Instrucciones ejecutadas; None si no se contaron
+    variables: dict = field(default_factory=dict)
+    reason: Optional[str] = None   # Motivo de la detención; None si el programa terminó
+
+    @property
+    def finished(self):
+        return self.reason is None
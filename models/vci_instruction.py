@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class VCIInstruction:
@@ -6,3 +6,5 @@ class VCIInstruction:
     arg1: str = ""
     arg2: str = ""
     result: str = ""
+    data_type: str = field(default="", compare=False)  # tipo inferido del resultado; "" si no se conoce
+    line: int = field(default=-1, compare=False)       # línea de la sentencia en el código fuente; -1 si no se conoce
@@ -0,0 +1,55 @@
+import queue
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+
+# Proveedor de entrada y salida para un ejecutor que corre en otro hilo (VCIRunner).
+# LEER emite `input_requested` y espera la respuesta que la ventana entrega con
+# `answer` (None termina la entrada con EOFError); ESCRIBIR acumula las líneas y las
+# emite en bloques con `lines_written`. Las señales llegan al hilo de la ventana.
+class ThreadIO(QObject):
+    input_requested = pyqtSignal(str)
+    lines_written = pyqtSignal(str)
+
+    def __init__(self, flush_lines=100):
+        super().__init__()
+        self.flush_lines = flush_lines
+        self.answers = queue.Queue()
+        self.pending = []
+
+    def read(self, name):
+        # Lo escrito antes de LEER se muestra antes de pedir el valor
+        self.flush()
+        self.input_requested.emit(name)
+        text = self.answers.get()
+        if text is None:
+            raise EOFError(f"Sin entrada para {name}")
+        return text
+
+    def answer(self, text):
+        self.answers.put(text)
+
+    def write(self, label, value):
+        self.pending.append(f"{label} = {value}")
+        if len(self.pending) >= self.flush_lines:
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.lines_written.emit("\n".join(self.pending))
+            self.pending = []
+
+
+# Ejecuta el VCI fuera del hilo de la ventana; al terminar emite `finished` y deja
+# en `error` la excepción que haya interrumpido la ejecución
+class VCIRunner(QThread):
+    def __init__(self, executor):
+        super().__init__()
+        self.executor = executor
+        self.error = None
+
+    def run(self):
+        try:
+            self.executor.execute()
+        except Exception as e:
+            self.error = e
@@ -1,17 +1,15 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QFileDialog, QTableWidget, QTableWidgetItem,
-    QPushButton, QVBoxLayout, QWidget, QLabel, QHBoxLayout, QMessageBox
+    QPushButton, QVBoxLayout, QWidget, QLabel, QHBoxLayout, QMessageBox, QPlainTextEdit, QInputDialog
 )
-import pandas as pd
-import os
-
-from core.lexer.lexer import Lexer
-from core.parser.parser import Parser
-from core.parser.parser_utils import load_tokens_from_csv
-from core.semantic.semantic_analyzer import SemanticAnalyzer
-from core.codegen.vci_generator import VCIGenerator
+
+from core.compile_cache import CompileCache
 from core.codegen.vci_executor import VCIExecutor
-from models.token import Token
+from core.codegen.vci_trace import StreamTrace
+from core.codegen.vci_control import ExecutionController, CANCELLED
+from core.codegen.vci_io import PROMPT
+from ui.io_providers import ThreadIO, VCIRunner
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -37,16 +35,49 @@ class MainWindow(QMainWindow):
         self.vci_table.setColumnCount(4)
         self.vci_table.setHorizontalHeaderLabels(["Operación", "Arg1", "Arg2", "Resultado"])
 
+        # Lo que imprime ESCRIBIR en la última ejecución
+        self.output_panel = QPlainTextEdit()
+        self.output_panel.setReadOnly(True)
+        self.output_panel.setPlaceholderText("Salida del VCI")
+        self.output_panel.setMaximumHeight(150)
+
         self.load_button = QPushButton("Cargar archivo .txt")
         self.load_button.clicked.connect(self.load_file)
 
         self.run_vci_button = QPushButton("Ejecutar VCI")
         self.run_vci_button.clicked.connect(self.run_vci)
 
+        # Solo activos mientras el VCI corre en su hilo
+        self.pause_button = QPushButton("Pausar")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.pause_button.setEnabled(False)
+
+        self.cancel_button = QPushButton("Cancelar")
+        self.cancel_button.clicked.connect(self.cancel_vci)
+        self.cancel_button.setEnabled(False)
+
+        self.export_button = QPushButton("Exportar CSV")
+        self.export_button.clicked.connect(self.export_csv)
+
+        self.result = None
+        self.executor = None
+        self.runner = None
+        self.controller = None
+        self.io = None
+        # Segundos antes de detener el VCI; None deja que corra hasta terminar o cancelarlo
+        self.run_timeout = None
+        self.cache = CompileCache()
+
         layout = QVBoxLayout()
+        run_layout = QHBoxLayout()
+        run_layout.addWidget(self.run_vci_button)
+        run_layout.addWidget(self.pause_button)
+        run_layout.addWidget(self.cancel_button)
+
         layout.addWidget(self.label)
         layout.addWidget(self.load_button)
-        layout.addWidget(self.run_vci_button)
+        layout.addLayout(run_layout)
+        layout.addWidget(self.export_button)
 
         table_layout = QHBoxLayout()
         table_layout.addWidget(self.token_table)
@@ -55,6 +86,7 @@ class MainWindow(QMainWindow):
         table_layout.addWidget(self.vci_table)
 
         layout.addLayout(table_layout)
+        layout.addWidget(self.output_panel)
 
         container = QWidget()
         container.setLayout(layout)
@@ -67,89 +99,50 @@ class MainWindow(QMainWindow):
 
             with open(file_path, encoding="utf-8") as f:
                 code = f.read()
-                lexer = Lexer()
-                lexer.analyze(code)
-                lexer.export_to_csv()
-
-            self.load_csvs()
-            self.run_parser()
-
-    def load_csvs(self):
-        self.load_csv("output/tokens.csv", self.token_table)
-        self.load_csv("output/lexical_errors.csv", self.error_table)
-
-    def load_csv(self, path, table_widget):
-        if os.path.exists(path):
-            df = pd.read_csv(path)
-            table_widget.setRowCount(len(df))
-            table_widget.setColumnCount(len(df.columns))
-            table_widget.setHorizontalHeaderLabels(list(df.columns))
-            for i, row in df.iterrows():
-                for j, col in enumerate(row):
-                    table_widget.setItem(i, j, QTableWidgetItem(str(col)))
-
-    def load_vci_table(self, path):
-        if not os.path.exists(path): return
-        df = pd.read_csv(path)
-        self.vci_table.setRowCount(len(df))
-        for i, row in df.iterrows():
+
+            self.compile_source(code)
+
+    def fill_table(self, table_widget, rows):
+        rows = list(rows)
+        table_widget.setRowCount(len(rows))
+        for i, row in enumerate(rows):
             for j, col in enumerate(row):
-                self.vci_table.setItem(i, j, QTableWidgetItem(str(col)))
+                table_widget.setItem(i, j, QTableWidgetItem(str(col)))
 
-    def run_parser(self):
+    def compile_source(self, code):
         try:
-            tokens = load_tokens_from_csv("output/tokens.csv")
-            parser = Parser(tokens)
-            ast = parser.parse()
-
-            data = []
-            for err in parser.errors:
-                data.append([err.message, err.value, err.line, err.column])
-
-            self.syntax_error_table.setRowCount(len(data))
-            self.syntax_error_table.setColumnCount(4)
-            self.syntax_error_table.setHorizontalHeaderLabels(["Mensaje", "Valor", "Línea", "Columna"])
-            for i, row in enumerate(data):
-                for j, col in enumerate(row):
-                    self.syntax_error_table.setItem(i, j, QTableWidgetItem(str(col)))
-
-            if parser.errors:
+            self.result = result = self.cache.compile(code)
+            self.discard_executor()
+
+            self.fill_table(self.token_table, result.tokens.rows())
+            self.fill_table(self.error_table, ([err.message, err.value, err.line, err.column] for err in result.lexical_errors))
+            self.fill_table(self.syntax_error_table, ([err.message, err.value, err.line, err.column] for err in result.syntax_errors))
+            self.fill_table(self.vci_table, ([i.operation, i.arg1, i.arg2, i.result] for i in result.instructions))
+
+            if result.syntax_errors:
                 QMessageBox.warning(self, "Errores sintácticos", "Se detectaron errores sintácticos. Revisa la tabla.")
+                return
+
+            QMessageBox.information(
+                self,
+                "Compilación exitosa",
+                "El análisis sintáctico se completó correctamente. ¡El código fue compilado con éxito!"
+            )
 
-            if not parser.errors:
+            if result.semantic_errors:
+                for err in result.semantic_errors:
+                    print(f"Error semántico: {err.message} → {err.value}")
                 QMessageBox.information(
                     self,
-                    "Compilación exitosa",
-                    "El análisis sintáctico se completó correctamente. ¡El código fue compilado con éxito!"
+                    "Error semántico",
+                    "Hubo un error en el análisis semántico."
+                )
+            else:
+                QMessageBox.information(
+                    self,
+                    "Compilación del Sistema Semántico Exitosa",
+                    "El análisis semántico se completó correctamente."
                 )
-
-            if not parser.errors:
-                analyzer = SemanticAnalyzer()
-                analyzer.analyze(ast)
-                analyzer.export_symbol_table()
-
-                if analyzer.errors:
-                    for err in analyzer.errors:
-                        print(f"Error semántico: {err.message} → {err.value}")
-                    QMessageBox.information(
-                        self,
-                        "Error semántico",
-                        "Hubo un error en el análisis semántico."
-                    )
-
-                if not analyzer.errors:
-                    QMessageBox.information(
-                        self,
-                        "Compilación del Sistema Semántico Exitosa",
-                        "El análisis semántico se completó correctamente."
-                    )
-
-            if not parser.errors and not analyzer.errors:
-                vci = VCIGenerator()
-                vci.generate(ast)
-                vci.print_ast_debug(ast)
-                vci.export_to_csv()
-                self.load_vci_table("output/vci.csv")
 
         except Exception as e:
             QMessageBox.critical(
@@ -159,32 +152,97 @@ class MainWindow(QMainWindow):
             )
 
     def run_vci(self):
-        from models.vci_instruction import VCIInstruction
-        vci_path = "output/vci.csv"
-
-        if not os.path.exists(vci_path):
-            QMessageBox.warning(self, "Error", "No se encontró el archivo VCI. Asegúrate de compilar primero.")
+        if self.result is None or not self.result.succeeded:
+            QMessageBox.warning(self, "Error", "No hay VCI generado. Asegúrate de compilar primero.")
             return
 
+        # El VCI corre en un VCIRunner para que la ventana siga respondiendo: LEER pide
+        # su valor con un diálogo en este hilo y ESCRIBIR llega al panel de salida. La
+        # interfaz exporta la traza completa; se escribe a disco durante la ejecución.
+        self.discard_executor()
+        self.output_panel.clear()
+        self.controller = ExecutionController(timeout=self.run_timeout)
+        self.io = ThreadIO()
+        self.io.input_requested.connect(self.ask_input)
+        self.io.lines_written.connect(self.output_panel.appendPlainText)
         try:
-            import csv
-            instructions = []
-            with open(vci_path, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    instructions.append(VCIInstruction(
-                        operation=row['Operación'],
-                        arg1=row['Arg1'],
-                        arg2=row['Arg2'],
-                        result=row['Resultado']
-                    ))
-
-            executor = VCIExecutor(instructions)
-            executor.execute()
-            executor.export_execution_table("output/vci_execution.csv")
-            executor.export_variables("output/final_vars.csv")
-
-            QMessageBox.information(self, "VCI ejecutado", "La ejecución del VCI fue exitosa.")
+            executor = VCIExecutor(self.result.link(), StreamTrace(), reader=self.io, writer=self.io,
+                                   controller=self.controller)
         except Exception as e:
             QMessageBox.critical(self, "Error en VCI", f"Ocurrió un error al ejecutar el VCI:\n{str(e)}")
+            return
+        self.runner = VCIRunner(executor)
+        self.runner.finished.connect(self.vci_finished)
+        self.set_running(True)
+        self.runner.start()
+
+    def ask_input(self, name):
+        if self.runner is None:
+            return
+        text, ok = QInputDialog.getText(self, "LEER", PROMPT.format(name))
+        # Cancelar el diálogo termina la entrada (EOFError en el hilo del VCI)
+        self.io.answer(text if ok else None)
+
+    def toggle_pause(self):
+        if self.controller.paused:
+            self.controller.resume()
+            self.pause_button.setText("Pausar")
+        else:
+            self.controller.pause()
+            self.pause_button.setText("Continuar")
+
+    def cancel_vci(self):
+        self.controller.cancel()
+        # Por si el VCI espera un valor de LEER
+        self.io.answer(None)
+
+    def set_running(self, running):
+        self.load_button.setEnabled(not running)
+        self.run_vci_button.setEnabled(not running)
+        self.export_button.setEnabled(not running)
+        self.pause_button.setEnabled(running)
+        self.pause_button.setText("Pausar")
+        self.cancel_button.setEnabled(running)
+
+    def vci_finished(self):
+        runner, self.runner = self.runner, None
+        self.executor = runner.executor
+        self.set_running(False)
+        # Al cancelar mientras espera LEER, la ejecución termina con EOFError
+        if runner.error is not None and not self.controller.cancelled:
+            QMessageBox.critical(self, "Error en VCI", f"Ocurrió un error al ejecutar el VCI:\n{str(runner.error)}")
+            return
+        state = self.executor.state()
+        if state.finished and runner.error is None:
+            QMessageBox.information(self, "VCI ejecutado", "La ejecución del VCI fue exitosa.")
+        else:
+            QMessageBox.warning(self, "VCI detenido",
+                                f"La ejecución se detuvo ({state.reason or CANCELLED}) tras {state.steps} instrucciones, "
+                                f"en la instrucción {state.ip}. Las variables exportadas son las parciales.")
+
+    def discard_executor(self):
+        # La traza de la ejecución anterior está en un archivo temporal: se borra
+        if self.executor is not None:
+            self.executor.trace.close()
+            self.executor = None
+
+    def closeEvent(self, event):
+        if self.runner is not None:
+            self.runner.finished.disconnect(self.vci_finished)
+            self.cancel_vci()
+            self.runner.wait()
+            self.executor = self.runner.executor
+            self.runner = None
+        self.discard_executor()
+        super().closeEvent(event)
+
+    def export_csv(self):
+        if self.result is None:
+            QMessageBox.warning(self, "Error", "No hay resultados para exportar. Carga un archivo primero.")
+            return
 
+        self.result.export_csv("output")
+        if self.executor is not None:
+            self.executor.export_execution_table("output/vci_execution.csv")
+            self.executor.export_variables("output/final_vars.csv")
+        QMessageBox.information(self, "Exportación", "Los resultados se exportaron a la carpeta output.")